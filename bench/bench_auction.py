@@ -0,0 +1,313 @@
+# bench/bench_auction.py
+"""
+경매 루프 벤치마크 (디스코드 없이 실행)
+
+    python bench/bench_auction.py                      # 기본 크기 조합
+    python bench/bench_auction.py --teams 4 8 --players 100 500 --seed 7 --out bench_results.json
+
+- 가짜 ctx/라우터가 전송을 기록하고, 시드 고정 난수로 팀장 결정을 흉내 냄
+- 측정: 전체 시간, 턴당 오버헤드, 디스코드 API 호출 수(전송+수정), 최대 메모리
+- run_loop(어댑터 포함), simulate_draft(엔진 단독), export_csv_bytes, !조회 명령, 경매자 1명당 메모리를 크기별로 측정
+- 결과는 JSON 파일로 저장 → 리비전 간 비교용
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import config as CFG  # noqa: E402
+
+# 대기 시간/발신 버킷/저널은 벤치에서 제외 (순수 처리 비용만 측정)
+CFG.PREVIEW_DELAY_SEC = 0
+CFG.STRATEGY_TIME_MINUTES = 0
+CFG.POST_PLAYER_GAP_SEC = 0
+CFG.TURN_BID_TIMEOUT_SEC = 60
+CFG.OUTBOX_RATE_CAPACITY = 10 ** 9
+CFG.OUTBOX_APPEND_WINDOW_SEC = 10 ** 9
+CFG.JOURNAL_ENABLED = False
+
+from services.auction_service import AuctionService  # noqa: E402
+from services.engine import Bid, Pass, simulate_draft  # noqa: E402
+from services.message_router import MessageRouter  # noqa: E402
+from models.entities import Player  # noqa: E402
+from commands.auction import AuctionCog  # noqa: E402
+
+TIERS = ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Emerald", "Diamond", "Master"]
+POSITIONS = ["TOP", "JG", "MID", "ADC", "SUP"]
+CHAMPS = ["Ahri", "Darius", "Ezreal", "Lux", "Garen", "Thresh", "LeeSin", "Jinx", "Zed", "Leona"]
+
+
+# ───────────────────────── 가짜 디스코드 객체 ─────────────────────────
+class CallCounter:
+    def __init__(self):
+        self.sends = 0
+        self.edits = 0
+
+    @property
+    def total(self) -> int:
+        return self.sends + self.edits
+
+
+class FakeMessage:
+    def __init__(self, counter: CallCounter, content=None, view=None):
+        self._counter = counter
+        self.content = content
+        self.view = view
+
+    async def edit(self, content=None, view=None, **kwargs):
+        await asyncio.sleep(0)
+        self._counter.edits += 1
+        if content is not None:
+            self.content = content
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+
+
+class FakeAuthor:
+    def __init__(self, name: str, user_id: int):
+        self.display_name = name
+        self.name = name
+        self.id = user_id
+
+
+class Decider:
+    """시드 고정 팀장 결정 — 가격이 오를수록 입찰 확률이 낮아짐"""
+    def __init__(self, seed: int, bid_prob: float = 0.35):
+        self.rng = random.Random(seed)
+        self.bid_prob = bid_prob
+        self.decisions = 0
+
+    def decide(self, state, c_nick: str):
+        self.decisions += 1
+        next_bid = max(CFG.BASE_BID, state.current_bid + CFG.BID_STEP)
+        budget = state.max_bid(c_nick)
+        if next_bid <= budget and self.rng.random() < self.bid_prob * (1 - next_bid / (budget + 1)):
+            return "bid", next_bid
+        return "pass", None
+
+
+class FakeRouter(MessageRouter):
+    """차례 대기가 등록되면 바로 응답 — 닉네임 대기(텍스트 폴백)는 메시지를 만들어 라우팅, 유저 대기는 버튼 결과로"""
+    def __init__(self, service: AuctionService, decider: Decider, channel: FakeChannel):
+        super().__init__()
+        self.service = service
+        self.decider = decider
+        self.channel = channel
+
+    def expect(self, channel_id, handler, user_id=None, names=()):
+        cancel = super().expect(channel_id, handler, user_id=user_id, names=names)
+        loop = asyncio.get_running_loop()
+        if user_id is None and names:
+            loop.call_soon(self._reply, names[0])
+        elif user_id is not None and self.service.turn is not None:
+            # 버튼 모드: 패널을 여는 대신 결정 결과를 바로 차례의 future 에 넣음
+            loop.call_soon(self._click, self.service.turn)
+        return cancel
+
+    def _click(self, turn):
+        if not turn.future.done():
+            turn.future.set_result(self.decider.decide(self.service.state, turn.captain))
+
+    def _reply(self, c_nick: str):
+        action, amount = self.decider.decide(self.service.state, c_nick)
+        msg = FakeMessage(CallCounter(), f"!입찰 {amount}" if action == "bid" else "!패스")
+        msg.author = FakeAuthor(c_nick, 0)
+        msg.channel = self.channel
+        if not self.dispatch(msg):
+            raise RuntimeError("벤치 입력이 차례 대기에 전달되지 않았습니다.")
+
+
+class FakeCtx:
+    def __init__(self, service: AuctionService, decider: Decider, channel_id: int = 1):
+        self.counter = CallCounter()
+        self.channel = FakeChannel(channel_id)
+        self.guild = None
+        self.author = FakeAuthor("bench", 0)
+        self.service = service
+        service.router = FakeRouter(service, decider, self.channel)
+        self.decider = decider
+        self.outbox = None   # run_loop 이 끝나면 서비스에서 떼어 내므로 전송 중에 잡아 둠
+
+    async def send(self, content=None, view=None, file=None, **kwargs):
+        self.outbox = self.service.outbox or self.outbox
+        await asyncio.sleep(0)
+        self.counter.sends += 1
+        return FakeMessage(self.counter, content, view)
+
+
+# ───────────────────────── 시나리오 ─────────────────────────
+def build_service(teams: int, players: int, seed: int, bind: bool) -> AuctionService:
+    rng = random.Random(seed)
+    svc = AuctionService()
+    for i in range(teams):
+        svc.add_captain(
+            f"{i + 1}팀", f"팀장{i}", f"captain{i}", rng.choice(TIERS),
+            rng.choice(POSITIONS), rng.choice(POSITIONS), rng.choice(CHAMPS),
+        )
+        if bind:
+            svc.bind_captain_user(10_000 + i, f"captain{i}")
+    for i in range(players):
+        svc.add_player(
+            f"선수{i}", f"player{i}#KR{i % 9}", rng.choice(TIERS),
+            rng.choice(POSITIONS), rng.choice(POSITIONS), *rng.sample(CHAMPS, 3),
+        )
+    random.seed(seed)   # start_auction 의 셔플 고정
+    svc.start_auction(1, teams, 1000)
+    return svc
+
+
+def measure(fn):
+    """(결과, 경과 초, 최대 메모리 바이트)"""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def bench_run_loop(teams: int, players: int, seed: int, bind: bool) -> dict:
+    svc = build_service(teams, players, seed, bind)
+    decider = Decider(seed)
+    ctx = FakeCtx(svc, decider)
+    _, elapsed, peak = measure(lambda: asyncio.run(svc.run_loop(ctx)))
+    turns = max(1, decider.decisions)
+    won = sum(1 for p in svc.state.players.values() if p.status == "낙찰")
+    return {
+        "wall_sec": round(elapsed, 4),
+        "turns": decider.decisions,
+        "per_turn_us": round(elapsed / turns * 1e6, 1),
+        "api_calls": ctx.counter.total,
+        "sends": ctx.counter.sends,
+        "edits": ctx.counter.edits,
+        "announcements": ctx.outbox.stats.posted if ctx.outbox else 0,
+        "awarded": won,
+        "peak_mem_kb": peak // 1024,
+    }, svc
+
+
+def bench_engine(teams: int, players: int, seed: int) -> dict:
+    svc = build_service(teams, players, seed, bind=False)
+    decider = Decider(seed)
+
+    def decide(state, lot, c_nick):
+        action, amount = decider.decide(state, c_nick)
+        return Bid(c_nick, amount) if action == "bid" else Pass(c_nick)
+
+    result, elapsed, peak = measure(lambda: simulate_draft(svc.state, decide, rng=random.Random(seed)))
+    return {
+        "wall_sec": round(elapsed, 4),
+        "turns": result.turns,
+        "per_turn_us": round(elapsed / max(1, result.turns) * 1e6, 2),
+        "lots": result.lots,
+        "awarded": result.awarded,
+        "peak_mem_kb": peak // 1024,
+    }
+
+
+def bench_entities(players: int, seed: int) -> dict:
+    """CSV 처럼 행마다 새 문자열로 Player 를 만들었을 때 1명당 상주 메모리 (검색 색인 제외)"""
+    rng = random.Random(seed)
+
+    def fresh(v: str) -> str:
+        return "".join(list(v))   # 리터럴 공유를 피해 파싱 결과처럼 새 객체 생성
+
+    tracemalloc.start()
+    pool = {}
+    for i in range(players):
+        nick = fresh(f"player{i}#KR{i % 9}")
+        pool[nick] = Player(
+            fresh(f"선수{i}"), nick, fresh(rng.choice(TIERS)),
+            fresh(rng.choice(POSITIONS)), fresh(rng.choice(POSITIONS)),
+            *(fresh(c) for c in rng.sample(CHAMPS, 3)),
+        )
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"players": players, "bytes_per_player": round(current / max(1, players), 1)}
+
+
+def bench_queries(svc: AuctionService, seed: int, repeat: int) -> dict:
+    rng = random.Random(seed)
+    cog = AuctionCog(bot=None)
+    ctx = FakeCtx(svc, Decider(seed))
+    nicks = list(svc.state.players.keys())
+    team_names = [c.team_name for c in svc.state.captains.values()]
+    out = {}
+
+    def timed(name, make_coro):
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            asyncio.run(make_coro())
+        out[name] = round((time.perf_counter() - t0) / repeat * 1e6, 1)   # µs/호출
+
+    timed("export_csv_us", lambda: asyncio.sleep(0, svc.export_csv_bytes()))
+    timed("query_order_us", lambda: cog.query_order.callback(cog, ctx))
+    timed("query_failed_us", lambda: cog.query_failed_sub.callback(cog, ctx))
+    timed("query_team_us", lambda: cog.query_team_sub.callback(cog, ctx, team_name=rng.choice(team_names)))
+    timed("query_participant_us", lambda: cog.query_participant_sub.callback(cog, ctx, key=rng.choice(nicks)[:4]))
+    return out
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="경매 루프 벤치마크")
+    ap.add_argument("--teams", type=int, nargs="+", default=[4, 8, 16])
+    ap.add_argument("--players", type=int, nargs="+", default=[50, 200, 1000])
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--mode", choices=["text", "button"], default="button", help="팀장 입력 방식")
+    ap.add_argument("--query-repeat", type=int, default=20)
+    ap.add_argument("--out", default="bench_results.json")
+    args = ap.parse_args(argv)
+
+    results = []
+    for teams in args.teams:
+        for players in args.players:
+            loop_res, svc = bench_run_loop(teams, players, args.seed, bind=args.mode == "button")
+            row = {
+                "teams": teams,
+                "players": players,
+                "run_loop": loop_res,
+                "engine": bench_engine(teams, players, args.seed),
+                "queries": bench_queries(svc, args.seed, args.query_repeat),
+                "entities": bench_entities(players, args.seed),
+            }
+            results.append(row)
+            print(
+                f"[{teams:>3}팀 × {players:>5}명] run_loop {loop_res['wall_sec']:.3f}s "
+                f"({loop_res['per_turn_us']}µs/턴, API {loop_res['api_calls']}회, 메모리 {loop_res['peak_mem_kb']}KB) / "
+                f"engine {row['engine']['wall_sec']:.3f}s / 경매자 1명당 {row['entities']['bytes_per_player']}B"
+            )
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "mode": args.mode,
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
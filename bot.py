@@ -6,6 +6,8 @@ import asyncio
 import traceback   # ← 이 줄 추가
 from dotenv import load_dotenv
 
+from services.message_router import parse_turn_command
+
 load_dotenv()
 
 INTENTS = discord.Intents.default()
@@ -23,8 +25,10 @@ async def on_ready():
 @bot.event
 async def on_command_error(ctx, error):
     if isinstance(error, commands.CheckFailure):
-        return await ctx.send("이미 **다른 채널**에서 경매가 진행 중입니다. 같은 채널에서 사용해 주세요.")
+        return await ctx.send(str(error) or "이 채널에서는 사용할 수 없는 명령입니다.")
     if isinstance(error, commands.CommandNotFound):
+        if parse_turn_command(ctx.message.content) is not None:
+            return   # `!입찰` / `!패스` 등 차례 입력 — 라우터가 처리
         return await ctx.send("알 수 없는 명령어입니다. `!도움말`을 입력해 보세요.")
     await ctx.send(f"에러: {error.__class__.__name__}: {error}")
 
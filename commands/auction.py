@@ -1,32 +1,40 @@
 import io
-import csv
 import asyncio
 import discord
 from discord.ext import commands
 
 from utils.format import split_semicolon, fmt_player_line
-from services.auction_service import AuctionService
+from services.session_registry import SessionRegistry, SessionLimitError
+from services.importer import import_attachment
+from services.message_router import turn_router
+from models.search_index import RANK_EXACT_NAME
+from models.entities import PlayerStatus
+from components.paginator import PageSource, send_paginated
+from components.allocation_view import AllocationConfirmView
+from components.turn_panel import TurnControlView
+from services.ordering import STRATEGIES, resolve_strategy
 import config as CFG
 
 from models.view_format import (
-    norm,
     fmt_captain_line,
     fmt_player_as_won,
     fmt_player_as_other,
     find_captain_key_by_teamname,
 )
 
-# 서비스는 모듈 전역에서 하나만 사용
-service = AuctionService()
+# 채널별 경매 세션 — (길드, 채널) 단위로 독립된 AuctionService
+sessions = SessionRegistry()
 
-def same_channel_guard(ctx: commands.Context) -> bool:
-    """경매는 한 채널에서만 진행 — 다른 채널이면 False"""
-    return service.ensure_channel(ctx.channel.id)
+# CSV 등록: `검사` 를 붙이면 등록 없이 검증만, 실패 사유는 채팅에 이만큼만 미리 보여줌
+DRY_RUN_TOKEN = "검사"
+CSV_ERROR_PREVIEW = 5
+# !조회 참가자 부분일치 결과 최대 개수
+PARTICIPANT_RESULT_LIMIT = 10
 
-def _author_matches_nick(self, ctx: commands.Context, target_nick: str) -> bool:
+def _author_matches_nick(ctx: commands.Context, target_nick: str) -> bool:
     """현재 메시지 발신자가 target_nick 팀장인지 판별 (매핑 우선 → 표시이름/계정명 대안)"""
     # 1) user_id → nick 매핑 우선
-    mapped = self.service.state.captain_user_map.get(ctx.author.id)
+    mapped = ctx.service.state.captain_user_map.get(ctx.author.id)
     if mapped:
         return mapped == (target_nick or "").strip()
     # 2) 표시이름/계정명 매칭 (하위 호환)
@@ -35,14 +43,37 @@ def _author_matches_nick(self, ctx: commands.Context, target_nick: str) -> bool:
     target = (target_nick or "").strip()
     return name == target or uname == target
 
+def _captain_of_author(ctx: commands.Context) -> str | None:
+    """메시지 발신자의 팀장 닉 (바인딩 우선 → 표시이름/계정명 대안)"""
+    st = ctx.service.state
+    mapped = st.captain_user_map.get(ctx.author.id)
+    if mapped:
+        return mapped
+    for name in ((ctx.author.display_name or "").strip(), (ctx.author.name or "").strip()):
+        if name in st.captains:
+            return name
+    return None
+
 class AuctionCog(commands.Cog, name="Auction"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.service = service  # 필요 시 교체/모킹 가능
+        self.sessions = sessions  # 필요 시 교체/모킹 가능
+        self.router = turn_router
 
-    # Cog 전체에 적용할 체크(모든 커맨드 공통)
+    # 텍스트 차례 입력(`!입찰` 등)은 명령이 아니라 라우터가 기다리는 차례로 바로 전달
+    @commands.Cog.listener("on_message")
+    async def route_turn_input(self, message: discord.Message):
+        if message.author.bot or len(self.router) == 0:   # 기다리는 차례가 없으면 파싱도 생략
+            return
+        self.router.dispatch(message)
+
+    # Cog 전체에 적용할 체크(모든 커맨드 공통) — 명령이 들어온 채널의 세션으로 라우팅
     async def cog_check(self, ctx: commands.Context) -> bool:
-        return same_channel_guard(ctx)
+        try:
+            ctx.service = self.sessions.get_or_create(self.sessions.key_for(ctx))
+        except SessionLimitError as e:
+            raise commands.CheckFailure(str(e))
+        return ctx.service.ensure_channel(ctx.channel.id)
 
     # ───────────────────────── 도움말 ─────────────────────────
     @commands.command(name="도움말")
@@ -72,12 +103,18 @@ class AuctionCog(commands.Cog, name="Auction"):
                 "내 디스코드 계정을 팀장 닉네임에 바인딩합니다. 버튼 UI 입찰이 활성화됩니다."
             ),
             "경매자 등록": (
-                "!경매자 등록 (CSV 첨부) 또는 !경매자 등록 이름;닉;티어;주;부;모스트1[;모스트2][;모스트3]",
-                "경매자를 등록합니다. CSV 첨부 시 명령만 입력하면 됩니다."
+                "!경매자 등록 [검사] (CSV 첨부) 또는 !경매자 등록 이름;닉;티어;주;부;모스트1[;모스트2][;모스트3]",
+                "경매자를 등록합니다. CSV 첨부 시 명령만 입력하면 됩니다. `검사`를 붙이면 등록 없이 검증만 합니다."
             ),
             "경매 시작": (
-                "!경매 시작 <팀수> <팀장초기포인트>",
-                f"경매를 시작합니다. 최소입찰 {base_bid}P, 단위 {bid_step}P, 턴 제한 {turn_sec}초."
+                "!경매 시작 <팀수> <팀장초기포인트> [무작위|티어|라인|스네이크] [시드]",
+                f"경매를 시작합니다. 최소입찰 {base_bid}P, 단위 {bid_step}P, 턴 제한 {turn_sec}초. "
+                "순서 방식과 시드를 주면 같은 순서를 재현할 수 있습니다."
+            ),
+            "경매 방식": (
+                "!경매 방식 <순차|밀봉>",
+                f"순차: 팀장 순번대로 입찰. 밀봉: 입찰 가능한 팀장 전원이 {CFG.SEALED_BID_TIMEOUT_SEC}초 안에 "
+                "동시에 한 번 제출하고, 마감 후 공개합니다."
             ),
             "입찰": (
                 f"본인 차례(버튼 UI)에서 금액을 확정합니다. 최소 {base_bid}P, {bid_step}P 단위, 잔여 포인트 이내."
@@ -94,9 +131,13 @@ class AuctionCog(commands.Cog, name="Auction"):
                 f"경매 일시정지. 팀장당 {pause_cnt}회, 1회 최대 {pause_sec//60}분.",
                 "퍼즈는 퍼즈를 건 팀장만 해제할 수 있습니다."
             ),
+            "대리입찰": (
+                "!대리입찰 <경매자닉 | 티어:<티어>> <최대포인트>",
+                "상한까지 자동으로 입찰합니다(상한 비공개). `!대리입찰 취소 <대상>`, `!대리입찰 목록`(DM)."
+            ),
             "조회 참가자": (
                 "!조회 참가자 <이름/닉네임>",
-                "경매자 또는 팀장 정보를 단일 명령으로 조회합니다. (이름, 닉네임, 현재상태, 낙찰가 포함)"
+                "경매자 또는 팀장 정보를 단일 명령으로 조회합니다. (이름, 닉네임, 현재상태, 낙찰가 포함) 초성(예: ㅎㄱㄷ)으로도 찾을 수 있습니다."
             ),
             "조회 팀원": (
                 "!조회 팀원 <팀명>",
@@ -117,6 +158,11 @@ class AuctionCog(commands.Cog, name="Auction"):
             "유찰": (
                 "진행 중 경매자를 강제 유찰 처리(관리용). 모든 라운드 종료 후 유찰자 재경매 1회 진행."
             ),
+            "유찰 배정": (
+                "!유찰 배정",
+                f"경매 종료 후 남은 유찰자를 자리가 남은 팀에 {CFG.LEFTOVER_PRICE}P로 자동 배정합니다. "
+                "라인 중복과 티어 균형을 따져 최적 배정을 미리 보여 주고, 버튼으로 확정합니다."
+            ),
             "파일 내보내기": (
                 "!파일 내보내기",
                 "경매 결과를 CSV로 다운로드합니다."
@@ -128,31 +174,37 @@ class AuctionCog(commands.Cog, name="Auction"):
                 "① 팀장 등록: `!팀장 등록 팀명;이름;닉;티어;주;부;모스트1[;모스트2][;모스트3]` (팀장 전원 등록)",
                 "② 경매자 등록: `!경매자 등록` + CSV 첨부  또는  `!경매자 등록 이름;닉;티어;주;부;모스트1[;모스트2][;모스트3]`",
                 "③ (선택) 팀장-계정 바인딩: `!팀장 연결 <팀장닉네임>` — 내 차례에 **버튼 UI**로 입찰/패스/퍼즈 가능",
-                "④ 경매 시작: `!경매 시작 <팀수> <초기포인트>`  예) `!경매 시작 3 1000`",
+                "④ 경매 시작: `!경매 시작 <팀수> <초기포인트> [순서방식] [시드]`  예) `!경매 시작 3 1000`, `!경매 시작 3 1000 스네이크 42`",
+                "   순서 방식: 무작위(기본) / 티어(높은 티어부터) / 라인(같은 주 라인 연속 방지) / 스네이크(티어순을 팀 수씩 끊어 지그재그)",
                 "",
                 f"입찰: 최소 {base_bid}P, {bid_step}P 단위, 턴당 {turn_sec}초",
                 "`패스` — 이번 라운드 건너뛰기",
+                "`!대리입찰 <경매자닉 | 티어:<티어>> <최대포인트>` — 상한까지 자동 입찰 (BID_STEP 단위로 경합, 결과만 안내)",
                 "`관심 없음` — 이번 경매 건너뛰기, 패스는 재입찰이 가능하지만 관심 없음은 불가.",
+                f"`!경매 방식 밀봉` — 입찰 가능한 팀장 전원이 {CFG.SEALED_BID_TIMEOUT_SEC}초 안에 동시에 한 번 제출 (`!경매 방식 순차`로 복귀)",
                 f"`퍼즈` / `퍼즈 종료` — 팀장당 {pause_cnt}회, 1회 최대 {pause_sec//60}분",
                 f"전략 타임 — 모든 팀장에게 1명 이상 영입되면 {strategy_min}분 1회",
                 "",
                 "⚙️ 경매 리셋/종료: `!경매 리셋`  (진행 중 상태를 초기화하고 재시작할 때 사용)",
+                "🔄 경매 재개: `!경매 재개`  (봇 재시작 후 저장된 상태에서 이어서 진행)",
             ]),
             "팀장": ("팀장/바인딩", [
                 "`!팀장 등록 팀명;이름;닉;티어;주;부;모스트1[;모스트2][;모스트3]`",
+                "`!팀장 등록 [검사]` + CSV 첨부 — 팀명,이름,닉,티어,주,부,모스트1[,모스트2][,모스트3][,초기포인트][,팀인원]",
                 "`!팀장 연결 <팀장닉네임>` — 내 디스코드 계정을 팀장 닉으로 바인딩",
                 "바인딩 후 내 차례에 **버튼 UI**가 표시되어 금액 증감/입찰/패스/퍼즈를 버튼으로 선택할 수 있습니다.",
                 "팀장 연결을 하지 않은 경우, 경매 참여가 불가능합니다. 참고 부탁드립니다.",
             ]),
             "경매자": ("경매자 등록", [
-                "`!경매자 등록` + CSV 첨부 (권장)",
+                "`!경매자 등록` + CSV 첨부 (권장) — 헤더 행은 자동으로 건너뜁니다",
+                "`!경매자 등록 검사` + CSV 첨부 — 등록 없이 검증만, 실패 행은 `import_errors.csv`로 받습니다",
                 "`!경매자 등록 이름;닉;티어;주;부;모스트1[;모스트2][;모스트3]`",
                 "모스트2/3 비워도 됩니다(자동 무시).",
             ]),
             "입찰": ("입찰 규칙", [
                 f"최소 {base_bid}P, {bid_step}P 단위",
                 "현재 최고가 초과만 유효",
-                "본인 잔여 포인트 이내",
+                "본인 입찰 한도 이내 — 잔여 포인트에서 남은 자리 × 최소 입찰가를 뺀 금액 (`!조회 포인트`)",
                 f"차례당 {turn_sec}초 내 입력",
             ]),
             "조회": ("조회 명령 모음", [
@@ -212,6 +264,7 @@ class AuctionCog(commands.Cog, name="Auction"):
         """
         사용법:
         • !팀장 등록 팀명;이름;닉;티어;주;부;모스트1[;모스트2][;모스트3][;초기포인트]
+        • !팀장 등록 [검사] + CSV 첨부  — 여러 팀장 일괄 등록 (검사: 검증만)
         • !팀장 연결 <팀장닉네임>  — 내 디스코드 계정을 팀장 닉에 바인딩(버튼 UI 사용)
         비고:
         - 초기포인트는 선택 항목입니다(0 이상 정수). 지정 시 해당 팀장에게 우선 적용됩니다.
@@ -232,7 +285,7 @@ class AuctionCog(commands.Cog, name="Auction"):
             if not captain_nick:
                 return await ctx.send("사용법: `!팀장 연결 <팀장닉네임>`")
             try:
-                self.service.bind_captain_user(ctx.author.id, captain_nick)
+                await ctx.service.execute(ctx.service.bind_captain_user, ctx.author.id, captain_nick)
             except ValueError as e:
                 return await ctx.send(str(e))
             return await ctx.send(
@@ -248,6 +301,10 @@ class AuctionCog(commands.Cog, name="Auction"):
                 "• `!팀장 연결 <팀장닉네임>`"
             )
 
+        # CSV 첨부 (`!팀장 등록 검사` + CSV → 검증만)
+        if ctx.message.attachments:
+            return await self._import_csv(ctx, "captains", dry_run=DRY_RUN_TOKEN in raw_args[1:])
+
         payload = " ".join(raw_args[1:]).strip()
         if not payload:
             return await ctx.send(
@@ -275,7 +332,8 @@ class AuctionCog(commands.Cog, name="Auction"):
                     return await ctx.send("초기 포인트는 0 이상의 정수여야 합니다.")
 
             # 등록
-            self.service.add_captain(
+            await ctx.service.execute(
+                ctx.service.add_captain,
                 team_name=team_name,
                 real_name=real_name,
                 nick=nick,
@@ -300,52 +358,58 @@ class AuctionCog(commands.Cog, name="Auction"):
         else:
             await ctx.send(f"팀장 등록 완료: **{team_name}** / {nick}")
 
+    async def _import_csv(self, ctx: commands.Context, kind: str, dry_run: bool):
+        """첨부된 CSV 들을 스트리밍으로 검증/등록하고, 실패 행은 보고서 파일로 첨부"""
+        csv_atts = [a for a in ctx.message.attachments if a.filename.lower().endswith(".csv")]
+        if not csv_atts:
+            return await ctx.send("CSV 파일(.csv)을 첨부해 주세요.")
+        for att in csv_atts:
+            try:
+                report = await import_attachment(ctx.service, att, kind, dry_run=dry_run)
+            except Exception:
+                await ctx.send(f"`{att.filename}` 파일을 읽지 못했습니다. 다시 첨부해 주세요.")
+                continue
+            text = f"`{att.filename}` — {report.summary()}"
+            if not report.errors:
+                await ctx.send(text)
+                continue
+            preview = "\n".join(f"· {e.row_no}행: {e.reason}" for e in report.errors[:CSV_ERROR_PREVIEW])
+            if len(report.errors) > CSV_ERROR_PREVIEW:
+                preview += f"\n… 외 {len(report.errors) - CSV_ERROR_PREVIEW}건 (첨부 파일 참고)"
+            await ctx.send(
+                f"{text}\n{preview}",
+                file=discord.File(io.BytesIO(report.error_csv_bytes()), filename="import_errors.csv"),
+            )
+
     @commands.command(name="경매자")
     async def player_cmd(self, ctx: commands.Context, *raw_args):
         # ── 조회 분기 ──
         if raw_args and raw_args[0] in ("조회", "정보"):
             nick = raw_args[1] if len(raw_args) > 1 else None
             if nick:
-                p = self.service.state.players.get(nick)
+                p = ctx.service.state.players.get(nick)
                 if not p:
                     return await ctx.send("해당 닉네임이 없습니다.")
                 return await ctx.send(fmt_player_line(p))
-            desc = "\n".join(fmt_player_line(p) for p in self.service.state.players.values()) or "등록된 경매자가 없습니다."
-            return await ctx.send(desc[:1900])
+            svc = ctx.service
+            return await send_paginated(ctx, PageSource(
+                lambda: svc.state.players.values(), fmt_player_line, empty="등록된 경매자가 없습니다.",
+            ))
 
         # ── 등록 분기 (기존 로직) ──
         if not raw_args or raw_args[0] != "등록":
             return await ctx.send("사용법: `!경매자 등록` (CSV 첨부)  /  `!경매자 등록 이름;닉;티어;주;부;모스트1[;모스트2][;모스트3]`  /  `!경매자 조회 [닉]`")
 
-        # CSV 첨부 우선
+        # CSV 첨부 우선 (`!경매자 등록 검사` + CSV → 검증만)
         if ctx.message.attachments:
-            count = 0
-            for att in ctx.message.attachments:
-                if att.filename.lower().endswith(".csv"):
-                    data = await att.read()
-                    text = data.decode("utf-8-sig")
-                    reader = csv.reader(io.StringIO(text))
-                    for row in reader:
-                        if not row or row[0].strip().startswith("#"):
-                            continue
-                        if len(row) < 6:
-                            continue
-                        name, nick, tier, main_p, sub_p, m1 = [c.strip() for c in row[:6]]
-                        m2 = row[6].strip() if len(row) > 6 else None
-                        m3 = row[7].strip() if len(row) > 7 else None
-                        try:
-                            self.service.add_player(name, nick, tier, main_p, sub_p, m1, m2, m3)
-                            count += 1
-                        except Exception:
-                            continue
-            return await ctx.send(f"CSV에서 경매자 {count}명 등록 완료.")
+            return await self._import_csv(ctx, "players", dry_run=DRY_RUN_TOKEN in raw_args[1:])
 
         # 수동 입력
         payload = " ".join(raw_args[1:]).strip()
         try:
             parts = split_semicolon(payload, expected_min=6, expected_max=8)
             name, nick, tier, main_p, sub_p, m1, maybe_m2, maybe_m3 = (parts + ["", ""])[:8]
-            self.service.add_player(name, nick, tier, main_p, sub_p, m1, maybe_m2, maybe_m3)
+            await ctx.service.execute(ctx.service.add_player, name, nick, tier, main_p, sub_p, m1, maybe_m2, maybe_m3)
         except Exception:
             return await ctx.send("형식을 확인해 주세요. 세미콜론(;) 기준 항목 수/순서를 맞춰주세요.")
         await ctx.send(f"경매자 등록 완료: {nick}")
@@ -355,31 +419,144 @@ class AuctionCog(commands.Cog, name="Auction"):
     async def auction_cmd(self, ctx: commands.Context, sub: str = None, *args):
         # 리셋/종료 지원
         if sub in ("리셋", "종료", "reset", "stop", "end"):
-            self.service.reset_all()
+            await self.sessions.drop(self.sessions.key_for(ctx))
             return await ctx.send("🧹 경매 상태를 초기화했습니다. 이제 `!경매 시작 <팀수> <초기포인트>`로 다시 시작하세요.")
 
+        # 진행 상태 + 발신 큐 지표
+        if sub in ("상태", "status"):
+            st = ctx.service.state
+            if not st.started:
+                return await ctx.send("진행 중인 경매가 없습니다.")
+            lines = [f"진행: {max(0, st.current_player_idx) + 1}/{len(st.player_order)}번째 경매자 ({st.phase})"]
+            if ctx.service.outbox is not None:
+                lines.append(ctx.service.outbox.report())
+            return await ctx.send("\n".join(lines))
+
+        # 매물 진행 방식: 순차(순번 입찰) / 밀봉(동시 밀봉 입찰) — 다음 매물부터 적용
+        if sub in ("방식", "mode"):
+            modes = {"순차": "sequential", "sequential": "sequential", "밀봉": "sealed", "sealed": "sealed"}
+            mode = modes.get(args[0]) if args else None
+            if mode is None:
+                current = "밀봉" if ctx.service.lot_mode == "sealed" else "순차"
+                return await ctx.send(f"현재 진행 방식: **{current}**. 변경: `!경매 방식 <순차|밀봉>`")
+            await ctx.service.execute(ctx.service.set_lot_mode, mode)
+            return await ctx.send(f"진행 방식을 **{args[0]}**(으)로 바꿨습니다. 다음 매물부터 적용됩니다.")
+
+        # 봇 재시작 등으로 끊긴 경매 이어서 진행
+        if sub in ("재개", "resume"):
+            if not ctx.service.can_resume():
+                return await ctx.send("재개할 경매가 없습니다. (이미 진행 중이거나 시작 전/종료 상태)")
+            st = ctx.service.state
+            await ctx.send(
+                f"🔄 저장된 상태에서 경매를 재개합니다. "
+                f"({max(0, st.current_player_idx) + 1}/{len(st.player_order)}번째 경매자부터)"
+            )
+            return await ctx.service.run_loop(ctx, resume=True)
+
         if sub != "시작":
-            return await ctx.send("사용법: `!경매 시작 <팀수> <팀장초기포인트>`  또는  `!경매 리셋`")
+            return await ctx.send("사용법: `!경매 시작 <팀수> <팀장초기포인트> [순서방식] [시드]`  /  `!경매 재개`  /  `!경매 상태`  /  `!경매 방식 <순차|밀봉>`  /  `!경매 리셋`")
 
-        # !경매 시작 <팀수> <초기포인트>
+        # !경매 시작 <팀수> <초기포인트> [순서방식] [시드]
         try:
             total_teams_int = int(args[0])
             initial_points_int = int(args[1])
         except (IndexError, ValueError, TypeError):
             return await ctx.send("팀수/포인트는 숫자여야 합니다. 예) `!경매 시작 3 1000`")
+        strategy = args[2] if len(args) > 2 else None
+        try:
+            seed = int(args[3]) if len(args) > 3 else None
+            if strategy:
+                resolve_strategy(strategy)
+        except ValueError as e:
+            return await ctx.send(f"{e}\n예) `!경매 시작 3 1000 티어 42` (순서: 무작위/티어/라인/스네이크, 시드: 정수)")
 
         try:
-            self.service.start_auction(ctx.channel.id, total_teams_int, initial_points_int)
+            ctx.service.start_auction(ctx.channel.id, total_teams_int, initial_points_int, strategy, seed)
         except RuntimeError as e:
             # 여기서 "이미 경매 시작"이 나올 수 있음 → 리셋 안내
             return await ctx.send(f"{str(e)}\n필요하면 `!경매 리셋` 후 다시 시작하세요.")
         except Exception:
             return await ctx.send("팀수/포인트를 확인하세요.")
 
-        await ctx.send(f"팀장 배팅 순서: {', '.join(self.service.state.captain_order) if self.service.state.captain_order else '없음'}")
-        await ctx.send(f"경매자 수 {len(self.service.state.player_order)}명. 5초 후 시작합니다...")
+        st = ctx.service.state
+        await ctx.send(f"팀장 배팅 순서: {', '.join(st.captain_order) if st.captain_order else '없음'}")
+        await ctx.send(f"경매자 순서: {STRATEGIES[st.order_strategy].label} (시드 {st.order_seed})")
+        await ctx.send(f"경매자 수 {len(ctx.service.state.player_order)}명. 5초 후 시작합니다...")
         await asyncio.sleep(5)
-        await self.service.run_loop(ctx)
+        await ctx.service.run_loop(ctx)
+
+    @commands.command(name="퍼즈")
+    async def pause_cmd(self, ctx: commands.Context, sub: str = None):
+        """
+        !퍼즈 종료 — 퍼즈를 건 팀장이 즉시 해제 (대기 중인 경매 루프가 바로 재개)
+        (`!퍼즈` 자체는 본인 차례의 텍스트 입력으로 처리되므로 여기서는 무시)
+        """
+        if sub != "종료":
+            return
+        owner = ctx.service.state.pause_owner
+        if not owner:
+            return
+        if not _author_matches_nick(ctx, owner):
+            return await ctx.send("퍼즈를 건 팀장만 해제할 수 있습니다.")
+        # 루프가 돌고 있으면 루프가 해제를 처리하며 안내, 아니면 그 자리에서 반영되므로 여기서 안내 (한쪽만)
+        direct = not ctx.service.running
+        if await ctx.service.request_unpause(owner) and direct:
+            await ctx.send("▶️ 퍼즈 해제!")
+
+    # ───────────────────────── 대리 입찰 ─────────────────────────
+    @commands.command(name="대리입찰", aliases=["대리"])
+    async def proxy_cmd(self, ctx: commands.Context, *args):
+        """
+        !대리입찰 <경매자닉 | 티어:<티어>> <최대포인트>  — 내 차례를 묻지 않고 상한까지 자동 입찰
+        !대리입찰 취소 <경매자닉 | 티어:<티어>>
+        !대리입찰 목록  — 내가 건 대리 입찰 (DM)
+        상한이 드러나지 않도록 등록/취소 메시지는 지웁니다.
+        """
+        usage = "사용법: `!대리입찰 <경매자닉 | 티어:<티어>> <최대포인트>` / `!대리입찰 취소 <대상>` / `!대리입찰 목록`"
+        c_nick = _captain_of_author(ctx)
+        if c_nick is None:
+            return await ctx.send("팀장만 사용할 수 있습니다. 먼저 `!팀장 연결 <팀장닉네임>`을 해 주세요.")
+        if not args:
+            return await ctx.send(usage)
+
+        st = ctx.service.state
+        if args[0] == "목록":
+            lines = [f"• {nick}: {lim}P" for nick, lim in st.proxy_by_player.get(c_nick, {}).items()]
+            lines += [f"• 티어 {tier}: {lim}P" for tier, lim in st.proxy_by_tier.get(c_nick, {}).items()]
+            text = "🤖 **내 대리 입찰**\n" + ("\n".join(lines) if lines else "(없음)")
+            try:
+                await ctx.author.send(text)
+            except Exception:
+                return await ctx.send("DM을 보낼 수 없습니다. 서버 DM 허용 설정을 확인해 주세요.")
+            return await ctx.send("DM으로 보냈습니다.")
+
+        cancel = args[0] == "취소"
+        rest = list(args[1:] if cancel else args)
+        if (cancel and len(rest) < 1) or (not cancel and len(rest) < 2):
+            return await ctx.send(usage)
+
+        limit = None
+        if not cancel:
+            if not rest[-1].isdigit():
+                return await ctx.send(usage)
+            limit = int(rest.pop())
+        target = " ".join(rest).strip()
+        kind = "player"
+        if target.startswith("티어:"):
+            kind, target = "tier", target[len("티어:"):].strip()
+
+        try:
+            await ctx.service.execute(ctx.service.set_proxy, c_nick, kind, target, limit)
+        except ValueError as e:
+            return await ctx.send(str(e))
+        try:
+            await ctx.message.delete()
+        except Exception:
+            pass
+        label = f"티어 {target}" if kind == "tier" else target
+        if cancel:
+            return await ctx.send(f"🤖 {c_nick} — {label} 대리 입찰을 취소했습니다.")
+        await ctx.send(f"🤖 {c_nick} — {label} 대리 입찰 등록 (상한 비공개)")
 
     # ───────────────────────── 조회 그룹 ─────────────────────────
     @commands.group(name="조회", invoke_without_command=True)
@@ -410,28 +587,29 @@ class AuctionCog(commands.Cog, name="Auction"):
         if not team_name:
             return await ctx.send("사용법: `!조회 팀원 <팀명>`")
 
-        captain_key = find_captain_key_by_teamname(self.service, team_name)
+        captain_key = find_captain_key_by_teamname(ctx.service, team_name)
         if captain_key is None:
             return await ctx.send("해당 팀명을 찾지 못했습니다. 팀명이 정확한지 확인해 주세요.")
 
-        cap = self.service.state.captains.get(captain_key)
-        team = self.service.state.teams.get(captain_key)
+        cap = ctx.service.state.captains.get(captain_key)
+        team = ctx.service.state.teams.get(captain_key)
         if not cap or not team:
             return await ctx.send("팀 정보를 찾지 못했습니다.")
 
-        lines = [fmt_captain_line(captain_key, cap)]
+        svc = ctx.service
 
         # 팀에 영입된 멤버(= 낙찰자만) 출력
-        if not team.members:
-            lines.append("낙찰 된 팀원: (없음)")
-        else:
-            for mn in team.members:
-                p = self.service.state.players.get(mn)
-                if p and getattr(p, "status", "") == "낙찰" and getattr(p, "won_team", "") == getattr(cap, "team_name", ""):
-                    lines.append(fmt_player_as_won(p))
-
-        text = "\n".join(lines)
-        await ctx.send(text[:1900] if text else "결과가 없습니다.")
+        def members():
+            return [
+                p for p in (svc.state.players.get(mn) for mn in team.members)
+                if p and getattr(p, "status", "") == PlayerStatus.WON and getattr(p, "won_team", "") == getattr(cap, "team_name", "")
+            ]
+
+        await send_paginated(ctx, PageSource(
+            members, fmt_player_as_won,
+            header=fmt_captain_line(captain_key, cap),
+            empty=f"{fmt_captain_line(captain_key, cap)}\n낙찰 된 팀원: (없음)",
+        ))
 
     @query_group.command(name="유찰자", aliases=["failed", "fail"])
     async def query_failed_sub(self, ctx: commands.Context):
@@ -439,42 +617,46 @@ class AuctionCog(commands.Cog, name="Auction"):
         !조회 유찰자
         포맷: 그 외 경매자: 닉네임(이름) / 티어 / 주 라인 / 부 라인 (현 상태)
         """
-        failed = [p for p in self.service.state.players.values() if getattr(p, "status", "") == "유찰"]
-        if not failed:
-            return await ctx.send("유찰자가 없습니다.")
-
-        from models.view_format import fmt_player_as_other
-        lines = [fmt_player_as_other(p) for p in failed]
-        text = "\n".join(lines)
-        await ctx.send(text[:1900])
+        svc = ctx.service
+        await send_paginated(ctx, PageSource(
+            lambda: svc.state.nicks_with_status(PlayerStatus.FAILED),
+            lambda nick: fmt_player_as_other(svc.state.players[nick]),
+            empty="유찰자가 없습니다.",
+        ))
 
     @query_group.command(name="포인트")
     async def query_point_sub(self, ctx: commands.Context, *, team_name: str | None = None):
         if not team_name:
             return await ctx.send("사용법: `!조회 포인트 <팀명>`")
-        for c in self.service.state.captains.values():
+        for c in ctx.service.state.captains.values():
             if c.team_name == team_name:
-                return await ctx.send(f"{team_name} — 전체:{c.total_pts} / 사용:{c.used_pts} / 잔여:{c.remain_pts}")
+                return await ctx.send(f"{team_name} — 전체:{c.total_pts} / 사용:{c.used_pts} / 잔여:{c.remain_pts} / 입찰 한도:{ctx.service.state.max_bid(c.nickname)}")
         await ctx.send("해당 팀명이 없습니다.")
 
     @query_group.command(name="경매순서", aliases=["경매-순서", "경매_순서"])
     async def query_order(self, ctx: commands.Context):
-        po = self.service.state.player_order
-        if not po:
-            return await ctx.send("경매 순서가 없습니다.")
+        svc = ctx.service
 
-        lines: list[str] = []
-        for nick in po:
-            p = self.service.state.players.get(nick)
+        def render(nick: str) -> str:
+            p = svc.state.players.get(nick)
             if not p:
-                continue
-            if getattr(p, "status", "") == "낙찰":
-                lines.append(fmt_player_as_won(p))
-            else:
-                lines.append(fmt_player_as_other(p))
-
-        text = "\n".join(lines)
-        await ctx.send(text[:1900] if text else "경매 순서가 없습니다.")
+                return f"{nick} (삭제됨)"
+            if getattr(p, "status", "") == PlayerStatus.WON:
+                return fmt_player_as_won(p)
+            return fmt_player_as_other(p)
+
+        # 순서 목록(닉네임)만 넘기고, 보여줄 페이지의 닉만 렌더링
+        st = svc.state
+        header = ""
+        if st.started:
+            strategy = STRATEGIES.get(st.order_strategy)
+            header = f"순서 방식: {strategy.label if strategy else st.order_strategy} (시드 {st.order_seed})"
+            upcoming = st.upcoming(CFG.ORDER_LOOKAHEAD)
+            if upcoming:
+                header += f"\n다음 {len(upcoming)}명: {', '.join(upcoming)}"
+        await send_paginated(ctx, PageSource(
+            lambda: svc.state.player_order, render, header=header, empty="경매 순서가 없습니다.",
+        ))
 
         
     @query_group.command(name="참가자", aliases=["participant", "사람"])
@@ -482,69 +664,20 @@ class AuctionCog(commands.Cog, name="Auction"):
         if not key:
             return await ctx.send("사용법: `!조회 참가자 <이름 또는 닉네임>`")
 
-        q = norm(key)
-
-        # 1) 경매자 탐색
-        exact_p, exact_p_by_name = None, None
-        partial_p = []
-        for p in self.service.state.players.values():
-            nick_l = norm(getattr(p, "nickname", ""))
-            name_l = norm(getattr(p, "name", ""))
-            if nick_l == q:
-                exact_p = p
-                break
-            if exact_p_by_name is None and name_l == q:
-                exact_p_by_name = p
-            if q in nick_l or q in name_l:
-                partial_p.append(p)
-
-        # 2) 팀장 탐색
-        exact_c, exact_c_by_name = None, None  # (c_nick, cap)
-        partial_c = []
-        for c_nick, c in self.service.state.captains.items():
-            real_l = norm(getattr(c, "real_name", ""))
-            team_l = norm(getattr(c, "team_name", ""))
-            cap_nick_l = norm(getattr(c, "nickname", ""))  # 모델에 있을 수도
-            key_nick_l = norm(c_nick)
-            if key_nick_l == q or cap_nick_l == q:
-                exact_c = (c_nick, c)
-                break
-            if exact_c_by_name is None and real_l == q:
-                exact_c_by_name = (c_nick, c)
-            if any(q in s for s in (real_l, team_l, cap_nick_l, key_nick_l)):
-                partial_c.append((c_nick, c))
+        st = ctx.service.state
+        hits = st.search.search(key, limit=PARTICIPANT_RESULT_LIMIT)
 
-        lines: list[str] = []
+        # 완전일치는 닉 > 이름 순으로 한 순위만, 없으면 부분일치·초성 후보를 순위대로
+        if hits and hits[0][0] <= RANK_EXACT_NAME:
+            hits = [h for h in hits if h[0] == hits[0][0]]
 
-        # 1순위: 닉 완전일치
-        if exact_p:
-            if getattr(exact_p, "status", "") == "낙찰":
-                lines.append(fmt_player_as_won(exact_p))
-            else:
-                lines.append(fmt_player_as_other(exact_p))
-        if exact_c:
-            lines.append(fmt_captain_line(exact_c[0], exact_c[1]))
-
-        # 2순위: 이름 완전일치
-        if not lines and exact_p_by_name:
-            if getattr(exact_p_by_name, "status", "") == "낙찰":
-                lines.append(fmt_player_as_won(exact_p_by_name))
+        lines: list[str] = []
+        for _, kind, nick in hits:
+            if kind == "captain":
+                lines.append(fmt_captain_line(nick, st.captains[nick]))
             else:
-                lines.append(fmt_player_as_other(exact_p_by_name))
-        if not lines and exact_c_by_name:
-            lines.append(fmt_captain_line(exact_c_by_name[0], exact_c_by_name[1]))
-
-        # 3순위: 부분일치 후보(최대 5개씩)
-        if not lines:
-            if partial_p:
-                for p in partial_p[:5]:
-                    if getattr(p, "status", "") == "낙찰":
-                        lines.append(fmt_player_as_won(p))
-                    else:
-                        lines.append(fmt_player_as_other(p))
-            if partial_c:
-                for cn, c in partial_c[:5]:
-                    lines.append(fmt_captain_line(cn, c))
+                p = st.players[nick]
+                lines.append(fmt_player_as_won(p) if p.status == PlayerStatus.WON else fmt_player_as_other(p))
 
         if not lines:
             return await ctx.send("해당 이름/닉네임의 참가자를 찾지 못했습니다.")
@@ -553,14 +686,37 @@ class AuctionCog(commands.Cog, name="Auction"):
         await ctx.send(text[:1900] if text else "결과가 없습니다.")
 
 
+    # ───────────────────────── 유찰자 자동 배정 ─────────────────────────
+    @commands.command(name="유찰")
+    async def leftover_cmd(self, ctx: commands.Context, sub: str = None):
+        """
+        !유찰 배정 → 남은 유찰자를 자리가 남은 팀에 자동 배정 (미리보기 후 버튼으로 확정)
+        """
+        if sub != "배정":
+            return await ctx.send("사용법: `!유찰 배정`")
+        try:
+            plan = ctx.service.plan_allocation()
+        except ValueError as e:
+            return await ctx.send(str(e))
+        if not plan:
+            if plan.unassigned:
+                return await ctx.send(f"자리가 남은 팀이 없어 유찰자 {len(plan.unassigned)}명을 배정할 수 없습니다.")
+            return await ctx.send("배정할 유찰자가 없습니다.")
+        await ctx.send(
+            plan.preview(ctx.service.state, CFG.OUTBOX_MAX_MESSAGE_LEN),
+            view=AllocationConfirmView(service=ctx.service, plan=plan, author_id=ctx.author.id),
+        )
+
     # ───────────────────────── 결과 내보내기 ─────────────────────────
     @commands.command(name="파일")
     async def export_cmd(self, ctx: commands.Context, sub: str = None):
         if sub != "내보내기":
             return await ctx.send("사용법: `!파일 내보내기`")
-        data = self.service.export_csv_bytes()
+        data = ctx.service.export_csv_bytes()
         await ctx.send(file=discord.File(io.BytesIO(data), filename="auction_result.csv"))
 
 # 확장 로드용 엔트리
 async def setup(bot: commands.Bot):
+    # 차례 메시지 버튼은 custom_id 가 고정된 영구 뷰 — 재시작 전 메시지의 클릭도 누른 채널의 세션으로 연결
+    bot.add_view(TurnControlView(lambda interaction: sessions.get(sessions.key_for(interaction))))
     await bot.add_cog(AuctionCog(bot))
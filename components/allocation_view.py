@@ -0,0 +1,36 @@
+# components/allocation_view.py
+import discord
+
+class AllocationConfirmView(discord.ui.View):
+    """
+    유찰자 자동 배정 미리보기의 확정/취소 버튼
+    - 미리보기를 요청한 사람(author_id)만 조작 가능 — 경매 종료 자동 미리보기는 경매를 시작/재개한 진행자
+    - 확정 시 service.commit_allocation(plan) — 미리보기 이후 상태가 바뀌었으면 거절
+    """
+    def __init__(self, *, service, plan, author_id: int, timeout: int | None = 600):
+        super().__init__(timeout=timeout)
+        self.service = service
+        self.plan = plan
+        self.author_id = author_id
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id == self.author_id:
+            return True
+        await interaction.response.send_message("미리보기를 요청한 사람만 확정할 수 있습니다.", ephemeral=True)
+        return False
+
+    @discord.ui.button(label="배정 확정", style=discord.ButtonStyle.success)
+    async def do_confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        try:
+            count = await self.service.execute(self.service.commit_allocation, self.plan)
+        except ValueError as e:
+            return await interaction.response.send_message(str(e), ephemeral=True)
+        self.stop()
+        await interaction.response.edit_message(
+            content=f"{interaction.message.content}\n\n✅ 유찰자 {count}명 배정을 확정했습니다.", view=None,
+        )
+
+    @discord.ui.button(label="취소", style=discord.ButtonStyle.secondary)
+    async def do_cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.stop()
+        await interaction.response.edit_message(content="유찰자 자동 배정을 취소했습니다.", view=None)
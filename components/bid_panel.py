@@ -1,9 +1,30 @@
 # components/bid_panel.py
-import datetime
 import asyncio
+from typing import Dict, Optional
+
 import discord
+import config as CFG
 from components.unpause_view import UnpauseView
 
+
+def over_limit_text(limit: int) -> str:
+    """입찰 한도 초과 안내 — 패널/텍스트/엔진 거절 모두 같은 문구"""
+    return f"입찰 한도({limit}P)를 초과했어요. 남은 자리를 채울 최소 입찰가는 남겨 둬야 합니다."
+
+
+def check_bid(service, c_nick: str, amount: int) -> Optional[str]:
+    """제출 전 검증 — 문제가 있으면 안내 문구 (차례를 날리지 않도록 루프로 보내기 전에 거름)"""
+    if amount < CFG.BASE_BID or amount % CFG.BID_STEP != 0:
+        return f"입찰은 최소 {CFG.BASE_BID}P, {CFG.BID_STEP}P 단위입니다."
+    low = service.lot.engine.min_next_bid()
+    if amount < low:
+        return f"현재 최고 {service.state.current_bid}P 입니다. {low}P 이상으로 입찰하세요."
+    limit = service.state.max_bid(c_nick)
+    if amount > limit:
+        return over_limit_text(limit)
+    return None
+
+
 class BidPanel(discord.ui.View):
     """
     - author_id만 상호작용 가능(interaction_check)
@@ -12,6 +33,9 @@ class BidPanel(discord.ui.View):
     - 인터랙션 응답은 중복 호출되지 않도록 edit_message/response 호출을 엄격히 분리
     - '관심 없음' 추가: 이 매물에서 이후 차례도 자동 패스로 처리 (result: "no_interest")
     버튼 표시는 '입찰 → 패스 → 관심 없음 → 퍼즈' 순서
+    - sealed=True: 밀봉 입찰용 — 최고가를 보여주지 않고, 관심 없음/퍼즈 버튼 없이 1회 제출
+    - result_future 가 없으면 '상시 패널': 매물 동안 열어 두고, 세션(BidPanelRegistry)이 최고가/한도 변화를
+      모아서(BID_PANEL_REFRESH_SEC) 패널에 반영. 제출은 내 차례일 때만, 루프로 보내기 전에 검증
     """
     def __init__(
         self,
@@ -21,35 +45,99 @@ class BidPanel(discord.ui.View):
         step: int,
         max_bid: int,
         current_top: int,
-        timeout_sec: int,
+        timeout_sec: Optional[int],
         service,
         captain_key: str,
         pause_max_sec: int,
         pause_max_count: int,
-        result_future: asyncio.Future,
+        result_future: Optional[asyncio.Future] = None,
+        sealed: bool = False,
     ):
         super().__init__(timeout=timeout_sec)
         self.author_id = author_id
         self.min_bid = min_bid
         self.step = step
-        self.max_bid = max_bid
-        self.current_top = current_top or 0
-        # 최소 입찰: 현재 최고가보다 한 스텝 높은 값 또는 최소입찰
-        self._amount = max(min_bid, (self.current_top // step + 1) * step if self.current_top else min_bid)
+        self._max_bid = max_bid
+        self._current_top = current_top or 0
 
         self.service = service
         self.captain_key = captain_key
         self.pause_max_sec = pause_max_sec
         self.pause_max_count = pause_max_count
         self._result_future = result_future
+        self.sealed = sealed
+        # 최소 입찰: 현재 최고가보다 한 스텝 높은 값 또는 최소입찰
+        self._amount = self._floor()
+        if sealed:
+            # 공통 마감 하나로 진행 → 퍼즈 없음, 한 번 제출하면 끝이라 '관심 없음'은 패스와 같음
+            self.remove_item(self.do_no_interest)
+            self.remove_item(self.do_pause)
 
         # 에페메랄 최초 응답 여부 (이후엔 edit_original_response 사용)
         self._has_initial_responded = False
+        self._interaction: Optional[discord.Interaction] = None   # 상시 패널 갱신용 (최초 응답한 인터랙션)
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    # ─────────────────────── 상시 패널: 값은 세션 상태에서 읽음 ───────────────────────
+    @property
+    def live(self) -> bool:
+        return self._result_future is None
+
+    @property
+    def current_top(self) -> int:
+        return self.service.state.current_bid if self.live else self._current_top
+
+    @property
+    def max_bid(self) -> int:
+        return self.service.state.max_bid(self.captain_key) if self.live else self._max_bid
+
+    def _floor(self) -> int:
+        top = self.current_top
+        return max(self.min_bid, (top // self.step + 1) * self.step if top else self.min_bid)
+
+    def _my_future(self) -> Optional[asyncio.Future]:
+        """결과를 넣을 자리 — 상시 패널은 지금 내 차례일 때만"""
+        if not self.live:
+            return None if self._result_future.done() else self._result_future
+        turn = self.service.turn
+        if turn is None or turn.captain != self.captain_key or turn.future.done():
+            return None
+        return turn.future
+
+    def refresh(self) -> None:
+        """최고가/한도/차례가 바뀌었을 때 (세션이 호출) — 연달아 바뀌면 모아서 한 번만 수정"""
+        if self._interaction is None or self.is_finished():
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._push_refresh())
+
+    async def _push_refresh(self):
+        await asyncio.sleep(CFG.BID_PANEL_REFRESH_SEC)
+        try:
+            await self._interaction.edit_original_response(content=self.get_content(), view=self)
+        except Exception:
+            # 토큰 만료(15분)/메시지 닫힘 — 더 갱신할 수 없으므로 등록 해제
+            self.stop()
+
+    async def close(self, text: str):
+        """패널 닫기 (매물 종료, 같은 팀장이 새 패널을 연 경우)"""
+        self.stop()
+        if self._interaction is not None:
+            try:
+                await self._interaction.edit_original_response(content=text, view=None)
+            except Exception:
+                pass
+
+    def stop(self) -> None:
+        if self._refresh_task is not None and self._refresh_task is not asyncio.current_task():
+            self._refresh_task.cancel()
+        self.service.bid_panels.discard(self)
+        super().stop()
 
     # ─────────────────────────────────────────────
     async def on_timeout(self):
-        # 타임아웃 → 호출측에서 'pass' 처리하도록 result 전달
-        if not self._result_future.done():
+        # 타임아웃 → 호출측에서 'pass' 처리하도록 result 전달 (상시 패널의 차례 시간은 루프가 관리)
+        if not self.live and not self._result_future.done():
             self._result_future.set_result(("timeout", None))
 
         # (선택) 버튼 비활성화 시도 — 에페메랄이라 실패할 수 있으므로 무시
@@ -71,20 +159,37 @@ class BidPanel(discord.ui.View):
             await interaction.followup.send("현재 차례인 팀장만 조작할 수 있습니다.", ephemeral=True)
         return False
 
-    def _set_result(self, action: str, amount: int | None):
-        if not self._result_future.done():
-            self._result_future.set_result((action, amount))
+    async def _claim(self, interaction: discord.Interaction) -> Optional[asyncio.Future]:
+        """제출할 자리 확인 — 내 차례가 아니면 에페메랄 안내 후 None"""
+        future = self._my_future()
+        if future is None:
+            text = "아직 내 차례가 아닙니다. 패널을 열어 두면 최고가/한도가 계속 갱신됩니다." if self.live else "이미 제출했습니다."
+            await interaction.response.send_message(text, ephemeral=True)
+        return future
 
     # ✅ 패널 상단 표시: 현재 최고가, 내 금액, 차이
     def get_content(self) -> str:
+        if self.sealed:
+            return (
+                f"📩 **밀봉 입찰** — 다른 팀의 금액은 마감 후 공개됩니다.\n"
+                f"💰 **내 금액:** {self._amount}P\n"
+                f"최대 {self.max_bid}P까지, 한 번만 제출할 수 있어요."
+            )
+        # 최고가가 올라 내 금액이 낮아졌으면 최소 입찰가로 끌어올림
+        self._amount = max(self._amount, self._floor())
         diff = self._amount - (self.current_top or 0)
         sign = "+" if diff >= 0 else "-"
         diff_abs = abs(diff)
-        return (
+        text = (
             f"🏷️ **현재 최고가:** {self.current_top}P\n"
             f"💰 **내 금액:** {self._amount}P ({sign}{diff_abs}P)\n"
             f"최대 {self.max_bid}P까지, 버튼으로 조정하세요."
         )
+        if self._amount > self.max_bid:
+            text += "\n⚠️ 최소 입찰가가 한도를 넘었습니다. 이번 매물은 더 올릴 수 없어요."
+        if self.live:
+            text += "\n🟢 **내 차례입니다.**" if self._my_future() is not None else "\n⏳ 다른 팀장 차례 — 열어 두면 갱신됩니다."
+        return text
 
     async def attach_to(self, interaction: discord.Interaction):
         """
@@ -93,6 +198,9 @@ class BidPanel(discord.ui.View):
         """
         await interaction.response.send_message(self.get_content(), view=self, ephemeral=True)
         self._has_initial_responded = True
+        if self.live:
+            self._interaction = interaction
+            await self.service.bid_panels.add(self)
 
     async def _edit_panel(self, interaction: discord.Interaction):
         """
@@ -108,8 +216,8 @@ class BidPanel(discord.ui.View):
     async def _adjust_bid(self, interaction: discord.Interaction, delta: int):
         new = self._amount + delta
         if new > self.max_bid:
-            return await interaction.response.send_message("보유 포인트를 초과합니다.", ephemeral=True)
-        if new < self.min_bid:
+            return await interaction.response.send_message(over_limit_text(self.max_bid), ephemeral=True)
+        if new < self._floor():
             return await interaction.response.send_message("최소 입찰 금액보다 낮게 설정할 수 없습니다.", ephemeral=True)
         self._amount = new
         await self._edit_panel(interaction)
@@ -141,7 +249,19 @@ class BidPanel(discord.ui.View):
     # ─────────────────────── 확정 / 패스 / 관심 없음 / 퍼즈 ───────────────────────
     @discord.ui.button(label="입찰", style=discord.ButtonStyle.success, row=2)
     async def do_confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self._set_result("bid", self._amount)
+        future = await self._claim(interaction)
+        if future is None:
+            return
+        if not self.sealed:
+            problem = check_bid(self.service, self.captain_key, self._amount)
+            if problem:
+                return await interaction.response.send_message(problem, ephemeral=True)
+        future.set_result(("bid", self._amount))
+        if self.live:
+            # 상시 패널은 다음 차례를 위해 열어 둠
+            return await interaction.response.edit_message(
+                content=f"✅ 입찰 확정: **{self._amount}P**\n" + self.get_content(), view=self,
+            )
         # 패널 종료 메시지(에페메랄)
         text = f"✅ 입찰 확정: **{self._amount}P**"
         if not interaction.response.is_done():
@@ -151,7 +271,11 @@ class BidPanel(discord.ui.View):
 
     @discord.ui.button(label="패스", style=discord.ButtonStyle.primary, row=2)
     async def do_pass(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self._set_result("pass", None)
+        future = await self._claim(interaction)
+        if future is None:
+            return
+        future.set_result(("pass", None))
+        self.stop()   # 패스한 팀장은 이 매물에서 다시 차례가 오지 않음
         text = "🔵 패스 선택"
         if not interaction.response.is_done():
             await interaction.response.edit_message(content=text, view=None)
@@ -164,7 +288,11 @@ class BidPanel(discord.ui.View):
         이 매물 동안은 영구 패스: 이후 내 차례가 돌아와도 자동 패스되도록 호출측에서 처리
         (result: "no_interest")
         """
-        self._set_result("no_interest", None)
+        future = await self._claim(interaction)
+        if future is None:
+            return
+        future.set_result(("no_interest", None))
+        self.stop()
         text = "⚫ 관심 없음 선택 — 해당 경매는 앞으로 자동 패스됩니다."
         if not interaction.response.is_done():
             await interaction.response.edit_message(content=text, view=None)
@@ -173,29 +301,14 @@ class BidPanel(discord.ui.View):
 
     @discord.ui.button(label="퍼즈", style=discord.ButtonStyle.danger, row=2)
     async def do_pause(self, interaction: discord.Interaction, button: discord.ui.Button):
-        state = self.service.state
-
-        if state.pause_owner and state.pause_owner != self.captain_key:
+        # 퍼즈 시작은 경매 루프가 처리 (차례/횟수/중복 확인 + 공개 안내)
+        reason = await self.service.request_pause(self.captain_key)
+        if reason == "busy":
             return await interaction.response.send_message("이미 누군가 퍼즈 중입니다.", ephemeral=True)
-
-        cap = self.service.state.captains.get(self.captain_key)
-        if not cap:
-            return await interaction.response.send_message("팀장 정보를 찾을 수 없습니다.", ephemeral=True)
-
-        if cap.pause_used >= self.pause_max_count:
+        if reason == "exhausted":
             return await interaction.response.send_message("퍼즈 횟수를 모두 사용했습니다.", ephemeral=True)
-
-        # 퍼즈 시작
-        cap.pause_used += 1
-        state.pause_owner = self.captain_key
-        state.paused_until = datetime.datetime.utcnow() + datetime.timedelta(seconds=self.pause_max_sec)
-        # 공개 채널 알림
-        try:
-            await interaction.channel.send(
-                f"⏸️ {self.captain_key} 퍼즈! 최대 {self.pause_max_sec//60}분. `!퍼즈 종료`로 조기 해제."
-            )
-        except Exception:
-            pass
+        if reason is not None:
+            return await interaction.response.send_message("지금은 퍼즈할 수 없습니다. (본인 차례가 아님)", ephemeral=True)
 
         # 퍼즈 종료 버튼 (에페메랄)
         view = UnpauseView(author_id=self.author_id, service=self.service, captain_key=self.captain_key)
@@ -211,3 +324,30 @@ class BidPanel(discord.ui.View):
                 view=view,
                 ephemeral=True,
             )
+
+
+class BidPanelRegistry:
+    """세션의 열린 상시 입찰 패널 (팀장당 1개) — 최고가/한도/차례가 바뀌면 refresh"""
+    def __init__(self):
+        self._panels: Dict[str, BidPanel] = {}
+
+    def __len__(self) -> int:
+        return len(self._panels)
+
+    async def add(self, panel: BidPanel) -> None:
+        old = self._panels.get(panel.captain_key)
+        self._panels[panel.captain_key] = panel
+        if old is not None and old is not panel:
+            await old.close("새 입찰 패널을 열어 이 패널은 닫았습니다.")
+
+    def discard(self, panel: BidPanel) -> None:
+        if self._panels.get(panel.captain_key) is panel:
+            del self._panels[panel.captain_key]
+
+    def notify(self) -> None:
+        for panel in list(self._panels.values()):
+            panel.refresh()
+
+    async def close_all(self, text: str) -> None:
+        for panel in list(self._panels.values()):
+            await panel.close(text)
@@ -0,0 +1,157 @@
+# components/paginator.py
+"""
+조회 결과 페이지 넘김 뷰
+- 목록 전체를 문자열로 만들지 않고, 요청된 페이지의 항목만 그때그때 렌더링
+- 항목은 매번 원본 컬렉션에서 다시 가져오므로 진행 중 상태 변화가 바로 반영됨
+- 세션마다 살아 있는 뷰 수를 제한 (초과 시 가장 오래된 뷰의 버튼을 내림)
+"""
+import math
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
+from typing import Callable, Deque, Sized
+
+import discord
+
+import config as CFG
+
+
+class PageSource:
+    """
+    items: 호출할 때마다 현재 컬렉션(리스트, dict 값 뷰 등 len() 가능)을 돌려주는 함수
+    render: 항목 1개 → 한 줄
+    """
+    def __init__(
+        self,
+        items: Callable[[], Sized],
+        render: Callable[[object], str],
+        *,
+        header: str = "",
+        empty: str = "결과가 없습니다.",
+        per_page: int | None = None,
+    ):
+        self._items = items
+        self._render = render
+        self.header = header
+        self.empty = empty
+        self.per_page = per_page or CFG.PAGINATOR_PAGE_SIZE
+
+    def page_count(self) -> int:
+        return max(1, math.ceil(len(self._items()) / self.per_page))
+
+    def render_page(self, page: int) -> str:
+        items = self._items()
+        total = len(items)
+        if total == 0:
+            return self.empty
+        pages = max(1, math.ceil(total / self.per_page))
+        page = min(max(page, 0), pages - 1)
+        start = page * self.per_page
+        stop = start + self.per_page
+        chunk = items[start:stop] if isinstance(items, Sequence) else islice(items, start, stop)
+        body = "\n".join(self._render(it) for it in chunk)
+        footer = f"\n— {page + 1}/{pages} 페이지 (총 {total}건)" if pages > 1 else ""
+        head = f"{self.header}\n" if self.header else ""
+        limit = CFG.OUTBOX_MAX_MESSAGE_LEN - len(head) - len(footer)
+        return head + body[:limit] + footer
+
+
+class JumpModal(discord.ui.Modal, title="페이지 이동"):
+    page = discord.ui.TextInput(label="페이지 번호", placeholder="예: 3", max_length=6)
+
+    def __init__(self, view: "PaginatorView"):
+        super().__init__()
+        self.paginator = view
+
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            target = int(str(self.page.value).strip()) - 1
+        except ValueError:
+            return await interaction.response.send_message("숫자로 입력해 주세요.", ephemeral=True)
+        await self.paginator.show(interaction, target)
+
+
+class PaginatorView(discord.ui.View):
+    """
+    - 이전/다음/이동 버튼, 조회한 사람만 조작 가능
+    - 페이지를 넘길 때마다 source 에서 해당 페이지만 다시 렌더링
+    """
+    def __init__(self, *, source: PageSource, author_id: int, registry: "PaginatorRegistry"):
+        super().__init__(timeout=CFG.PAGINATOR_TIMEOUT_SEC)
+        self.source = source
+        self.author_id = author_id
+        self.registry = registry
+        self.page = 0
+        self.message: discord.Message | None = None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user and interaction.user.id == self.author_id:
+            return True
+        await interaction.response.send_message("조회한 사람만 페이지를 넘길 수 있습니다. 직접 조회해 주세요.", ephemeral=True)
+        return False
+
+    async def show(self, interaction: discord.Interaction, page: int):
+        pages = self.source.page_count()
+        self.page = min(max(page, 0), pages - 1)
+        await interaction.response.edit_message(content=self.source.render_page(self.page), view=self)
+
+    async def close(self):
+        """버튼을 내리고 등록 해제 (타임아웃/개수 초과)"""
+        self.stop()
+        self.registry.discard(self)
+        if self.message is not None:
+            try:
+                await self.message.edit(view=None)
+            except Exception:
+                pass
+
+    async def on_timeout(self):
+        await self.close()
+
+    @discord.ui.button(label="◀ 이전", style=discord.ButtonStyle.secondary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.page - 1)
+
+    @discord.ui.button(label="다음 ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.page + 1)
+
+    @discord.ui.button(label="이동", style=discord.ButtonStyle.primary)
+    async def jump(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(JumpModal(self))
+
+
+class PaginatorRegistry:
+    """세션 1개가 가진 살아 있는 페이지 뷰 목록 (오래된 순)"""
+    def __init__(self, limit: int | None = None):
+        self.limit = limit or CFG.PAGINATOR_MAX_PER_SESSION
+        self._views: Deque[PaginatorView] = deque()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def discard(self, view: PaginatorView) -> None:
+        try:
+            self._views.remove(view)
+        except ValueError:
+            pass
+
+    async def add(self, view: PaginatorView) -> None:
+        self._views.append(view)
+        while len(self._views) > self.limit:
+            await self._views[0].close()
+
+    async def close_all(self) -> None:
+        while self._views:
+            await self._views[0].close()
+
+
+async def send_paginated(ctx, source: PageSource):
+    """1페이지만 렌더링해서 전송, 여러 페이지면 버튼 뷰를 붙여 세션에 등록"""
+    if source.page_count() <= 1:
+        return await ctx.send(source.render_page(0))
+    registry: PaginatorRegistry = ctx.service.paginators
+    view = PaginatorView(source=source, author_id=ctx.author.id, registry=registry)
+    view.message = await ctx.send(source.render_page(0), view=view)
+    await registry.add(view)
+    return view.message
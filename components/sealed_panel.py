@@ -0,0 +1,54 @@
+# components/sealed_panel.py
+import asyncio
+from typing import Dict, Tuple
+
+import discord
+from components.bid_panel import BidPanel
+
+class SealedBidLauncher(discord.ui.View):
+    """
+    밀봉 입찰 공개 메시지의 '밀봉 입찰하기' 버튼:
+    - 클릭한 유저가 이번 매물에 입찰 가능한 팀장이면 자기 전용 에페메랄 BidPanel(sealed)을 띄움
+    - 팀장마다 result_future 가 따로 있어 모두 같은 마감 시간 안에 동시에 제출
+    - 이미 제출한 팀장은 다시 열 수 없음
+    """
+    def __init__(
+        self,
+        *,
+        service,
+        seats: Dict[int, Tuple[str, asyncio.Future]],   # user_id → (팀장 닉, result_future)
+        min_bid: int,
+        step: int,
+        timeout_sec: int,
+    ):
+        super().__init__(timeout=timeout_sec)
+        self.service = service
+        self.seats = seats
+        self.min_bid = min_bid
+        self.step = step
+        self.timeout_sec = timeout_sec
+
+    @discord.ui.button(label="밀봉 입찰하기", style=discord.ButtonStyle.primary)
+    async def open_panel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        seat = self.seats.get(interaction.user.id)
+        if seat is None:
+            return await interaction.response.send_message("이번 매물에 입찰할 수 있는 팀장만 열 수 있습니다.", ephemeral=True)
+        c_nick, future = seat
+        if future.done():
+            return await interaction.response.send_message("이미 제출했습니다. 마감 후 결과가 공개됩니다.", ephemeral=True)
+
+        panel = BidPanel(
+            author_id=interaction.user.id,
+            min_bid=self.min_bid,
+            step=self.step,
+            max_bid=self.service.state.max_bid(c_nick),
+            current_top=0,
+            timeout_sec=self.timeout_sec,
+            service=self.service,
+            captain_key=c_nick,
+            pause_max_sec=0,
+            pause_max_count=0,
+            result_future=future,
+            sealed=True,
+        )
+        await panel.attach_to(interaction)
@@ -0,0 +1,146 @@
+# components/turn_panel.py
+import asyncio
+from typing import Callable, Optional, Tuple
+
+import discord
+import config as CFG
+from components.bid_panel import BidPanel, check_bid
+
+TURN_OPEN_PANEL_ID = "auction:turn:open_panel"
+TURN_MIN_RAISE_ID = "auction:turn:min_raise"
+TURN_BIG_RAISE_ID = "auction:turn:big_raise"
+TURN_EXACT_ID = "auction:turn:exact"
+TURN_PASS_ID = "auction:turn:pass"
+TURN_NO_INTEREST_ID = "auction:turn:no_interest"
+
+
+def quick_amounts(service) -> Tuple[int, int]:
+    """빠른 입찰 금액 (최소 인상가, 최소 인상가 + (QUICK_RAISE_STEPS-1)단계)"""
+    low = service.lot.engine.min_next_bid()
+    return low, low + (CFG.QUICK_RAISE_STEPS - 1) * CFG.BID_STEP
+
+
+class TurnControlView(discord.ui.View):
+    """
+    매물마다 1개인 공개 차례 메시지의 버튼 (차례가 넘어가면 같은 메시지를 수정)
+    - custom_id 고정 + timeout 없음 → bot.add_view() 로 등록해 두면 봇 재시작 후에도 동작
+    - 뷰에는 세션 상태를 담지 않음: 누른 채널로 세션을 찾고(resolve), 그 세션의 현재 차례로 판단
+    - 빠른 입찰(최소 인상 / +N단계) · 패스 · 관심 없음은 클릭 한 번으로 제출, 금액 입력은 모달
+    - '입찰 패널'은 금액 미세 조정/퍼즈용 상시 BidPanel — 차례 전에 열어 두면 최고가/한도가 계속 갱신됨
+    버튼 표시는 '최소 인상 → +N단계 → 금액 입력 / 패스 → 관심 없음 → 입찰 패널' 순서
+    """
+    def __init__(self, resolve: Callable[[discord.Interaction], Optional[object]]):
+        super().__init__(timeout=None)
+        self.resolve = resolve
+        self.big_raise.label = f"+{CFG.QUICK_RAISE_STEPS}단계"
+
+    async def _my_turn(self, interaction: discord.Interaction):
+        """누른 사람이 현재 차례 팀장이면 (service, turn), 아니면 에페메랄 안내 후 None"""
+        service = self.resolve(interaction)
+        turn = service.turn if service is not None and service.running else None
+        if turn is None or turn.captain is None or turn.future.done():
+            await interaction.response.send_message("지금은 입력을 기다리는 차례가 없습니다.", ephemeral=True)
+            return None
+        if turn.user_id is None:
+            await interaction.response.send_message(
+                f"{turn.captain} 팀장은 연결되지 않아 텍스트로 입력합니다. (`!팀장 연결 <닉네임>`)", ephemeral=True,
+            )
+            return None
+        if interaction.user.id != turn.user_id:
+            await interaction.response.send_message("현재 차례인 팀장만 누를 수 있습니다.", ephemeral=True)
+            return None
+        return service, turn
+
+    async def _submit(self, interaction: discord.Interaction, action: str, amount: Optional[int] = None):
+        mine = await self._my_turn(interaction)
+        if mine is None:
+            return
+        service, turn = mine
+        if action == "bid":
+            problem = check_bid(service, turn.captain, amount)
+            if problem:
+                return await interaction.response.send_message(problem, ephemeral=True)
+        # 결과는 경매 루프가 공개 안내하므로 응답은 확인만 (추가 메시지 없음)
+        turn.future.set_result((action, amount))
+        await interaction.response.defer()
+
+    # ─────────────────────── 빠른 입찰 ───────────────────────
+    @discord.ui.button(label="최소 인상", style=discord.ButtonStyle.success, custom_id=TURN_MIN_RAISE_ID, row=0)
+    async def min_raise(self, interaction: discord.Interaction, button: discord.ui.Button):
+        service = self.resolve(interaction)
+        amount = quick_amounts(service)[0] if service is not None and service.lot is not None else None
+        await self._submit(interaction, "bid", amount)
+
+    @discord.ui.button(label="+5단계", style=discord.ButtonStyle.success, custom_id=TURN_BIG_RAISE_ID, row=0)
+    async def big_raise(self, interaction: discord.Interaction, button: discord.ui.Button):
+        service = self.resolve(interaction)
+        amount = quick_amounts(service)[1] if service is not None and service.lot is not None else None
+        await self._submit(interaction, "bid", amount)
+
+    @discord.ui.button(label="금액 입력", style=discord.ButtonStyle.primary, custom_id=TURN_EXACT_ID, row=0)
+    async def exact(self, interaction: discord.Interaction, button: discord.ui.Button):
+        mine = await self._my_turn(interaction)
+        if mine is None:
+            return
+        service, turn = mine
+        low = quick_amounts(service)[0]
+        await interaction.response.send_modal(ExactBidModal(service, turn, low, service.state.max_bid(turn.captain)))
+
+    # ─────────────────────── 패스 / 관심 없음 ───────────────────────
+    @discord.ui.button(label="패스", style=discord.ButtonStyle.secondary, custom_id=TURN_PASS_ID, row=1)
+    async def do_pass(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._submit(interaction, "pass")
+
+    @discord.ui.button(label="관심 없음", style=discord.ButtonStyle.secondary, custom_id=TURN_NO_INTEREST_ID, row=1)
+    async def do_no_interest(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._submit(interaction, "no_interest")
+
+    @discord.ui.button(label="입찰 패널", style=discord.ButtonStyle.primary, custom_id=TURN_OPEN_PANEL_ID, row=1)
+    async def open_panel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # 차례가 아니어도 이번 매물에 입찰할 수 있는 팀장이면 열 수 있음 (상시 패널, 매물이 끝나면 닫힘)
+        service = self.resolve(interaction)
+        lot = service.lot if service is not None and service.running else None
+        c_nick = service.state.captain_user_map.get(interaction.user.id) if lot is not None else None
+        if lot is None or not hasattr(lot.engine, "eligible"):
+            return await interaction.response.send_message("지금은 진행 중인 매물이 없습니다.", ephemeral=True)
+        if c_nick not in lot.engine.eligible:
+            return await interaction.response.send_message("이번 매물에 입찰할 수 있는 팀장만 열 수 있습니다.", ephemeral=True)
+        panel = BidPanel(
+            author_id=interaction.user.id,
+            min_bid=CFG.BASE_BID,
+            step=CFG.BID_STEP,
+            max_bid=service.state.max_bid(c_nick),
+            current_top=service.state.current_bid,
+            timeout_sec=None,
+            service=service,
+            captain_key=c_nick,
+            pause_max_sec=CFG.PAUSE_MAX_DURATION_SEC,
+            pause_max_count=CFG.PAUSE_MAX_PER_CAPTAIN,
+        )
+        # ❗ attach_to는 내부에서 response.send_message 1회만 호출 → 중복 응답 방지
+        await panel.attach_to(interaction)
+
+
+class ExactBidModal(discord.ui.Modal, title="입찰 금액 입력"):
+    """정확한 금액 입찰 — 모달을 연 차례가 아직 진행 중일 때만 제출"""
+    amount = discord.ui.TextInput(label="입찰 금액(P)", max_length=7)
+
+    def __init__(self, service, turn, low: int, limit: int):
+        super().__init__(timeout=max(1, turn.deadline - asyncio.get_running_loop().time()))
+        self.service = service
+        self.turn = turn
+        self.amount.placeholder = f"{low} ~ {limit}, {CFG.BID_STEP}P 단위"
+
+    async def on_submit(self, interaction: discord.Interaction):
+        turn = self.turn
+        if self.service.turn is not turn or turn.future.done():
+            return await interaction.response.send_message("차례가 이미 끝났습니다.", ephemeral=True)
+        raw = self.amount.value.strip().rstrip("Pp")
+        if not raw.isdigit():
+            return await interaction.response.send_message("숫자만 입력하세요. 예) 120", ephemeral=True)
+        amount = int(raw)
+        problem = check_bid(self.service, turn.captain, amount)
+        if problem:
+            return await interaction.response.send_message(problem, ephemeral=True)
+        turn.future.set_result(("bid", amount))
+        await interaction.response.defer()
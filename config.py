@@ -2,10 +2,38 @@
 BASE_BID = 100                      # 최소 입찰가
 BID_STEP = 10                       # 입찰 단위
 TURN_BID_TIMEOUT_SEC = 999          # 팀장 차례 제한 시간(초)
+QUICK_RAISE_STEPS = 5               # 차례 메시지 빠른 입찰 두 번째 버튼: 최소 인상가에서 (N-1)단계 더
+BID_PANEL_REFRESH_SEC = 1.0         # 열린 입찰 패널 갱신 간격(초) — 그 사이 변화는 모아서 1번만 수정
 NEXT_PLAYER_DELAY_SEC = 10          # 다음 경매까지 대기(초)
 PAUSE_MAX_PER_CAPTAIN = 2           # 팀장당 퍼즈 최대 횟수
 PAUSE_MAX_DURATION_SEC = 3 * 60     # 퍼즈 1회 최대(초)
 STRATEGY_TIME_MINUTES = 1 * 60      # 전략 타임(초)
+LOT_MODE = "sequential"             # 매물 진행 방식: sequential(순번 입찰) / sealed(동시 밀봉 입찰)
+SEALED_BID_TIMEOUT_SEC = 60         # 밀봉 입찰 공통 마감(초)
+SEALED_PRICE_RULE = "first"         # 밀봉 낙찰가: first(최고가) / second(2위 입찰가)
+SEALED_TIE_BREAK = "order"          # 밀봉 동점: order(순번) / remain(잔여 포인트 많은 팀) / random
+ORDER_STRATEGY = "random"           # 경매자 순서: random / tier(티어순) / position(라인 균형) / snake(스네이크)
+ORDER_SEED = None                   # 순서 시드 (None 이면 시작할 때마다 새로 뽑고 저장)
+ORDER_LOOKAHEAD = 3                 # 예고/순서 조회에 보여 줄 다음 경매자 수
 TEAM_LIMIT = 5                      # 팀장 포함 최대 인원
-ENFORCE_SINGLE_CHANNEL = True       # 하나의 채널에서만 진행
-PREVIEW_DELAY_SEC = 5               # 카운트다운 기본값 (초)
\ No newline at end of file
+LEFTOVER_PRICE = 100                # 유찰자 자동 배정가 (최소 입찰가 이하로 두면 예약분 안에서 항상 가능)
+LEFTOVER_AUTO_PREVIEW = True        # 경매 종료 시 남은 유찰자 자동 배정 미리보기 표시
+ENFORCE_SINGLE_CHANNEL = True       # 세션 하나는 하나의 채널에서만 진행
+MAX_CONCURRENT_SESSIONS = 20        # 동시에 진행 가능한 경매 세션(채널) 수
+PREVIEW_DELAY_SEC = 5               # 카운트다운 기본값 (초)
+PREVIEW_COUNTDOWN_MODE = "timestamp"  # timestamp(<t:…:R> 1회 전송) / coarse(k초마다 수정) / tick(1초마다 수정)
+PREVIEW_COUNTDOWN_STEP_SEC = 5      # coarse 모드 수정 간격(초)
+JOURNAL_ENABLED = True              # 세션 상태 저널(크래시 복구) 사용 여부
+JOURNAL_DIR = "data/sessions"       # 세션별 저널/스냅샷 저장 위치
+JOURNAL_FLUSH_INTERVAL_SEC = 0.5    # 저널 배치 기록 간격(초)
+JOURNAL_SNAPSHOT_EVERY = 200        # 이벤트 N건마다 스냅샷으로 압축
+
+OUTBOX_RATE_CAPACITY = 5            # 채널 발신 버킷: OUTBOX_RATE_PER_SEC 초당 최대 전송 수
+OUTBOX_RATE_PER_SEC = 5.0
+OUTBOX_MAX_MESSAGE_LEN = 1900       # 안내를 합칠 때 메시지 1개 최대 길이
+OUTBOX_APPEND_BY_EDIT = True        # 직전 안내 메시지에 이어 붙여 수정(새 메시지 대신)
+OUTBOX_APPEND_WINDOW_SEC = 3.0      # 이어 붙이기 허용 시간(초)
+
+PAGINATOR_PAGE_SIZE = 15            # 조회 결과 한 페이지 줄 수
+PAGINATOR_TIMEOUT_SEC = 300         # 페이지 버튼 유지 시간(초)
+PAGINATOR_MAX_PER_SESSION = 5       # 세션(채널)당 동시에 살아 있는 페이지 뷰 수
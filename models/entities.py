@@ -1,8 +1,45 @@
 from dataclasses import dataclass, field
+from enum import StrEnum
+from itertools import islice
 from typing import Optional, Dict, List
 import datetime
+import sys
 
-@dataclass
+from models.search_index import SearchIndex
+from models.view_format import norm
+import config as CFG
+
+# 화면 표시 줄(fmt_*)에 영향을 주는 필드 — 바뀔 때만 _version 증가 → 렌더 캐시 무효화
+PLAYER_RENDER_FIELDS = frozenset({"status", "won_team", "won_price"})
+CAPTAIN_RENDER_FIELDS = frozenset({"team_name"})
+# 티어/라인/모스트는 값 종류가 적어 행마다 같은 문자열이 반복됨 → 하나의 객체를 공유
+INTERNED_FIELDS = frozenset({"tier", "main_pos", "sub_pos", "most1", "most2", "most3"})
+# 입찰 한도(max_bid)에 영향을 주는 팀장 필드
+BUDGET_FIELDS = frozenset({"total_pts", "used_pts"})
+_MISSING = object()
+
+
+class PlayerStatus(StrEnum):
+    """경매자 상태 — str 이므로 기존 문자열 비교/출력/JSON 과 호환"""
+    WAITING = "대기"
+    ACTIVE = "진행"
+    WON = "낙찰"
+    FAILED = "유찰"
+
+
+def canon(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _bump_on_change(obj, name, value, tracked) -> None:
+    if name in tracked and getattr(obj, name, _MISSING) != value:
+        object.__setattr__(obj, name, value)
+        object.__setattr__(obj, "_version", getattr(obj, "_version", 0) + 1)
+    else:
+        object.__setattr__(obj, name, value)
+
+
+@dataclass(slots=True)
 class Player:
     name: str
     nickname: str
@@ -12,11 +49,27 @@ class Player:
     most1: str
     most2: Optional[str] = None
     most3: Optional[str] = None
-    status: str = "대기"  # 대기, 진행, 낙찰, 유찰
+    status: PlayerStatus = PlayerStatus.WAITING
     won_team: Optional[str] = None
     won_price: Optional[int] = None
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _render_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _owner: Optional["AuctionState"] = field(default=None, init=False, repr=False, compare=False)   # 상태별 집합 갱신용
 
-@dataclass
+    def __setattr__(self, name, value):
+        if name == "status":
+            value = PlayerStatus(value)
+            old = getattr(self, "status", None)
+            _bump_on_change(self, name, value, PLAYER_RENDER_FIELDS)
+            owner = getattr(self, "_owner", None)
+            if owner is not None and old != value:
+                owner._move_status(self.nickname, old, value)
+            return
+        if name in INTERNED_FIELDS:
+            value = canon(value)
+        _bump_on_change(self, name, value, PLAYER_RENDER_FIELDS)
+
+@dataclass(slots=True)
 class Captain:
     team_name: str
     real_name: str
@@ -31,6 +84,18 @@ class Captain:
     total_pts: int = 0
     used_pts: int = 0
     pause_used: int = 0
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _render_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _owner: Optional["AuctionState"] = field(default=None, init=False, repr=False, compare=False)   # 입찰 한도 갱신용
+
+    def __setattr__(self, name, value):
+        if name in INTERNED_FIELDS:
+            value = canon(value)
+        _bump_on_change(self, name, value, CAPTAIN_RENDER_FIELDS)
+        if name in BUDGET_FIELDS:
+            owner = getattr(self, "_owner", None)
+            if owner is not None:
+                owner._refresh_max_bid(self.nickname)
 
     @property
     def remain_pts(self) -> int:
@@ -45,20 +110,47 @@ class Team:
     def can_add(self) -> bool:
         return len(self.members) + 1 < self.limit
 
+    def open_slots(self) -> int:
+        """팀장 제외 남은 자리 수"""
+        return max(0, self.limit - 1 - len(self.members))
+
 @dataclass
 class AuctionState:
     total_teams: int = 0
     started: bool = False
     strategy_called: bool = False
     channel_id: Optional[int] = None
+    phase: str = "main"   # main(본 경매) → reauction(유찰자 재경매) → done
+    lot_mode: Optional[str] = None   # sequential / sealed, None 이면 config.LOT_MODE
 
     players: Dict[str, Player] = field(default_factory=dict)
     captains: Dict[str, Captain] = field(default_factory=dict)
     teams: Dict[str, Team] = field(default_factory=dict)
-    captain_user_map: Dict[int, str] = field(default_factory=dict) 
+    captain_user_map: Dict[int, str] = field(default_factory=dict)   # user_id → 팀장 닉
+    user_by_captain: Dict[str, int] = field(default_factory=dict)    # 팀장 닉 → user_id (역색인)
+    search: SearchIndex = field(default_factory=SearchIndex, repr=False, compare=False)   # !조회 참가자 색인
+
+    # 증분 집계 — 낙찰/유찰/초기화 때 갱신되어 매 매물마다 전체를 훑지 않음
+    players_by_status: Dict[PlayerStatus, Dict[str, None]] = field(
+        default_factory=lambda: {s: {} for s in PlayerStatus}, repr=False, compare=False,
+    )   # 상태 → 닉 (등록/변경 순서를 유지하는 집합)
+    open_team_count: int = field(default=0, repr=False, compare=False)          # 자리가 남은 팀 수
+    teams_with_member_count: int = field(default=0, repr=False, compare=False)  # 팀원이 1명 이상인 팀 수
+
+    # 입찰 한도 — 잔여 포인트 − 최소 입찰가 × (이번 자리를 뺀 남은 자리 수)
+    # 남은 자리를 최소 입찰가로라도 채울 수 있게 예약분을 남겨 둠. 포인트/팀원이 바뀔 때만 다시 계산
+    reserve_unit: int = field(default=CFG.BASE_BID, repr=False, compare=False)
+    max_bid_by_captain: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
+    # 대리(최대) 입찰 — 팀장 닉 → {경매자 닉 / 정규화된 티어: 상한}
+    proxy_by_player: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    proxy_by_tier: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
     player_order: List[str] = field(default_factory=list)
     captain_order: List[str] = field(default_factory=list)
+    order_strategy: str = "random"    # 경매자 순서 전략 (services/ordering.py)
+    order_seed: Optional[int] = None  # 같은 시드 → 같은 순서
+    reauction_rank: Dict[str, int] = field(default_factory=dict)   # 시작 때 미리 정한 재경매 순위
     current_player_idx: int = -1
     current_captain_idx: int = 0
 
@@ -67,6 +159,121 @@ class AuctionState:
     paused_until: Optional[datetime.datetime] = None
     pause_owner: Optional[str] = None
 
+    def put_player(self, p: Player):
+        old = self.players.get(p.nickname)
+        if old is not None:
+            self.players_by_status[old.status].pop(old.nickname, None)
+            old._owner = None
+        self.players[p.nickname] = p
+        p._owner = self
+        self.players_by_status[p.status][p.nickname] = None
+        self.search.add_player(p)
+
+    def _move_status(self, nick: str, old: Optional[PlayerStatus], new: PlayerStatus):
+        if old is not None:
+            self.players_by_status[old].pop(nick, None)
+        self.players_by_status[new][nick] = None
+
+    def nicks_with_status(self, status: PlayerStatus):
+        """해당 상태의 경매자 닉 (읽기 전용 뷰 — 순회 중 상태를 바꿀 거면 list 로 복사)"""
+        return self.players_by_status[status].keys()
+
+    def count_status(self, status: PlayerStatus) -> int:
+        return len(self.players_by_status[status])
+
+    def put_captain(self, c: Captain):
+        old = self.captains.get(c.nickname)
+        if old is not None:
+            old._owner = None
+        self.captains[c.nickname] = c
+        c._owner = self
+        self._refresh_max_bid(c.nickname)
+        self.search.add_captain(c)
+
+    def _refresh_max_bid(self, c_nick: str):
+        cap = self.captains.get(c_nick)
+        if cap is None:
+            return
+        team = self.teams.get(c_nick)
+        if team is None:
+            self.max_bid_by_captain[c_nick] = cap.remain_pts
+            return
+        slots = team.open_slots()
+        reserve = self.reserve_unit * max(0, slots - 1)
+        self.max_bid_by_captain[c_nick] = max(0, cap.remain_pts - reserve) if slots else 0
+
+    def max_bid(self, c_nick: str) -> int:
+        """이번 매물에 낼 수 있는 최대 금액 (남은 자리 예약분 제외)"""
+        return self.max_bid_by_captain.get(c_nick, 0)
+
+    def set_reserve_unit(self, unit: int):
+        self.reserve_unit = unit
+        for c_nick in self.captains:
+            self._refresh_max_bid(c_nick)
+
+    def set_proxy(self, captain_nick: str, kind: str, target: str, limit: Optional[int]):
+        """kind: player / tier, limit 이 None 이면 해제"""
+        table = self.proxy_by_player if kind == "player" else self.proxy_by_tier
+        key = target if kind == "player" else norm(target)
+        bucket = table.setdefault(captain_nick, {})
+        if limit is None:
+            bucket.pop(key, None)
+        else:
+            bucket[key] = limit
+        if not bucket:
+            del table[captain_nick]
+
+    def proxy_limit(self, captain_nick: str, player: Player) -> Optional[int]:
+        """경매자 지정 상한이 티어 상한보다 우선"""
+        limit = self.proxy_by_player.get(captain_nick, {}).get(player.nickname)
+        if limit is None:
+            limit = self.proxy_by_tier.get(captain_nick, {}).get(norm(player.tier))
+        return limit
+
+    def clear_player_proxies(self, player_nick: str):
+        """매물이 끝나면 그 경매자에게 걸린 개별 대리 입찰은 소진"""
+        if not self.proxy_by_player:
+            return
+        for c_nick in [c for c, bucket in self.proxy_by_player.items() if player_nick in bucket]:
+            self.set_proxy(c_nick, "player", player_nick, None)
+
+    def put_team(self, team: Team):
+        old = self.teams.get(team.captain_nick)
+        if old is not None:
+            self._count_team(old, -1)
+        self.teams[team.captain_nick] = team
+        self._count_team(team, +1)
+        self._refresh_max_bid(team.captain_nick)
+
+    def add_member(self, captain_nick: str, player_nick: str):
+        team = self.teams[captain_nick]
+        self._count_team(team, -1)
+        team.members.append(player_nick)
+        self._count_team(team, +1)
+        self._refresh_max_bid(captain_nick)
+
+    def _count_team(self, team: Team, sign: int):
+        if team.can_add():
+            self.open_team_count += sign
+        if team.members:
+            self.teams_with_member_count += sign
+
+    def any_team_can_add(self) -> bool:
+        return self.open_team_count > 0
+
+    def upcoming(self, n: int) -> List[str]:
+        """현재 경매자 다음으로 나올 대기 중 경매자 n명 (본 경매 순서 안에서)"""
+        out: List[str] = []
+        if n <= 0:
+            return out
+        waiting = self.players_by_status[PlayerStatus.WAITING]
+        for nick in islice(self.player_order, max(0, self.current_player_idx + 1), None):
+            if nick in waiting:
+                out.append(nick)
+                if len(out) >= n:
+                    break
+        return out
+
     def reset_round(self):
         self.current_bid = 0
         self.current_bidder = None
@@ -74,9 +281,24 @@ class AuctionState:
         self.paused_until = None
         self.pause_owner = None
 
+    def bind_captain_user(self, user_id: int, captain_nick: str):
+        """user_id ↔ 팀장 닉 양방향 매핑 갱신 (재바인딩 시 이전 연결은 양쪽 모두 해제)"""
+        old_nick = self.captain_user_map.pop(user_id, None)
+        if old_nick is not None and self.user_by_captain.get(old_nick) == user_id:
+            del self.user_by_captain[old_nick]
+        old_uid = self.user_by_captain.pop(captain_nick, None)
+        if old_uid is not None:
+            self.captain_user_map.pop(old_uid, None)
+        self.captain_user_map[user_id] = captain_nick
+        self.user_by_captain[captain_nick] = user_id
+
+    def unbind_captain(self, captain_nick: str):
+        uid = self.user_by_captain.pop(captain_nick, None)
+        if uid is not None:
+            self.captain_user_map.pop(uid, None)
+
+    def user_id_for(self, captain_nick: str) -> Optional[int]:
+        return self.user_by_captain.get(captain_nick)
+
     def everyone_has_member(self) -> bool:
-        for c_nick in self.captains.keys():
-            team = self.teams.get(c_nick)
-            if not team or len(team.members) == 0:
-                return False
-        return True
+        return self.teams_with_member_count >= len(self.captains)
@@ -0,0 +1,196 @@
+# models/search_index.py
+"""
+참가자 검색 색인 (!조회 참가자)
+- 등록 시점에 한 번만 정규화해서 색인 → 조회 때마다 전체를 훑지 않음
+- 닉네임/이름 완전일치: dict
+- 부분일치: 바이그램(1글자 질의는 유니그램) 중 가장 드문 두 게시 목록의 교집합만 substring 확인
+- 초성 검색: 한글 음절을 초성으로 바꾼 문자열을 같은 방식으로 색인 (예: `ㅎㄱㄷ` → 홍길동)
+- 결과는 (일치 종류, 필드 길이, 등록 순서) 로 정렬
+"""
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models.view_format import norm
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = set(CHOSEONG)
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+
+# 정렬 순위 (작을수록 먼저)
+RANK_EXACT_NICK = 0
+RANK_EXACT_NAME = 1
+RANK_PREFIX = 2
+RANK_SUBSTRING = 3
+RANK_CHOSEONG_PREFIX = 4
+RANK_CHOSEONG = 5
+
+Ref = Tuple[str, str]   # ("player" | "captain", 닉네임)
+
+
+def to_choseong(s: str) -> str:
+    """한글 음절 → 초성, 나머지 글자는 그대로 (이미 정규화된 문자열 기준)"""
+    out = []
+    for ch in s:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(CHOSEONG[(code - _HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_choseong_query(q: str) -> bool:
+    """초성 자모가 하나 이상 있고 한글 음절이 없으면 초성 질의로 봄"""
+    has_jamo = False
+    for ch in q:
+        if ch in _CHOSEONG_SET:
+            has_jamo = True
+        elif _HANGUL_BASE <= ord(ch) <= _HANGUL_LAST:
+            return False
+    return has_jamo
+
+
+def _grams(s: str) -> Set[str]:
+    if len(s) < 2:
+        return {s} if s else set()
+    return {s[i:i + 2] for i in range(len(s) - 1)}
+
+
+class _GramIndex:
+    """문자열 필드 → 참조 (유니그램 + 바이그램 게시 목록)"""
+    def __init__(self):
+        self.postings: Dict[str, Set[Ref]] = defaultdict(set)
+
+    @staticmethod
+    def _keys(s: str) -> Set[str]:
+        return set(s) | _grams(s)
+
+    def add(self, ref: Ref, s: str) -> None:
+        for g in self._keys(s):
+            self.postings[g].add(ref)
+
+    def remove(self, ref: Ref, s: str) -> None:
+        for g in self._keys(s):
+            bucket = self.postings.get(g)
+            if bucket is not None:
+                bucket.discard(ref)
+                if not bucket:
+                    del self.postings[g]
+
+    def candidates(self, q: str) -> Set[Ref]:
+        """가장 드문 두 그램의 교집합 (최종 확인은 호출 쪽 substring 검사)"""
+        buckets = []
+        for g in _grams(q):
+            bucket = self.postings.get(g)
+            if not bucket:
+                return set()
+            buckets.append(bucket)
+        if not buckets:
+            return set()
+        buckets.sort(key=len)
+        return buckets[0] & buckets[1] if len(buckets) > 1 else buckets[0]
+
+
+class SearchIndex:
+    def __init__(self):
+        self._seq = 0
+        self._order: Dict[Ref, int] = {}                 # 등록 순서 (동점 정렬용)
+        self._fields: Dict[Ref, Tuple[str, ...]] = {}    # 정규화된 검색 필드
+        self._choseong: Dict[Ref, Tuple[str, ...]] = {}
+        self._by_nick: Dict[str, Set[Ref]] = defaultdict(set)
+        self._by_name: Dict[str, Set[Ref]] = defaultdict(set)
+        self._grams = _GramIndex()
+        self._cho_grams = _GramIndex()
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    # ── 갱신 ──
+    def add_player(self, p) -> None:
+        self._add(("player", p.nickname), p.nickname, p.name, ())
+
+    def add_captain(self, c) -> None:
+        self._add(("captain", c.nickname), c.nickname, c.real_name, (c.team_name,))
+
+    def remove(self, kind: str, nick: str) -> None:
+        ref = (kind, nick)
+        fields = self._fields.pop(ref, None)
+        if fields is None:
+            return
+        nick_n, name_n = fields[0], fields[1]
+        self._discard(self._by_nick, nick_n, ref)
+        self._discard(self._by_name, name_n, ref)
+        for f in fields:
+            self._grams.remove(ref, f)
+        for f in self._choseong.pop(ref):
+            self._cho_grams.remove(ref, f)
+        self._order.pop(ref, None)
+
+    def _add(self, ref: Ref, nick: str, name: str, extra: Iterable[str]) -> None:
+        self.remove(*ref)   # 같은 닉 재등록 = 덮어쓰기
+        fields = tuple(norm(s) for s in (nick, name, *extra))
+        self._fields[ref] = fields
+        self._by_nick[fields[0]].add(ref)
+        self._by_name[fields[1]].add(ref)
+        for f in fields:
+            self._grams.add(ref, f)
+        cho = tuple(to_choseong(f) for f in fields)
+        self._choseong[ref] = cho
+        for f in cho:
+            self._cho_grams.add(ref, f)
+        self._seq += 1
+        self._order[ref] = self._seq
+
+    @staticmethod
+    def _discard(table: Dict[str, Set[Ref]], key: str, ref: Ref) -> None:
+        bucket = table.get(key)
+        if bucket is not None:
+            bucket.discard(ref)
+            if not bucket:
+                del table[key]
+
+    # ── 조회 ──
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, str, str]]:
+        """(순위, 종류, 닉네임) 목록 — 순위가 낮을수록 정확한 일치, 완전일치가 있으면 완전일치만"""
+        q = norm(query)
+        if not q:
+            return []
+        best: Dict[Ref, Tuple[int, int]] = {}
+
+        def offer(ref: Ref, rank: int, length: int):
+            cur = best.get(ref)
+            if cur is None or (rank, length) < cur:
+                best[ref] = (rank, length)
+
+        for ref in self._by_nick.get(q, ()):
+            offer(ref, RANK_EXACT_NICK, len(q))
+        for ref in self._by_name.get(q, ()):
+            offer(ref, RANK_EXACT_NAME, len(q))
+        if best:
+            # 완전일치가 있으면 부분일치는 훑지 않음 (관전자 반복 조회의 대부분)
+            return self._ranked(best, limit)
+
+        for ref in self._grams.candidates(q):
+            for f in self._fields[ref]:
+                if f.startswith(q):
+                    offer(ref, RANK_PREFIX, len(f))
+                elif q in f:
+                    offer(ref, RANK_SUBSTRING, len(f))
+
+        if is_choseong_query(q):
+            for ref in self._cho_grams.candidates(q):
+                for f in self._choseong[ref]:
+                    if f.startswith(q):
+                        offer(ref, RANK_CHOSEONG_PREFIX, len(f))
+                    elif q in f:
+                        offer(ref, RANK_CHOSEONG, len(f))
+
+        return self._ranked(best, limit)
+
+    def _ranked(self, best: Dict[Ref, Tuple[int, int]], limit: Optional[int]) -> List[Tuple[int, str, str]]:
+        key = lambda kv: (kv[1][0], kv[1][1], self._order[kv[0]])
+        ranked = heapq.nsmallest(limit, best.items(), key=key) if limit else sorted(best.items(), key=key)
+        return [(rank, kind, nick) for (kind, nick), (rank, _) in ranked]
@@ -0,0 +1,33 @@
+# models/tiers.py
+"""티어 문자열 → 비교용 점수 (유찰자 배정, 경매 순서 전략에서 사용)"""
+import re
+from typing import Optional
+
+from models.view_format import norm
+
+# 티어 점수 (높을수록 강함) — 영문/한글/약어 모두 허용, 모르는 티어는 평균으로 취급
+TIER_SCORE = {
+    "iron": 1, "아이언": 1, "i": 1,
+    "bronze": 2, "브론즈": 2, "b": 2,
+    "silver": 3, "실버": 3, "s": 3,
+    "gold": 4, "골드": 4, "g": 4,
+    "platinum": 5, "플래티넘": 5, "플레": 5, "플레티넘": 5, "p": 5,
+    "emerald": 6, "에메랄드": 6, "에메": 6, "e": 6,
+    "diamond": 7, "다이아": 7, "다이아몬드": 7, "d": 7,
+    "master": 8, "마스터": 8, "m": 8,
+    "grandmaster": 9, "그랜드마스터": 9, "그마": 9, "gm": 9,
+    "challenger": 10, "챌린저": 10, "챌": 10, "c": 10,
+}
+_TIER_RE = re.compile(r"^([^\d\s]+)\s*(\d*)")
+
+
+def tier_score(tier: Optional[str]) -> Optional[float]:
+    """'Gold' / '골드' / 'D2' → 점수 (같은 티어 안 숫자는 낮을수록 높게 0.1 단위 보정)"""
+    m = _TIER_RE.match(norm(tier))
+    if not m:
+        return None
+    base = TIER_SCORE.get(m.group(1))
+    if base is None:
+        return None
+    div = int(m.group(2)) if m.group(2) else 0
+    return base + (0.1 * (4 - div) if 1 <= div <= 4 else 0)
@@ -1,6 +1,8 @@
 # models/view_format.py
 from __future__ import annotations
 
+from utils.format import render_cached
+
 def norm(s: str) -> str:
     return (s or "").strip().lower()
 
@@ -8,6 +10,9 @@ def fmt_captain_line(c_nick: str, cap) -> str:
     """
     팀장: [{팀명}](팀장) 닉네임(이름) / 티어 / 주 라인 / 부 라인
     """
+    return render_cached(cap, ("captain", c_nick), _build_captain_line, c_nick, cap)
+
+def _build_captain_line(c_nick: str, cap) -> str:
     team = getattr(cap, "team_name", "")
     real = getattr(cap, "real_name", "")
     tier = getattr(cap, "tier", "")
@@ -19,6 +24,9 @@ def fmt_player_as_won(p) -> str:
     """
     낙찰 된 팀원: [팀명] 닉네임(이름) / 티어 / 주 라인 / 부 라인 (낙찰P)
     """
+    return render_cached(p, "player_as_won", _build_player_as_won, p)
+
+def _build_player_as_won(p) -> str:
     name = getattr(p, "name", "")
     nick = getattr(p, "nickname", "")
     tier = getattr(p, "tier", "")
@@ -33,6 +41,9 @@ def fmt_player_as_other(p) -> str:
     """
     그 외 경매자: 닉네임(이름) / 티어 / 주 라인 / 부 라인 (현 상태)
     """
+    return render_cached(p, "player_as_other", _build_player_as_other, p)
+
+def _build_player_as_other(p) -> str:
     name = getattr(p, "name", "")
     nick = getattr(p, "nickname", "")
     tier = getattr(p, "tier", "")
@@ -0,0 +1,110 @@
+# services/actor.py
+"""
+세션 actor — 경매 진행 중 상태 변경을 한 줄로 세우는 명령 큐
+- 버튼/텍스트/명령어는 상태를 직접 바꾸지 않고 명령을 넣기만 함 (submit)
+- 소비자는 run_loop 하나뿐: 차례 대기, 퍼즈 대기, 예고/전략 타임 대기 중에 명령을 꺼내 순서대로 반영
+  → 인터랙션 콜백이 루프와 엇갈려 상태를 바꾸는 일이 없음
+- 경매가 진행 중이 아니면(소비자 없음) AuctionService 가 명령을 그 자리에서 바로 반영
+- Turn / Lot: 진행 중 차례·매물을 나타내는 타입 (세션에 임시 속성을 붙이지 않음)
+"""
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Tuple
+
+
+# ───────────────────────── 명령 ─────────────────────────
+@dataclass(frozen=True)
+class TurnInput:
+    """차례 입력 — action: bid / pass / no_interest / timeout / None(잘못된 입력)"""
+    turn_id: int
+    captain: str
+    action: Optional[str]
+    amount: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class PauseCommand:
+    """
+    퍼즈 (버튼/텍스트 공통) — 차례를 넘기지 않고 퍼즈만 시작
+    - reply: 거절 사유(busy/exhausted/not_turn) 또는 None
+    - reply 가 없으면(텍스트 `!퍼즈`) 거절 사유를 공개 안내
+    """
+    captain: str
+    reply: Optional[asyncio.Future] = None
+
+
+@dataclass(frozen=True)
+class UnpauseCommand:
+    """퍼즈 해제 — 퍼즈를 건 팀장만, reply: 해제 여부"""
+    captain: str
+    reply: Optional[asyncio.Future] = None
+
+
+@dataclass(frozen=True)
+class Call:
+    """등록/설정 등 일반 상태 변경 — fn(*args) 결과(또는 예외)를 reply 로 돌려줌"""
+    fn: Callable[..., Any]
+    args: Tuple = ()
+    reply: Optional[asyncio.Future] = None
+
+
+# ───────────────────────── 진행 중 차례/매물 ─────────────────────────
+@dataclass
+class Lot:
+    seq: int
+    player: str
+    engine: Any   # LotEngine / SealedLotEngine
+    message: Any = field(default=None, repr=False)   # 차례 메시지 (매물마다 1개, 차례가 넘어가면 수정)
+
+
+@dataclass
+class Turn:
+    """
+    입력을 기다리는 차례 1개 (순차 입찰: 팀장 1명, 밀봉 입찰: captain=None 으로 매물 전체)
+    - future: 버튼 패널이 결과를 넣는 자리 → 완료되면 TurnInput 으로 큐에 들어감
+    - deadline: 이벤트 루프 시각 (퍼즈 동안은 연장)
+    """
+    seq: int
+    captain: Optional[str]
+    user_id: Optional[int]
+    deadline: float
+    future: asyncio.Future = field(repr=False)
+    message: Any = field(default=None, repr=False)   # 차례 안내 메시지
+
+
+class SessionActor:
+    def __init__(self):
+        self.queue: "asyncio.Queue" = asyncio.Queue()
+        self._seq = itertools.count(1)
+
+    def submit(self, cmd) -> None:
+        self.queue.put_nowait(cmd)
+
+    async def receive(self, timeout: Optional[float]):
+        """명령 1개 (timeout 초 안에 없으면 None)"""
+        if timeout is None:
+            return await self.queue.get()
+        if timeout <= 0:
+            return self.queue.get_nowait() if not self.queue.empty() else None
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def next_seq(self) -> int:
+        return next(self._seq)
+
+    def open_turn(self, captain: Optional[str], user_id: Optional[int], timeout_sec: float) -> Turn:
+        """새 차례 — 버튼 결과(future)가 정해지면 자동으로 TurnInput 을 큐에 넣음"""
+        loop = asyncio.get_running_loop()
+        turn = Turn(self.next_seq(), captain, user_id, loop.time() + timeout_sec, loop.create_future())
+
+        def forward(fut: asyncio.Future):
+            if fut.cancelled() or captain is None:
+                return
+            action, amount = fut.result()
+            self.submit(TurnInput(turn.seq, captain, action, amount))
+
+        turn.future.add_done_callback(forward)
+        return turn
@@ -0,0 +1,211 @@
+# services/allocator.py
+"""
+유찰자 자동 배정 (재경매 후에도 남은 유찰자 → 자리가 남은 팀)
+- 라운드마다 자리가 남은 팀당 칸 하나씩 유찰자 × 팀 비용 행렬을 만들고 헝가리안 알고리즘으로 최소 비용 배정
+- 비용 = 라인 중복(주/부 라인이 이미 팀에 있는지) + 티어 균형(강한 선수는 약한 팀으로)
+- 다음 라운드 비용은 앞 라운드 배정까지 반영 → 같은 팀의 n번째 같은 라인 선수일수록 비싸짐
+  (라운드 단위 탐욕 근사 — 전체 최적은 아니지만 한 팀에 같은 라인이 몰리지 않음)
+- 배정가는 LEFTOVER_PRICE (기본 최소 입찰가) — 입찰 한도의 예약분으로 항상 낼 수 있음
+- plan_leftovers() 는 상태를 바꾸지 않음 → 미리보기 후 AuctionService.commit_allocation() 으로 확정
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from models.entities import AuctionState, PlayerStatus
+from models.tiers import tier_score
+from models.view_format import norm
+import config as CFG
+
+POS_MAIN_TAKEN = 1.0    # 주 라인이 이미 팀에 있음
+POS_BOTH_TAKEN = 2.0    # 주/부 라인 모두 이미 팀에 있음
+TIER_WEIGHT = 1.0       # 티어 균형 가중치 (라인 비용 1 ≈ 티어 편차 1단계)
+
+
+@dataclass
+class Allocation:
+    player: str
+    captain: str
+    price: int
+
+
+@dataclass
+class AllocationPlan:
+    price: int
+    assignments: List[Allocation] = field(default_factory=list)
+    unassigned: List[str] = field(default_factory=list)   # 자리가 모자라 남는 유찰자
+    cost: float = 0.0
+
+    def __bool__(self) -> bool:
+        return bool(self.assignments)
+
+    def preview(self, state: AuctionState, limit: int) -> str:
+        """팀별 배정 미리보기 (limit 글자를 넘으면 뒷부분은 개수만 표시)"""
+        head = f"🧩 **유찰자 자동 배정 미리보기** — {len(self.assignments)}명, 1명당 {self.price}P"
+        lines = [head]
+        for a in self.assignments:
+            p = state.players[a.player]
+            team = state.captains[a.captain].team_name
+            lines.append(f"[{team}] {p.nickname}({p.name}) / {p.tier} / {p.main_pos} / {p.sub_pos}")
+        tail = f"\n배정할 자리가 없어 남는 유찰자 {len(self.unassigned)}명" if self.unassigned else ""
+        text, shown = lines[0], 0
+        for line in lines[1:]:
+            if len(text) + len(line) + len(tail) + 20 > limit:
+                break
+            text += "\n" + line
+            shown += 1
+        if shown < len(self.assignments):
+            text += f"\n… 외 {len(self.assignments) - shown}명"
+        return text + tail
+
+
+# ───────────────────────── 헝가리안 ─────────────────────────
+def hungarian(cost: Sequence[Sequence[float]]) -> List[int]:
+    """
+    최소 비용 배정 (행 수 ≤ 열 수), 행마다 배정된 열 번호를 반환
+    - 퍼텐셜(u, v)을 쓰는 O(n²·m) 구현, 외부 라이브러리 없음
+    """
+    n = len(cost)
+    if n == 0:
+        return []
+    m = len(cost[0])
+    if n > m:
+        raise ValueError("행 수가 열 수보다 많습니다.")
+    inf = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)   # 열 j(1-base) → 행(1-base), 0 이면 비어 있음
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta, j1 = inf, 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+    result = [0] * n
+    for j in range(1, m + 1):
+        if match[j]:
+            result[match[j] - 1] = j - 1
+    return result
+
+
+# ───────────────────────── 배정 계획 ─────────────────────────
+def plan_leftovers(state: AuctionState, price: Optional[int] = None) -> AllocationPlan:
+    price = CFG.LEFTOVER_PRICE if price is None else price
+    plan = AllocationPlan(price=price)
+    players = [state.players[n] for n in state.nicks_with_status(PlayerStatus.FAILED)]
+    if not players:
+        return plan
+
+    # 팀별 현재 라인/티어 (팀장 포함)
+    team_order: List[str] = []
+    slots_left: Dict[str, int] = {}   # 팀장 닉 → 남은 칸 수
+    team_pos: Dict[str, set] = {}
+    team_scores: Dict[str, List[float]] = {}
+    team_strength: Dict[str, Optional[float]] = {}
+    for c_nick in state.captain_order or list(state.captains):
+        team = state.teams.get(c_nick)
+        if team is None or not team.can_add() or state.max_bid(c_nick) < price:
+            continue
+        # 예약분이 있으므로 보통 남은 자리 전부, 포인트가 모자란 팀은 낼 수 있는 만큼만
+        n_slots = team.open_slots()
+        if price:
+            n_slots = min(n_slots, state.captains[c_nick].remain_pts // price)
+        if n_slots <= 0:
+            continue
+        roster = [state.captains[c_nick]] + [state.players[m] for m in team.members if m in state.players]
+        team_pos[c_nick] = {norm(x.main_pos) for x in roster}
+        scores = [s for s in (tier_score(x.tier) for x in roster) if s is not None]
+        team_scores[c_nick] = scores
+        team_strength[c_nick] = sum(scores) / len(scores) if scores else None
+        team_order.append(c_nick)
+        slots_left[c_nick] = n_slots
+    if not slots_left:
+        plan.unassigned = [p.nickname for p in players]
+        return plan
+
+    p_scores = [tier_score(p.tier) for p in players]
+    known = [s for s in p_scores if s is not None]
+    p_mean = sum(known) / len(known) if known else 0.0
+    p_dev = [(s - p_mean) if s is not None else 0.0 for s in p_scores]
+
+    # 라운드마다 팀당 칸 하나 — 앞 라운드에서 받은 유찰자의 라인/티어를 반영해 다음 칸 비용을 매김
+    # (한 번에 모든 칸을 풀면 같은 라인 유찰자 둘이 그 라인 하나만 필요한 팀에 함께 배정될 수 있음)
+    rank = {c_nick: i for i, c_nick in enumerate(team_order)}
+    remaining = list(range(len(players)))
+    picked: List[tuple] = []   # (팀 순번, 라운드, 유찰자, 팀장 닉)
+    round_no = 0
+    while remaining:
+        teams = [c for c in team_order if slots_left[c] > 0]
+        if not teams:
+            break   # 자리가 다 찼음 → 나머지는 unassigned
+        t_known = [s for s in (team_strength[c] for c in teams) if s is not None]
+        t_mean = sum(t_known) / len(t_known) if t_known else 0.0
+
+        team_cost = []   # 팀 × 남은 유찰자
+        for c_nick in teams:
+            taken = team_pos[c_nick]
+            strength = team_strength[c_nick]
+            t_dev = (strength - t_mean) if strength is not None else 0.0
+            col = []
+            for pi in remaining:
+                p = players[pi]
+                if norm(p.main_pos) not in taken:
+                    pos = 0.0
+                elif norm(p.sub_pos) not in taken:
+                    pos = POS_MAIN_TAKEN
+                else:
+                    pos = POS_BOTH_TAKEN
+                # 강한 선수(dev>0) → 강한 팀(t_dev>0) 이면 비용 증가, 약한 팀이면 감소
+                col.append(pos + TIER_WEIGHT * p_dev[pi] * t_dev)
+            team_cost.append(col)
+
+        if len(teams) <= len(remaining):
+            pairs = [(ri, ti) for ti, ri in enumerate(hungarian(team_cost))]   # 팀마다 유찰자 하나
+        else:
+            by_player = [list(col) for col in zip(*team_cost)]   # 유찰자 × 팀
+            pairs = list(enumerate(hungarian(by_player)))
+
+        for ri, ti in pairs:
+            pi, c_nick = remaining[ri], teams[ti]
+            p = players[pi]
+            plan.cost += team_cost[ti][ri]
+            picked.append((rank[c_nick], round_no, pi, c_nick))
+            slots_left[c_nick] -= 1
+            team_pos[c_nick].add(norm(p.main_pos))
+            if p_scores[pi] is not None:
+                team_scores[c_nick].append(p_scores[pi])
+                team_strength[c_nick] = sum(team_scores[c_nick]) / len(team_scores[c_nick])
+        done = {remaining[ri] for ri, _ in pairs}
+        remaining = [pi for pi in remaining if pi not in done]
+        round_no += 1
+
+    for _, _, pi, c_nick in sorted(picked):   # 팀 순번 → 라운드 순
+        plan.assignments.append(Allocation(players[pi].nickname, c_nick, price))
+    plan.unassigned = [players[pi].nickname for pi in remaining]
+    return plan
@@ -1,23 +1,79 @@
 import asyncio
 import csv
 import io
-import random
+import time
 import datetime
+import functools
 from typing import Optional
 import discord
 
-from models.entities import AuctionState, Player, Captain, Team
+from models.entities import AuctionState, Player, PlayerStatus, Captain, Team
 from utils.format import fmt_player_line, norm_optional
-from components.open_panel import OpenPanelLauncher
+from components.turn_panel import TurnControlView, quick_amounts
+from components.bid_panel import BidPanelRegistry, over_limit_text
+from components.sealed_panel import SealedBidLauncher
+from components.paginator import PaginatorRegistry
+from services.engine import (
+    DraftEngine, LotEngine, SealedLotEngine, apply_award,
+    Bid, Pass, NoInterest, Timeout, Skip,
+    RoundStarted, AutoFailed, LotOpened, TurnPrompt, BidAccepted, BidRejected,
+    SealedBidReceived, SealedRevealed, Passed, TimedOut, NoInterestMarked, Awarded, Failed, ProxyResolved,
+    StrategyTime, DraftFinished,
+)
+from services.allocator import AllocationPlan, plan_leftovers
+from services.ordering import resolve_strategy
+from components.allocation_view import AllocationConfirmView
+from services.journal import SessionJournal
+from services.outbox import ChannelOutbox
+from services.message_router import MessageRouter, turn_router
+from services.actor import SessionActor, Lot, Turn, TurnInput, PauseCommand, UnpauseCommand, Call
 import config as CFG
 
+LOT_MODES = ("sequential", "sealed")
+PRICE_RULE_LABEL = {"first": "최고 입찰가", "second": "2위 입찰가"}
+PAUSE_REJECT_TEXT = {
+    "busy": "이미 누군가 퍼즈 중입니다.",
+    "exhausted": "퍼즈 횟수를 모두 사용했습니다.",
+    "not_turn": "지금은 퍼즈할 수 없습니다. (본인 차례가 아님)",
+}
+
+async def _delete_quietly(msg):
+    try:
+        await msg.delete()
+    except Exception:
+        pass
+
 class AuctionService:
     def __init__(self):
         self.state = AuctionState()
-        
+        self.journal: Optional[SessionJournal] = None
+        self.running = False   # run_loop 진행 중 여부 (재개 중복 방지)
+        self.actor = SessionActor()         # 진행 중 상태 변경 명령 큐 (소비자: run_loop)
+        self.run_task: Optional[asyncio.Task] = None
+        self.lot: Optional[Lot] = None      # 진행 중 매물
+        self.turn: Optional[Turn] = None    # 입력을 기다리는 차례
+        self.outbox: Optional[ChannelOutbox] = None   # run_loop 동안의 채널 발신 큐
+        self.paginators = PaginatorRegistry()          # 조회 결과 페이지 뷰 (세션당 개수 제한)
+        self.router: MessageRouter = turn_router       # 텍스트 차례 입력 (봇 전체 공용)
+        self.bid_panels = BidPanelRegistry()           # 열린 상시 입찰 패널 (최고가/한도 실시간 반영)
+
     def reset_all(self):
         """경매 전체 상태 초기화"""
         self.state = AuctionState()
+        self._log("reset")
+
+    # ───────────────────────── 저널(크래시 복구) ─────────────────────────
+    def attach_journal(self, journal: SessionJournal) -> bool:
+        """저널 연결 + 디스크에 남은 상태 복구. 복구된 내용이 있으면 True"""
+        self.journal = journal
+        return journal.load(self)
+
+    def _log(self, kind: str, **data):
+        if self.journal is not None:
+            self.journal.record(kind, **data)
+
+    def can_resume(self) -> bool:
+        return self.state.started and self.state.phase != "done" and not self.running
 
     def ensure_channel(self, channel_id: int) -> bool:
         if not CFG.ENFORCE_SINGLE_CHANNEL:
@@ -46,8 +102,12 @@ class AuctionService:
             cap.total_pts = init_pts
             cap.used_pts = 0  # 신규 등록이므로 0
 
-        self.state.captains[nick] = cap
-        self.state.teams[nick] = Team(captain_nick=nick, limit=team_limit or CFG.TEAM_LIMIT)
+        self.state.put_captain(cap)
+        self.state.put_team(Team(captain_nick=nick, limit=team_limit or CFG.TEAM_LIMIT))
+        self._log("captain", data=dict(
+            team_name=team_name, real_name=real_name, nick=nick, tier=tier, main_p=main_p, sub_p=sub_p,
+            m1=m1, m2=m2, m3=m3, init_pts=init_pts, team_limit=team_limit,
+        ))
 
     def add_player(self, name, nick, tier, main_p, sub_p, m1, m2=None, m3=None):
         m1 = norm_optional(m1)
@@ -55,9 +115,26 @@ class AuctionService:
         m3 = norm_optional(m3)
         if not (name and nick and tier and main_p and sub_p and m1):
             raise ValueError("필수 항목 누락")
-        self.state.players[nick] = Player(name, nick, tier, main_p, sub_p, m1, m2, m3)
-
-    def start_auction(self, channel_id: int, total_teams: int, initial_points: int):
+        self.state.put_player(Player(name, nick, tier, main_p, sub_p, m1, m2, m3))
+        self._log("player", data=dict(
+            name=name, nick=nick, tier=tier, main_p=main_p, sub_p=sub_p, m1=m1, m2=m2, m3=m3,
+        ))
+
+    @property
+    def lot_mode(self) -> str:
+        return self.state.lot_mode or CFG.LOT_MODE
+
+    def set_lot_mode(self, mode: str):
+        """매물 진행 방식 변경 — 다음 매물부터 적용"""
+        if mode not in LOT_MODES:
+            raise ValueError("진행 방식은 sequential / sealed 중 하나여야 합니다.")
+        self.state.lot_mode = mode
+        self._log("mode", mode=mode)
+
+    def start_auction(
+        self, channel_id: int, total_teams: int, initial_points: int,
+        strategy: str | None = None, seed: int | None = None,
+    ):
         if self.state.started:
             raise RuntimeError("이미 경매 시작")
         if total_teams <= 0 or initial_points <= 0:
@@ -65,298 +142,546 @@ class AuctionService:
         if not self.ensure_channel(channel_id):
             raise RuntimeError("다른 채널에서 진행 중")
 
-        self.state.total_teams = total_teams
-        self.state.started = True
         self.state.channel_id = channel_id
+        order = resolve_strategy(strategy) if strategy else None
+        DraftEngine(self.state).start(total_teams, initial_points, order, seed)
+
+        st = self.state
+        self._log(
+            "start", total_teams=total_teams,
+            points={n: c.total_pts for n, c in st.captains.items()},
+            captain_order=st.captain_order, player_order=st.player_order,
+            order_strategy=st.order_strategy, order_seed=st.order_seed,
+            reauction_order=sorted(st.reauction_rank, key=st.reauction_rank.get),
+        )
 
-        # ⬇️ 개별 포인트가 지정되지 않은 팀장에게만 기본 초기 포인트 적용
-        for c in self.state.captains.values():
-            if not isinstance(c.total_pts, int) or c.total_pts <= 0:
-                c.total_pts = initial_points
-            c.used_pts = 0
-            c.pause_used = 0
-
-        # 이후 순서/플레이어 셔플 로직은 기존 그대로
-        self.state.captain_order = list(self.state.captains.keys())
-        random.shuffle(self.state.captain_order)
-
-        self.state.player_order = [p.nickname for p in self.state.players.values() if p.status == "대기"]
-        random.shuffle(self.state.player_order)
-
-        self.state.current_player_idx = -1
-        self.state.current_captain_idx = 0
-        self.state.reset_round()
-
-    async def run_loop(self, ctx):
+    def prepare_resume(self) -> int:
+        """
+        재개 준비: 진행 중이던 경매자는 '대기'로 되돌려 같은 자리에서 다시 경매
+        (진행 중 입찰가는 저널에 남기지 않으므로 해당 매물만 처음부터 다시 진행)
+        반환값: 재개할 팀장 차례 인덱스
+        """
+        st = self.state
+        idx = st.current_player_idx
+        if 0 <= idx < len(st.player_order):
+            p = st.players.get(st.player_order[idx])
+            if p and p.status == PlayerStatus.ACTIVE:
+                p.status = PlayerStatus.WAITING
+                st.current_player_idx = idx - 1
+        return st.current_captain_idx
+
+    async def run_loop(self, ctx, resume: bool = False):
+        self.running = True
+        self.run_task = asyncio.current_task()
+        self.outbox = ChannelOutbox(ctx.send)
+        try:
+            await self._run_loop(ctx, resume)
+            await self.outbox.flush()
+        finally:
+            self.running = False
+            self.run_task = None
+            self.turn = self.lot = None
+            # 닫은 발신 큐는 떼어 냄 → 루프 밖 announce() 는 아무것도 보내지 않음 (닫힌 큐의 워커를 되살리지 않도록)
+            self.outbox.close()
+            self.outbox = None
+            self._drain_commands()
+            if self.journal is not None:
+                await self.journal.flush()
+
+    async def stop(self):
+        """진행 중인 run_loop 취소 후 종료까지 대기 (리셋/세션 종료)"""
+        task = self.run_task
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+    async def _run_loop(self, ctx, resume: bool = False):
         PREVIEW_DELAY_SEC = getattr(CFG, "PREVIEW_DELAY_SEC", getattr(CFG, "NEXT_PLAYER_DELAY_SEC", 5))
 
-        def any_team_can_add() -> bool:
-            for c_nick in self.state.captains.keys():
-                team = self.state.teams.get(c_nick)
-                if team and team.can_add():
-                    return True
-            return False
-
-        async def play_round(round_title: str | None = None):
-            if round_title:
-                await ctx.send(round_title)
-
-            while self.state.current_player_idx + 1 < len(self.state.player_order):
-                self.state.current_player_idx += 1
-                p_nick = self.state.player_order[self.state.current_player_idx]
-                p = self.state.players.get(p_nick)
-                if not p or p.status != "대기":
-                    continue
-
-                if not any_team_can_add():
-                    p.status = "유찰"
-                    await ctx.send(f"모든 팀이 만원이라 **{p.nickname}** 자동 유찰.")
-                    continue
-
-                # ── (1) 예고 + 카운트다운 ──
-                await self._preview_countdown(ctx, p, PREVIEW_DELAY_SEC)
+        draft = DraftEngine(self.state)
+        if resume:
+            draft.resume_captain_idx = self.prepare_resume()
+            if self.state.phase == "reauction":
+                self.announce("🔁 **유찰자 재경매 라운드 재개**")
 
-                # ── (2) 본 경매 시작 선언 & 라운드 초기화 ──
-                self.state.reset_round()
-                p.status = "진행"
-                await ctx.send(
-                    f"{fmt_player_line(p)}\n"
-                    f"입찰 규칙: 최소 {CFG.BASE_BID}P, {CFG.BID_STEP}P 단위"
+        while True:
+            effects = draft.next_lot()
+            for eff in effects:
+                await self._apply_effect(ctx, eff)
+            opened = effects[-1]
+            if not isinstance(opened, LotOpened):
+                return
+            p = self.state.players[opened.player]
+
+            # ── (1) 예고 + 카운트다운 ──
+            await self._preview_countdown(ctx, p, PREVIEW_DELAY_SEC)
+
+            # ── (2) 본 경매 시작 선언 & 라운드 초기화 ──
+            sealed = self.lot_mode == "sealed"
+            engine = draft.open_sealed_lot(p.nickname) if sealed else draft.open_lot(p.nickname)
+            self.lot = Lot(self.actor.next_seq(), p.nickname, engine)
+            self._log("lot", player_idx=self.state.current_player_idx, player=p.nickname)
+            rule = f"입찰 규칙: 최소 {CFG.BASE_BID}P, {CFG.BID_STEP}P 단위"
+            if sealed:
+                rule += (
+                    f"\n📩 밀봉 입찰 — {CFG.SEALED_BID_TIMEOUT_SEC}초 안에 한 번 제출, "
+                    f"낙찰가는 {PRICE_RULE_LABEL.get(engine.rules.sealed_price, engine.rules.sealed_price)}"
                 )
-
-                # ── (3) 실제 입찰 루프 (여기서 버튼/텍스트 입력 가능) ──
-                await self.bidding_loop(ctx, p)
-
-                # 전략 타임 (모든 팀 최소 1명 영입 시 1회)
-                if not self.state.strategy_called and self.state.everyone_has_member():
-                    self.state.strategy_called = True
-                    await ctx.send(f"📣 모든 팀장에게 팀원이 1명 이상! 전략 타임 {CFG.STRATEGY_TIME_MINUTES//60}분 시작.")
-                    await asyncio.sleep(CFG.STRATEGY_TIME_MINUTES)
-                    await ctx.send("전략 타임 종료, 경매 재개!")
-
-                # 라운드 간 간격(옵션)
-                gap = getattr(CFG, "POST_PLAYER_GAP_SEC", 0)
-                if gap > 0:
-                    await asyncio.sleep(gap)
-
-        # ── 1라운드 ──
-        if self.state.current_player_idx is None:
-            self.state.current_player_idx = -1
-        if self.state.current_captain_idx is None:
-            self.state.current_captain_idx = 0
-        await play_round()
-
-        # ── 유찰자 재경매(1회) ──
-        failed_players = [pl for pl in self.state.players.values() if pl.status == "유찰"]
-        if failed_players and any_team_can_add():
-            for pl in failed_players:
-                pl.status = "대기"
-            self.state.player_order = [pl.nickname for pl in failed_players]
-            random.shuffle(self.state.player_order)
-
-            self.state.current_player_idx = -1
-            self.state.current_captain_idx = 0
-            self.state.reset_round()
-
-            await play_round("🔁 **유찰자 재경매 라운드 시작**")
-
-        await ctx.send("✅ 모든 경매 종료. `!파일 내보내기`로 CSV를 받을 수 있어요.")
-
-    async def bidding_loop(self, ctx, player: Player):
-        import asyncio, datetime
-        from models.entities import Team
-        import config as CFG
-
-        passed_round: set[str] = set()
-        no_interest_set: set[str] = set()   # ⬅️ 이 매물에 대해 “관심 없음”을 선택한 팀장들
-
-        def get_user_id_for_captain(captain_nick: str) -> int | None:
-            for uid, nick in self.state.captain_user_map.items():
-                if nick == captain_nick:
-                    return uid
-            return None
-
+            self.announce(f"{fmt_player_line(p)}\n{rule}")
+
+            # ── (3) 실제 입찰 루프 (여기서 버튼/텍스트 입력 가능) ──
+            if sealed:
+                await self.sealed_loop(ctx, engine)
+            else:
+                await self.bidding_loop(ctx, engine)
+            self.lot = None
+
+            for eff in draft.after_lot():
+                await self._apply_effect(ctx, eff)
+
+            # 라운드 간 간격(옵션)
+            gap = getattr(CFG, "POST_PLAYER_GAP_SEC", 0)
+            if gap > 0:
+                await self._idle(gap)
+
+    # ───────────────────────── actor 명령 처리 ─────────────────────────
+    async def _receive(self, until: float | None, stop=None):
+        """
+        until(이벤트 루프 시각)까지 명령을 꺼내 반영하고, 차례 입력(TurnInput)이 오면 돌려줌
+        - 퍼즈/해제/일반 변경은 여기서 바로 반영
+        - stop() 이 참이 되면(예: 퍼즈 해제) None 반환, 시간이 다 돼도 None
+        """
+        loop = asyncio.get_running_loop()
         while True:
-            for _ in range(len(self.state.captain_order)):
-                c_nick = self.state.captain_order[self.state.current_captain_idx]
-                captain = self.state.captains[c_nick]
-                team = self.state.teams.get(c_nick) or Team(captain_nick=c_nick, limit=CFG.TEAM_LIMIT)
-                self.state.teams[c_nick] = team
-
-                # ⬇️ “관심 없음”이면 이 매물에서 자동 패스
-                if c_nick in no_interest_set:
-                    passed_round.add(c_nick)
-                    await ctx.send(f"⚫ {self.mention_for_captain(c_nick)} — ‘관심 없음’ 선택으로 자동 패스.")
-                    self.state.current_captain_idx = (self.state.current_captain_idx + 1) % len(self.state.captain_order)
-                    # 라운드 정산 체크
-                    if len(passed_round) == len(self.state.captain_order):
-                        if self.state.current_bidder:
-                            win = self.state.current_bidder
-                            cap = self.state.captains[win]; t = self.state.teams[win]
-                            cap.used_pts += self.state.current_bid
-                            t.members.append(player.nickname)
-                            player.status, player.won_team, player.won_price = "낙찰", cap.team_name, self.state.current_bid
-                            await ctx.send(f"🎉 **{player.nickname}** 낙찰! 팀 **{cap.team_name}**, 가격 **{self.state.current_bid}P**")
-                        else:
-                            player.status = "유찰"
-                            await ctx.send(f"⚪ **{player.nickname}** 유찰.")
-                        return
-                    continue
+            if stop is not None and stop():
+                return None
+            timeout = None if until is None else until - loop.time()
+            if timeout is not None and timeout <= 0:
+                return None
+            cmd = await self.actor.receive(timeout)
+            if cmd is None:
+                return None
+            if isinstance(cmd, TurnInput):
+                return cmd
+            self._apply_command(cmd)
+
+    async def _idle(self, seconds: float):
+        """대기하는 동안에도 명령은 처리 (예고 카운트다운, 전략 타임 등) — 차례 입력은 지난 것이므로 버림"""
+        until = asyncio.get_running_loop().time() + seconds
+        while await self._receive(until) is not None:
+            pass
+
+    def _apply_command(self, cmd):
+        if isinstance(cmd, Call):
+            try:
+                result = cmd.fn(*cmd.args)
+            except Exception as e:
+                if cmd.reply is not None and not cmd.reply.done():
+                    cmd.reply.set_exception(e)
+                return
+            if cmd.reply is not None and not cmd.reply.done():
+                cmd.reply.set_result(result)
+        elif isinstance(cmd, PauseCommand):
+            reason = self._start_pause(cmd.captain)
+            if cmd.reply is not None:
+                if not cmd.reply.done():
+                    cmd.reply.set_result(reason)
+            elif reason is not None:
+                self.announce(PAUSE_REJECT_TEXT[reason])   # 텍스트 `!퍼즈` 는 응답 받을 곳이 없으므로 공개 안내
+        elif isinstance(cmd, UnpauseCommand):
+            ok = self.state.pause_owner == cmd.captain
+            if ok:
+                self.end_pause()
+                self.announce("▶️ 퍼즈 해제!")
+            if cmd.reply is not None and not cmd.reply.done():
+                cmd.reply.set_result(ok)
+
+    def _drain_commands(self):
+        """
+        루프 종료 시 남은 명령 (세션 종료/리셋 포함 유일한 정리 경로)
+        - 일반 변경은 마저 반영, 차례/퍼즈 명령은 의미가 없으므로 버림
+        - 응답을 기다리는 쪽은 취소하지 않고 '진행 중 차례 없음' 으로 돌려줌
+        """
+        while not self.actor.queue.empty():
+            cmd = self.actor.queue.get_nowait()
+            if isinstance(cmd, Call):
+                self._apply_command(cmd)
+            elif getattr(cmd, "reply", None) is not None and not cmd.reply.done():
+                cmd.reply.set_result("not_turn" if isinstance(cmd, PauseCommand) else False)
+
+    async def _ask(self, cmd):
+        """명령을 넣고 결과를 기다림 — 루프가 없으면 그 자리에서 바로 반영"""
+        if not self.running:
+            self._apply_command(cmd)
+        else:
+            self.actor.submit(cmd)
+        return await cmd.reply
+
+    async def execute(self, fn, *args, **kwargs):
+        """상태 변경 함수 실행 (진행 중이면 경매 루프 차례에 맞춰 실행) — 예외는 그대로 전달"""
+        if kwargs:
+            fn = functools.partial(fn, **kwargs)
+        return await self._ask(Call(fn, args, asyncio.get_running_loop().create_future()))
+
+    async def request_pause(self, c_nick: str) -> str | None:
+        """버튼 퍼즈 요청 — 거절 사유(busy/exhausted/not_turn) 또는 None(시작됨)"""
+        return await self._ask(PauseCommand(c_nick, asyncio.get_running_loop().create_future()))
+
+    async def request_unpause(self, c_nick: str) -> bool:
+        return await self._ask(UnpauseCommand(c_nick, asyncio.get_running_loop().create_future()))
+
+    # ───────────────────────── 순차 입찰 ─────────────────────────
+    async def bidding_loop(self, ctx, lot: LotEngine):
+        """엔진이 요구하는 차례마다 입력을 모아 넘기고, 나온 효과를 안내/저널로 반영"""
+        # 연결된 팀장이 하나라도 있으면 버튼이 달린 차례 메시지 1개를 매물 내내 수정해서 씀
+        panel = any(self.state.user_id_for(c) is not None for c in lot.eligible)
+        effects = lot.next_turn()
+        try:
+            while True:
+                for eff in effects:
+                    await self._apply_effect(ctx, eff)
+                prompt = effects[-1]
+                if not isinstance(prompt, TurnPrompt):
+                    return
+                self.bid_panels.notify()   # 최고가/한도/차례 변화 → 열린 패널 갱신 (모아서 수정)
+                event = await self._collect_turn(ctx, prompt.captain, panel)
+                effects = lot.handle(event)
+        finally:
+            await self._close_turn_message()
+            if len(self.bid_panels):
+                await self.bid_panels.close_all(f"🏁 {lot.player.nickname} 경매가 끝나 패널을 닫았습니다.")
+
+    async def _collect_turn(self, ctx, c_nick: str, panel: bool = False):
+        """팀장 1명의 입력 수집 (버튼 또는 텍스트) → 엔진 이벤트"""
+        captain = self.state.captains[c_nick]
+
+        # 퍼즈 중이면 해제 명령 또는 만료 시각까지 대기
+        await self._wait_unpaused()
+
+        self._log("turn", captain_idx=self.state.current_captain_idx)
+        author_id = self.state.user_id_for(c_nick)
+        turn = self.actor.open_turn(c_nick, author_id, CFG.TURN_BID_TIMEOUT_SEC)
+        self.turn = turn
+        # 텍스트 입력은 두 모드 모두 라우터로 받음 (바인딩된 팀장은 유저 ID, 아니면 닉네임으로 색인)
+        unroute = self.router.expect(
+            ctx.channel.id, self._turn_text_handler(turn), user_id=author_id,
+            names=() if author_id is not None else (c_nick,),
+        )
 
-                # 팀 인원 제한
-                if not team.can_add():
-                    await ctx.send(f"{self.mention_for_captain(c_nick)} 팀은 인원 제한으로 이번 경매 참여 불가.")
-                    self.state.current_captain_idx = (self.state.current_captain_idx + 1) % len(self.state.captain_order)
+        head = f"배팅 차례: {self.mention_for_captain(c_nick)} (잔여 {captain.remain_pts}, 한도 {self.state.max_bid(c_nick)})"
+        if author_id is not None:
+            low, high = quick_amounts(self)
+            text = (
+                f"{head} — 버튼으로 선택하세요. ({CFG.TURN_BID_TIMEOUT_SEC}초)\n"
+                f"⚡ 최소 인상 **{low}P** / +{CFG.QUICK_RAISE_STEPS}단계 **{high}P** / 금액 입력"
+            )
+        else:
+            text = f"{head} — `!입찰 <포인트>` / `!패스` / `!관심없음` / `!퍼즈` ({CFG.TURN_BID_TIMEOUT_SEC}초)"
+        try:
+            if panel:
+                await self._show_turn_message(text, ping=self.mention_for_captain(c_nick) if author_id is not None else None)
+            else:
+                self.announce(text)
+            action, amount = await self._await_turn_input(turn)
+        finally:
+            unroute()
+            if not turn.future.done():
+                turn.future.cancel()
+            self.turn = None
+        return self._event_from_action(c_nick, action, amount)
+
+    async def _show_turn_message(self, text: str, ping: str | None = None):
+        """
+        매물의 차례 메시지를 제자리에서 수정 (처음이거나 수정이 안 되면 새로 전송)
+        - 수정된 메시지에 새로 들어간 멘션은 알림이 가지 않으므로, 수정했을 때는 ping(멘션)만 짧게 새로 보냄
+        """
+        lot = self.lot
+        if lot.message is not None:
+            try:
+                await self.outbox.edit(lot.message, content=text)
+            except Exception:
+                pass   # 메시지 삭제/권한 변경 등 — 새로 보냄
+            else:
+                if ping is not None:
+                    await self.outbox.send(f"🔔 {ping} 차례입니다.")
+                return
+        lot.message = await self.outbox.send(text, view=TurnControlView(lambda _: self))
+
+    async def _close_turn_message(self):
+        """매물이 끝나면 차례 메시지의 버튼 제거"""
+        lot = self.lot
+        if lot is None or lot.message is None:
+            return
+        msg, lot.message = lot.message, None
+        try:
+            await self.outbox.edit(msg, content=f"{lot.player} 경매 종료", view=None)
+        except Exception:
+            pass
+
+    async def _await_turn_input(self, turn: Turn):
+        """현재 차례의 입력 대기 — 지난 차례 입력은 버리고, 퍼즈 동안은 마감을 늦춤"""
+        loop = asyncio.get_running_loop()
+        while True:
+            inp = await self._receive(turn.deadline, stop=lambda: self.state.paused_until is not None)
+            if inp is None:
+                if self.state.paused_until is not None:
+                    started = loop.time()
+                    await self._wait_unpaused()
+                    turn.deadline += loop.time() - started
                     continue
+                return "timeout", None
+            if inp.turn_id == turn.seq:
+                return inp.action, inp.amount
+
+    def _turn_text_handler(self, turn: Turn):
+        """라우터가 넘긴 텍스트 입력 → TurnInput (파싱은 라우터에서 끝남)"""
+        c_nick = turn.captain
+
+        def handle(msg, cmd) -> bool:
+            mapped = self.state.captain_user_map.get(msg.author.id)
+            if mapped is not None and mapped != c_nick:
+                return False   # 닉네임은 같지만 다른 팀장으로 연결된 유저
+            if cmd.action == "pause":
+                self.actor.submit(PauseCommand(c_nick))   # 버튼 퍼즈와 같은 경로 — 차례 유지
+            elif cmd.action == "bid" and cmd.amount is None:
+                self.announce("예) `!입찰 100`")
+                self.actor.submit(TurnInput(turn.seq, c_nick, None))
+            else:
+                self.actor.submit(TurnInput(turn.seq, c_nick, cmd.action, cmd.amount))
+            return True
+        return handle
+
+    async def sealed_loop(self, ctx, lot: SealedLotEngine):
+        """
+        밀봉 입찰: 자격 있는 팀장 전원이 공통 마감 안에 동시에 1회 제출
+        - 바인딩된 팀장: 공개 메시지 버튼 → 각자 에페메랄 패널
+        - 바인딩 안 된 팀장: `!입찰 <포인트>` / `!패스` (읽은 즉시 메시지 삭제)
+        - 마감되거나 전원 제출하면 공개 + 정산
+        """
+        for eff in lot.submit_proxies():
+            await self._apply_effect(ctx, eff)
+
+        pending = lot.pending()
+        if pending:
+            await self._wait_unpaused()
+            turn = self.actor.open_turn(None, None, CFG.SEALED_BID_TIMEOUT_SEC)
+            self.turn = turn
+            loop = asyncio.get_running_loop()
+            seats = {}
+            for c_nick in pending:
+                uid = self.state.user_id_for(c_nick)
+                if uid is not None:
+                    seat = loop.create_future()
+                    seat.add_done_callback(
+                        lambda f, c=c_nick: f.cancelled() or self.actor.submit(TurnInput(turn.seq, c, *f.result()))
+                    )
+                    seats[uid] = (c_nick, seat)
+            text_nicks = [c for c in pending if self.state.user_id_for(c) is None]
 
-                # 퍼즈 만료 검사
-                if self.state.paused_until:
-                    now = datetime.datetime.utcnow()
-                    if now < self.state.paused_until:
-                        await asyncio.sleep(1)
-                        continue
-                    self.state.paused_until = None
-                    self.state.pause_owner = None
-                    await ctx.send("⏱️ 퍼즈 만료, 경매 재개.")
-
-                # 현재 최고 입찰자에게 턴이 다시 오면 자동 낙찰
-                if self.state.current_bidder == c_nick and len(passed_round) == len(self.state.captain_order) - 1:
-                    win = self.state.current_bidder
-                    cap = self.state.captains[win]; t = self.state.teams[win]
-                    cap.used_pts += self.state.current_bid
-                    t.members.append(player.nickname)
-                    player.status, player.won_team, player.won_price = "낙찰", cap.team_name, self.state.current_bid
-                    await ctx.send(f"🎉 **{player.nickname}** 낙찰! 팀 **{cap.team_name}**, 가격 **{self.state.current_bid}P**")
-                    return
-
-                # ── 입력 수집 ──
-                action, amount = None, None
-                author_id = get_user_id_for_captain(c_nick)
-
-                if author_id is not None:
-                    # 버튼(에페메랄) 모드
-                    from components.open_panel import OpenPanelLauncher
-                    loop = asyncio.get_running_loop()
-                    if not getattr(self.state, "current_result_future", None) or self.state.current_result_future.done():
-                        self.state.current_result_future = loop.create_future()
-                    result_future = self.state.current_result_future
-
-                    if getattr(self.state, "resume_panel_requested", False):
-                        self.state.resume_panel_requested = False
-                        try:
-                            action, amount = await asyncio.wait_for(result_future, timeout=CFG.TURN_BID_TIMEOUT_SEC)
-                        except asyncio.TimeoutError:
-                            action = "pass"; await ctx.send(f"⏱️ {self.mention_for_captain(c_nick)} 시간 초과로 자동 패스.")
-                    else:
-                        launcher = OpenPanelLauncher(
-                            author_id=author_id, service=self, captain_key=c_nick,
-                            min_bid=CFG.BASE_BID, step=CFG.BID_STEP, max_bid=captain.remain_pts,
-                            current_top=self.state.current_bid, timeout_sec=CFG.TURN_BID_TIMEOUT_SEC,
-                            pause_max_sec=CFG.PAUSE_MAX_DURATION_SEC, pause_max_count=CFG.PAUSE_MAX_PER_CAPTAIN,
-                            result_future=result_future,
-                            # ⬇️ 새 액션 이름도 패널이 반환할 수 있게 그대로 전달 (패널 코드는 아래 B)
-                        )
-                        prompt = await ctx.send(
-                            f"배팅 차례: {self.mention_for_captain(c_nick)} (잔여 {captain.remain_pts}) — 버튼으로 선택하세요.",
-                            view=launcher
-                        )
-                        try:
-                            action, amount = await asyncio.wait_for(result_future, timeout=CFG.TURN_BID_TIMEOUT_SEC)
-                        except asyncio.TimeoutError:
-                            action = "pass"; await ctx.send(f"⏱️ {self.mention_for_captain(c_nick)} 시간 초과로 자동 패스.")
-                        try:
-                            for ch in launcher.children: ch.disabled = True
-                            await prompt.edit(view=launcher)
-                        except Exception:
-                            pass
-                    self.state.current_result_future = None
+            unroute = self.router.expect(ctx.channel.id, self._sealed_text_handler(turn, text_nicks), names=text_nicks)
 
+            launcher = None
+            submitted: dict = {}
+            try:
+                names = ", ".join(self.mention_for_captain(c) for c in pending)
+                text = f"📩 밀봉 입찰 접수: {names} — {CFG.SEALED_BID_TIMEOUT_SEC}초 안에 제출하세요."
+                if text_nicks:
+                    text += "\n(버튼이 없는 팀장은 `!입찰 <포인트>` / `!패스`, 메시지는 바로 지워집니다)"
+                if seats:
+                    launcher = SealedBidLauncher(
+                        service=self, seats=seats, min_bid=CFG.BASE_BID, step=CFG.BID_STEP,
+                        timeout_sec=CFG.SEALED_BID_TIMEOUT_SEC,
+                    )
+                    turn.message = await self.outbox.send(text, view=launcher)
                 else:
-                    # 텍스트 폴백
-                    await ctx.send(
-                        f"배팅 차례: {self.mention_for_captain(c_nick)} (잔여 {captain.remain_pts}) — "
-                        f"`!입찰 <포인트>` / `!패스` / `!관심없음` / `!퍼즈` ({CFG.TURN_BID_TIMEOUT_SEC}초)"
+                    self.announce(text)
+                    await self.outbox.flush()
+
+                while len(submitted) < len(pending):
+                    inp = await self._receive(turn.deadline)
+                    if inp is None:
+                        break
+                    if inp.turn_id == turn.seq and inp.captain in pending and inp.captain not in submitted:
+                        submitted[inp.captain] = (inp.action, inp.amount)
+            finally:
+                unroute()
+                for _, seat in seats.values():
+                    if not seat.done():
+                        seat.cancel()
+                self.turn = None
+            if launcher is not None:
+                launcher.stop()
+                try:
+                    for ch in launcher.children: ch.disabled = True
+                    await turn.message.edit(view=launcher)
+                except Exception:
+                    pass
+
+            for c_nick in pending:
+                action, amount = submitted.get(c_nick, ("timeout", None))
+                for eff in lot.submit(c_nick, amount if action == "bid" else None):
+                    await self._apply_effect(ctx, eff)
+
+        for eff in lot.close():
+            await self._apply_effect(ctx, eff)
+
+    def _sealed_text_handler(self, turn: Turn, nicks):
+        """텍스트 폴백 팀장의 밀봉 입찰 수집 — 금액이 채널에 남지 않도록 바로 삭제"""
+        waiting = set(nicks)
+
+        def handle(msg, cmd) -> bool:
+            c_nick = self.state.captain_user_map.get(msg.author.id)
+            if c_nick is None:
+                for cand in ((msg.author.display_name or "").strip(), (msg.author.name or "").strip()):
+                    if cand in waiting:
+                        c_nick = cand
+                        break
+            if c_nick not in waiting or cmd.action == "pause":
+                return False
+            asyncio.create_task(_delete_quietly(msg))
+            if cmd.action == "bid":
+                amount = cmd.amount
+                ceiling = self.state.max_bid(c_nick)
+                if amount is None:
+                    self.announce("예) `!입찰 100`")
+                    return True
+                if amount < CFG.BASE_BID or amount % CFG.BID_STEP != 0 or amount > ceiling:
+                    self.announce(f"{self.mention_for_captain(c_nick)} 입찰은 최소 {CFG.BASE_BID}P, {CFG.BID_STEP}P 단위, 한도 {ceiling}P 이하입니다. 다시 제출해 주세요.")
+                    return True
+                self.actor.submit(TurnInput(turn.seq, c_nick, "bid", amount))
+            else:
+                self.actor.submit(TurnInput(turn.seq, c_nick, "pass", None))
+            waiting.discard(c_nick)
+            self.announce(f"📩 {self.mention_for_captain(c_nick)} 제출 완료.")
+            return True
+        return handle
+
+    @staticmethod
+    def _event_from_action(c_nick: str, action: str | None, amount: int | None):
+        if action == "bid":
+            return Bid(c_nick, int(amount or 0))
+        if action == "pass":
+            return Pass(c_nick)
+        if action == "no_interest":
+            return NoInterest(c_nick)
+        if action == "timeout":
+            return Timeout(c_nick)
+        return Skip(c_nick)
+
+    # ───────────────────────── 안내 발신 ─────────────────────────
+    def announce(self, text: str):
+        """경매 진행 안내 — 발신 큐에 넣고 바로 반환 (연속 안내는 한 메시지로 합쳐짐, 루프 밖에서는 무시)"""
+        if self.outbox is not None:
+            self.outbox.post(text)
+
+    # ───────────────────────── 엔진 효과 → 안내/저널 ─────────────────────────
+    async def _apply_effect(self, ctx, eff):
+        m = self.mention_for_captain
+        if isinstance(eff, RoundStarted):
+            self._log("round", phase=eff.phase, player_order=list(eff.player_order))
+            self.announce("🔁 **유찰자 재경매 라운드 시작**")
+        elif isinstance(eff, AutoFailed):
+            self._log("fail", player=eff.player)
+            self.announce(f"모든 팀이 만원이라 **{eff.player}** 자동 유찰.")
+        elif isinstance(eff, BidAccepted):
+            self.announce(f"🟢 {m(eff.captain)} **{eff.amount}P** 입찰!")
+        elif isinstance(eff, SealedBidReceived):
+            if eff.proxy:
+                self.announce(f"🤖 {m(eff.captain)} 대리 입찰 상한으로 밀봉 입찰 제출.")
+        elif isinstance(eff, SealedRevealed):
+            lines = [f"{i}. {m(c)} {amt}P" for i, (c, amt) in enumerate(eff.bids, 1)]
+            self.announce("📬 **밀봉 입찰 공개**\n" + "\n".join(lines))
+        elif isinstance(eff, ProxyResolved):
+            extra = f" (대리 입찰 {eff.contenders}팀 경합)" if eff.contenders > 1 else ""
+            self.announce(f"🤖 {m(eff.captain)} 대리 입찰 **{eff.amount}P**{extra}")
+        elif isinstance(eff, BidRejected):
+            if eff.reason == "rule":
+                self.announce(f"입찰은 최소 {CFG.BASE_BID}P, {CFG.BID_STEP}P 단위입니다.")
+            elif eff.reason == "low":
+                self.announce(f"현재 최고 {eff.limit}P 입니다.")
+            else:
+                self.announce(over_limit_text(eff.limit))
+        elif isinstance(eff, Passed):
+            self.announce(f"🔵 {m(eff.captain)} 패스.")
+        elif isinstance(eff, TimedOut):
+            self.announce(f"⏱️ {m(eff.captain)} 시간 초과로 자동 패스.")
+        elif isinstance(eff, NoInterestMarked):
+            self.announce(f"⚫ {m(eff.captain)} 관심 없음(현재 경매 패스).")
+        elif isinstance(eff, Awarded):
+            self._log("award", player=eff.player, captain=eff.captain, price=eff.price)
+            cap = self.state.captains[eff.captain]
+            self.announce(f"🎉 **{eff.player}** 낙찰! 팀 **{cap.team_name}**, 가격 **{eff.price}P**")
+        elif isinstance(eff, Failed):
+            self._log("fail", player=eff.player)
+            self.announce(f"⚪ **{eff.player}** 유찰.")
+        elif isinstance(eff, StrategyTime):
+            self._log("strategy")
+            self.announce(f"📣 모든 팀장에게 팀원이 1명 이상! 전략 타임 {CFG.STRATEGY_TIME_MINUTES//60}분 시작.")
+            await self.outbox.flush()
+            await self._idle(CFG.STRATEGY_TIME_MINUTES)
+            self.announce("전략 타임 종료, 경매 재개!")
+        elif isinstance(eff, DraftFinished):
+            self._log("done")
+            self.announce("✅ 모든 경매 종료. `!파일 내보내기`로 CSV를 받을 수 있어요.")
+            if CFG.LEFTOVER_AUTO_PREVIEW:
+                plan = self.plan_allocation()
+                if plan:
+                    await self.outbox.send(
+                        plan.preview(self.state, CFG.OUTBOX_MAX_MESSAGE_LEN),
+                        # 확정은 `!유찰 배정` 과 같이 요청한 사람(경매를 시작/재개한 진행자)만
+                        view=AllocationConfirmView(service=self, plan=plan, author_id=ctx.author.id),
                     )
-                    def is_turn(m): 
-                        if m.channel.id != ctx.channel.id: return False
-                        mapped = self.state.captain_user_map.get(m.author.id)
-                        if mapped: return mapped == c_nick
-                        n=(m.author.display_name or "").strip(); u=(m.author.name or "").strip()
-                        return n==c_nick or u==c_nick
-                    try:
-                        msg = await ctx.bot.wait_for("message", timeout=CFG.TURN_BID_TIMEOUT_SEC, check=is_turn)
-                        content = msg.content.strip()
-                        if content.startswith("!입찰"):
-                            parts = content.split()
-                            if len(parts)>=2 and parts[1].lstrip("-").isdigit():
-                                amount=int(parts[1]); action="bid"
-                            else:
-                                await ctx.send("예) `!입찰 100`")
-                        elif content in ("!패스", "!pass"):
-                            action="pass"
-                        elif content.replace(" ", "") in ("!관심없음", "!관심없어", "!nointerest"):
-                            action="no_interest"
-                        elif content.startswith("!퍼즈 종료"):
-                            if self.state.pause_owner == c_nick:
-                                self.state.paused_until=None; self.state.pause_owner=None
-                                await ctx.send("▶️ 퍼즈 해제!")
-                            else:
-                                await ctx.send("퍼즈를 건 팀장만 해제할 수 있습니다.")
-                        elif content.startswith("!퍼즈"):
-                            action="pause"
-                    except asyncio.TimeoutError:
-                        action="pass"; await ctx.send(f"⏱️ {self.mention_for_captain(c_nick)} 시간 초과로 자동 패스.")
-
-                # ── 결과 반영 ──
-                if action == "bid":
-                    bid=int(amount or 0)
-                    if bid < CFG.BASE_BID or bid % CFG.BID_STEP != 0:
-                        await ctx.send(f"입찰은 최소 {CFG.BASE_BID}P, {CFG.BID_STEP}P 단위입니다.")
-                    elif bid <= self.state.current_bid:
-                        await ctx.send(f"현재 최고 {self.state.current_bid}P 입니다.")
-                    elif bid > captain.remain_pts:
-                        await ctx.send(f"보유 포인트({captain.remain_pts})를 초과했어요.")
-                    else:
-                        self.state.current_bid, self.state.current_bidder = bid, c_nick
-                        passed_round.clear()
-                        await ctx.send(f"🟢 {self.mention_for_captain(c_nick)} **{bid}P** 입찰!")
-
-                elif action == "pass":
-                    passed_round.add(c_nick)
-                    await ctx.send(f"🔵 {self.mention_for_captain(c_nick)} 패스.")
-
-                elif action == "no_interest":
-                    passed_round.add(c_nick)
-                    no_interest_set.add(c_nick)   # ⬅️ 다음에 또 차례가 와도 자동 패스
-                    await ctx.send(f"⚫ {self.mention_for_captain(c_nick)} 관심 없음(현재 경매 패스).")
-
-                elif action == "pause":
-                    if self.state.pause_owner and self.state.pause_owner != c_nick:
-                        await ctx.send("이미 누군가 퍼즈 중입니다.")
-                    elif captain.pause_used >= CFG.PAUSE_MAX_PER_CAPTAIN:
-                        await ctx.send("퍼즈 횟수를 모두 사용했습니다.")
-                    else:
-                        captain.pause_used += 1
-                        self.state.pause_owner = c_nick
-                        self.state.paused_until = datetime.datetime.utcnow() + datetime.timedelta(seconds=CFG.PAUSE_MAX_DURATION_SEC)
-                        await ctx.send(f"⏸️ {self.mention_for_captain(c_nick)} 퍼즈! 최대 {CFG.PAUSE_MAX_DURATION_SEC//60}분. `!퍼즈 종료`로 조기 해제.")
-
-                # 다음 팀장
-                self.state.current_captain_idx = (self.state.current_captain_idx + 1) % len(self.state.captain_order)
-
-                # 라운드 정산
-                if len(passed_round) == len(self.state.captain_order):
-                    if self.state.current_bidder:
-                        win = self.state.current_bidder
-                        cap = self.state.captains[win]; t = self.state.teams[win]
-                        cap.used_pts += self.state.current_bid
-                        t.members.append(player.nickname)
-                        player.status, player.won_team, player.won_price = "낙찰", cap.team_name, self.state.current_bid
-                        await ctx.send(f"🎉 **{player.nickname}** 낙찰! 팀 **{cap.team_name}**, 가격 **{self.state.current_bid}P**")
-                    else:
-                        player.status = "유찰"
-                        await ctx.send(f"⚪ **{player.nickname}** 유찰.")
-                    return
+
+    # ───────────────────────── 퍼즈 ─────────────────────────
+    def begin_pause(self, c_nick: str, duration_sec: int):
+        self.state.captains[c_nick].pause_used += 1
+        self.state.pause_owner = c_nick
+        self.state.paused_until = datetime.datetime.utcnow() + datetime.timedelta(seconds=duration_sec)
+        self._log("pause", captain=c_nick, until=self.state.paused_until.isoformat())
+
+    def end_pause(self):
+        self.state.paused_until = None
+        self.state.pause_owner = None
+        self._log("unpause")
+
+    def _start_pause(self, c_nick: str) -> str | None:
+        """퍼즈 시작 (버튼/텍스트 공통 PauseCommand) — 현재 차례 팀장만, 차례는 넘기지 않음, 시작되면 None"""
+        if self.turn is None or self.turn.captain != c_nick:
+            return "not_turn"
+        if self.state.pause_owner:
+            return "busy"
+        if self.state.captains[c_nick].pause_used >= CFG.PAUSE_MAX_PER_CAPTAIN:
+            return "exhausted"
+        self.begin_pause(c_nick, CFG.PAUSE_MAX_DURATION_SEC)
+        self.announce(f"⏸️ {c_nick} 퍼즈! 최대 {CFG.PAUSE_MAX_DURATION_SEC//60}분. `!퍼즈 종료`로 조기 해제.")
+        return None
+
+    async def _wait_unpaused(self):
+        """
+        퍼즈가 끝날 때까지 명령을 처리하며 대기
+        - 해제 명령(버튼/!퍼즈 종료)이 오면 즉시 복귀, 만료 시각이 지나면 end_pause + 안내
+        - 퍼즈 중 들어온 현재 차례 입력은 해제 후 다시 큐에 넣음
+        """
+        if self.state.paused_until is None:
+            return
+        loop = asyncio.get_running_loop()
+        remaining = (self.state.paused_until - datetime.datetime.utcnow()).total_seconds()
+        until = loop.time() + max(0.0, remaining)
+        deferred = []
+        while True:
+            inp = await self._receive(until, stop=lambda: self.state.paused_until is None)
+            if inp is None:
+                break
+            deferred.append(inp)
+        if self.state.paused_until is not None:
+            self.end_pause()
+            self.announce("⏱️ 퍼즈 만료, 경매 재개.")
+        for inp in deferred:
+            self.actor.submit(inp)
 
     def export_csv_bytes(self) -> bytes:
         out = io.StringIO()
@@ -399,36 +724,109 @@ class AuctionService:
     def bind_captain_user(self, user_id: int, captain_nick: str):
         if captain_nick not in self.state.captains:
             raise ValueError("해당 팀장 닉네임이 없습니다.")
-        self.state.captain_user_map[user_id] = captain_nick
+        self.state.bind_captain_user(user_id, captain_nick)
+        self._log("bind", user_id=user_id, captain=captain_nick)
+
+    def set_proxy(self, captain_nick: str, target_kind: str, target: str, limit: int | None):
+        """대리 입찰 등록/해제 — target_kind: player(경매자 닉) / tier"""
+        if captain_nick not in self.state.captains:
+            raise ValueError("해당 팀장 닉네임이 없습니다.")
+        if target_kind == "player":
+            p = self.state.players.get(target)
+            if p is None:
+                raise ValueError("해당 닉네임의 경매자가 없습니다.")
+            if limit is not None and p.status == PlayerStatus.WON:
+                raise ValueError("이미 낙찰된 경매자입니다.")
+        if limit is not None:
+            if limit < CFG.BASE_BID or limit % CFG.BID_STEP != 0:
+                raise ValueError(f"상한은 최소 {CFG.BASE_BID}P, {CFG.BID_STEP}P 단위여야 합니다.")
+        self.state.set_proxy(captain_nick, target_kind, target, limit)
+        if self.lot is not None and hasattr(self.lot.engine, "refresh_proxies"):
+            self.lot.engine.refresh_proxies()   # 진행 중인 순차 입찰 매물에도 바로 반영
+        self._log("proxy", captain=captain_nick, target_kind=target_kind, target=target, limit=limit)
+
+    # ───────────────────────── 유찰자 자동 배정 ─────────────────────────
+    def plan_allocation(self) -> AllocationPlan:
+        """남은 유찰자 → 자리가 남은 팀 배정 계획 (상태는 바꾸지 않음)"""
+        if self.state.phase != "done":
+            raise ValueError("유찰자 배정은 경매가 모두 끝난 뒤에만 할 수 있습니다.")
+        return plan_leftovers(self.state)
+
+    def commit_allocation(self, plan: AllocationPlan) -> int:
+        """미리보기한 계획을 그대로 반영 — 그사이 상태가 바뀌었으면 하나도 반영하지 않음"""
+        st = self.state
+        if st.phase != "done":
+            raise ValueError("유찰자 배정은 경매가 모두 끝난 뒤에만 할 수 있습니다.")
+        need: dict = {}
+        for a in plan.assignments:
+            need[a.captain] = need.get(a.captain, 0) + 1
+            p = st.players.get(a.player)
+            if p is None or p.status != PlayerStatus.FAILED:
+                raise ValueError("미리보기 이후 상태가 바뀌었습니다. `!유찰 배정`으로 다시 만들어 주세요.")
+        for c_nick, n in need.items():
+            team = st.teams.get(c_nick)
+            if team is None or team.open_slots() < n or st.captains[c_nick].remain_pts < plan.price * n:
+                raise ValueError("미리보기 이후 상태가 바뀌었습니다. `!유찰 배정`으로 다시 만들어 주세요.")
+        for a in plan.assignments:
+            apply_award(st, st.players[a.player], a.captain, a.price)
+            st.clear_player_proxies(a.player)
+            self._log("award", player=a.player, captain=a.captain, price=a.price)
+        return len(plan.assignments)
 
     def get_captain_user_id(self, captain_nick: str) -> int | None:
-        # AuctionState.captain_user_map: Dict[user_id, captain_nick]
-        for uid, nick in self.state.captain_user_map.items():
-            if nick == captain_nick:
-                return uid
-        return None
+        return self.state.user_id_for(captain_nick)
 
     async def _preview_countdown(self, ctx, player, seconds: int):
-        """다음 경매자 예고 + 카운트다운 메시지 1개를 계속 수정"""
+        """
+        다음 경매자 예고 + 카운트다운
+        - timestamp: 디스코드 상대 시각(<t:…:R>)으로 1회 전송, 시작 시점에만 1회 수정
+        - coarse: PREVIEW_COUNTDOWN_STEP_SEC 초마다 수정
+        - tick: 1초마다 수정 (이전 방식)
+        수정이 실패하면 이후 수정은 포기하고, 시작 안내만 새 메시지로 1회 전송
+        """
         base = (
             "📢 **다음 경매자 예고**\n"
             f"{fmt_player_line(player)}\n"
         )
+        upcoming = self.state.upcoming(CFG.ORDER_LOOKAHEAD)
+        if upcoming:
+            base += f"이어서: {', '.join(upcoming)}\n"
+        mode = getattr(CFG, "PREVIEW_COUNTDOWN_MODE", "timestamp")
+        if mode == "tick":
+            step = 1
+        elif mode == "coarse":
+            step = max(1, getattr(CFG, "PREVIEW_COUNTDOWN_STEP_SEC", 5))
+        else:
+            step = max(1, seconds)
+        start_at = int(time.time()) + seconds
+
+        def body(remaining: int) -> str:
+            if remaining <= 0:
+                return "▶️ **경매 시작!**"
+            if mode == "timestamp":
+                return f"⏳ <t:{start_at}:R> 시작합니다! 준비해 주세요."
+            return f"⏳ {remaining}초 뒤 시작합니다! 준비해 주세요."
+
         # 처음 한 번 전송
-        msg = await ctx.send(base + f"⏳ {seconds}초 뒤 시작합니다! 준비해 주세요.")
-        # 1초마다 편집
-        for s in range(seconds - 1, -1, -1):
-            await asyncio.sleep(1)
-            try:
-                await msg.edit(content=base + (f"⏳ {s}초 뒤 시작합니다! 준비해 주세요." if s > 0 else "▶️ **경매 시작!**"))
-            except Exception:
-                # 메시지 삭제/권한 변경 등으로 edit 실패 시 새로 보내고 계속
-                msg = await ctx.send(base + (f"⏳ {s}초 뒤 시작합니다! 준비해 주세요." if s > 0 else "▶️ **경매 시작!**"))
+        msg = await self.outbox.send(base + body(seconds))
+        editable = True
+        remaining = seconds
+        while remaining > 0:
+            wait = min(step, remaining)
+            await self._idle(wait)
+            remaining -= wait
+            if editable:
+                try:
+                    await msg.edit(content=base + body(remaining))
+                    continue
+                except Exception:
+                    # 메시지 삭제/권한 변경 등 — 매번 재전송하지 않고 수정만 중단
+                    editable = False
+            if remaining <= 0:
+                msg = await self.outbox.send(body(0))
         return msg  # 마지막 메시지 객체 반환
 
     # AuctionService 내부
     def mention_for_captain(self, c_nick: str) -> str:
-        for uid, nick in self.state.captain_user_map.items():
-            if nick == c_nick:
-                return f"<@{uid}>"
-        return c_nick
\ No newline at end of file
+        uid = self.state.user_id_for(c_nick)
+        return f"<@{uid}>" if uid is not None else c_nick
\ No newline at end of file
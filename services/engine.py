@@ -0,0 +1,603 @@
+# services/engine.py
+"""
+경매 엔진 (디스코드 비의존)
+- 입력: 팀장 행동 이벤트 (Bid / Pass / NoInterest / Timeout / Skip)
+- 퍼즈는 차례를 넘기지 않는 세션 명령이므로 엔진 밖(AuctionService 의 PauseCommand)에서 처리
+- 출력: 효과 목록 (차례 안내, 입찰/패스 안내, 낙찰/유찰 등)
+- 라운드/차례/정산 규칙은 전부 여기서 처리하고, AuctionService 는
+  효과를 메시지·버튼·저널로 옮기는 어댑터 역할만 함
+- simulate_draft() 로 디스코드 없이 전체 드래프트를 프로세스 안에서 돌릴 수 있음
+"""
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+from models.entities import AuctionState, Player, PlayerStatus, Team
+from services.ordering import OrderingStrategy, build_schedule, resolve_strategy
+import config as CFG
+
+
+@dataclass(frozen=True)
+class Rules:
+    base_bid: int
+    bid_step: int
+    pause_max_per_captain: int
+    team_limit: int
+    sealed_price: str = "first"       # 밀봉 입찰 낙찰가: first / second
+    sealed_tie_break: str = "order"   # 밀봉 입찰 동점: order / remain / random
+
+    @classmethod
+    def from_config(cls) -> "Rules":
+        return cls(
+            base_bid=CFG.BASE_BID,
+            bid_step=CFG.BID_STEP,
+            pause_max_per_captain=CFG.PAUSE_MAX_PER_CAPTAIN,
+            team_limit=CFG.TEAM_LIMIT,
+            sealed_price=CFG.SEALED_PRICE_RULE,
+            sealed_tie_break=CFG.SEALED_TIE_BREAK,
+        )
+
+
+# ───────────────────────── 입력 이벤트 ─────────────────────────
+@dataclass(frozen=True)
+class Bid:
+    captain: str
+    amount: int
+
+@dataclass(frozen=True)
+class Pass:
+    captain: str
+
+@dataclass(frozen=True)
+class NoInterest:
+    captain: str
+
+@dataclass(frozen=True)
+class Timeout:
+    captain: str
+
+@dataclass(frozen=True)
+class Skip:
+    """유효하지 않은 입력 — 차례만 넘김"""
+    captain: str
+
+
+# ───────────────────────── 출력 효과 ─────────────────────────
+@dataclass(frozen=True)
+class RoundStarted:
+    phase: str
+    player_order: tuple
+
+@dataclass(frozen=True)
+class AutoFailed:
+    """모든 팀이 만원이라 경매 없이 유찰"""
+    player: str
+
+@dataclass(frozen=True)
+class LotOpened:
+    player: str
+
+@dataclass(frozen=True)
+class TurnPrompt:
+    captain: str
+
+@dataclass(frozen=True)
+class BidAccepted:
+    captain: str
+    amount: int
+
+@dataclass(frozen=True)
+class ProxyResolved:
+    """대리 입찰끼리(또는 사람 입찰과) 경합한 결과 — 최종 선두와 가격만 안내"""
+    captain: str
+    amount: int
+    contenders: int
+
+@dataclass(frozen=True)
+class BidRejected:
+    captain: str
+    reason: str   # rule / low / over
+    limit: int
+
+@dataclass(frozen=True)
+class SealedBidReceived:
+    """밀봉 입찰 제출 (금액은 마감 전까지 비공개)"""
+    captain: str
+    proxy: bool = False
+
+@dataclass(frozen=True)
+class SealedRevealed:
+    """마감 후 공개 — (팀장, 금액) 높은 순"""
+    bids: tuple
+    price_rule: str
+
+@dataclass(frozen=True)
+class Passed:
+    captain: str
+
+@dataclass(frozen=True)
+class TimedOut:
+    captain: str
+
+@dataclass(frozen=True)
+class NoInterestMarked:
+    captain: str
+
+@dataclass(frozen=True)
+class Awarded:
+    player: str
+    captain: str
+    price: int
+
+@dataclass(frozen=True)
+class Failed:
+    player: str
+
+@dataclass(frozen=True)
+class StrategyTime:
+    pass
+
+@dataclass(frozen=True)
+class DraftFinished:
+    pass
+
+
+# ───────────────────────── 상태 변경 헬퍼 ─────────────────────────
+def apply_award(state: AuctionState, player: Player, captain_nick: str, price: int) -> None:
+    cap = state.captains[captain_nick]
+    cap.used_pts += price
+    state.add_member(captain_nick, player.nickname)
+    player.status, player.won_team, player.won_price = PlayerStatus.WON, cap.team_name, price
+
+
+# ───────────────────────── 매물 1건 ─────────────────────────
+class LotEngine:
+    """
+    매물 1건의 순번 입찰 (captain_order 라운드 로빈)
+    - next_turn(): 입력이 필요한 팀장까지 진행 → 마지막 효과는 TurnPrompt 또는 Awarded/Failed
+    - handle(ev): 입력 반영 후 다음 차례까지 진행
+    - eligible: 이 매물에 아직 입찰할 수 있는 팀장 (자리 있음, 관심 없음 아님, 다음 입찰가 감당 가능)
+      입찰가가 오를 때마다 감당 못 하는 팀장을 빼고, 자격 없는 팀장은 안내 없이 건너뜀
+    - 최고 입찰자 말고 결정할 팀장이 남지 않으면 차례가 돌아오길 기다리지 않고 바로 정산
+    """
+    def __init__(self, state: AuctionState, player: Player, rules: Rules):
+        self.state = state
+        self.player = player
+        self.rules = rules
+        self.passed: Set[str] = set()        # 마지막 입찰 이후 패스한 팀장 (eligible 의 부분집합)
+        self.no_interest: Set[str] = set()   # 이 매물에 대해 “관심 없음”을 선택한 팀장들
+        self.result = None
+        self.turns = 0
+        self._pos = {c: i for i, c in enumerate(state.captain_order)}   # 동점 시 순번 비교용
+
+        for c_nick in state.captain_order:
+            if c_nick not in state.teams:
+                state.put_team(Team(captain_nick=c_nick, limit=rules.team_limit))
+        self.eligible: Set[str] = {
+            c for c in state.captain_order
+            if state.teams[c].can_add() and self._ceiling(c) >= rules.base_bid
+        }
+        # 한도 오름차순 — 입찰가가 오르면 앞에서부터만 잘라 냄 (매물 중에는 한도가 변하지 않음)
+        self._by_ceiling = sorted(self.eligible, key=self._ceiling)
+        self._cut = 0
+        # 팀장 → 대리 입찰 상한 (한도/상한은 매물 중 변하지 않으므로 한 번만 계산)
+        self._caps: Dict[str, int] = {}
+        self.refresh_proxies()
+
+    @property
+    def settled(self) -> bool:
+        return self.result is not None
+
+    def _ceiling(self, c_nick: str) -> int:
+        """이 매물에서 팀장이 낼 수 있는 최대 금액 (남은 자리 예약분 제외)"""
+        return self.state.max_bid(c_nick)
+
+    def min_next_bid(self) -> int:
+        st = self.state
+        return st.current_bid + self.rules.bid_step if st.current_bidder else self.rules.base_bid
+
+    def _advance(self):
+        st = self.state
+        st.current_captain_idx = (st.current_captain_idx + 1) % len(st.captain_order)
+
+    def _drop(self, c_nick: str):
+        self.eligible.discard(c_nick)
+        self.passed.discard(c_nick)
+
+    def _drop_unaffordable(self):
+        need = self.min_next_bid()
+        while self._cut < len(self._by_ceiling) and self._ceiling(self._by_ceiling[self._cut]) < need:
+            self._drop(self._by_ceiling[self._cut])
+            self._cut += 1
+
+    def _undecided(self) -> int:
+        """최고 입찰자를 빼고 아직 패스하지 않은 자격 있는 팀장 수"""
+        bidder = self.state.current_bidder
+        return len(self.eligible) - len(self.passed) - (1 if bidder in self.eligible else 0)
+
+    # ── 대리 입찰 ──
+    def _proxy_cap(self, c_nick: str) -> Optional[int]:
+        """
+        이 매물에 대한 팀장의 대리 입찰 상한 (입찰 한도 이내, 입찰 단위로 내림). 없으면 None
+        - 상한이 최소 입찰가 미만이면(한도가 줄어든 경우 등) 대리 입찰 없음으로 보고 직접 묻게 함
+        """
+        limit = self.state.proxy_limit(c_nick, self.player)
+        if limit is None:
+            return None
+        cap = min(limit, self._ceiling(c_nick))
+        cap -= cap % self.rules.bid_step
+        return cap if cap >= self.rules.base_bid else None
+
+    def refresh_proxies(self) -> None:
+        """대리 입찰 상한 다시 계산 (매물 시작, 매물 중 대리 입찰 등록/해제 시)"""
+        st = self.state
+        if not st.proxy_by_player and not st.proxy_by_tier:
+            self._caps = {}
+            return
+        caps = {}
+        for c_nick in self.eligible:
+            cap = self._proxy_cap(c_nick)
+            if cap is not None:
+                caps[c_nick] = cap
+        self._caps = caps
+
+    def _resolve_proxies(self) -> list:
+        """
+        대리 입찰을 BID_STEP 단위로 올려 가며 경합한 결과를 한 번에 계산
+        - 선두: 상한이 가장 높은 팀장 (동점이면 현재 최고 입찰자 → 순번 앞선 팀장)
+        - 가격: 2위 상한 + BID_STEP (선두 상한 이내), 새 선두면 최소 다음 입찰가 이상
+        """
+        if not self._caps:
+            return []
+        st = self.state
+        cur, bidder = st.current_bid, st.current_bidder
+        step = self.rules.bid_step
+        min_next = self.min_next_bid()
+
+        caps = {c: cap for c, cap in self._caps.items() if c in self.eligible}
+        contenders = {c: cap for c, cap in caps.items() if c != bidder and cap >= min_next}
+        if not contenders:
+            return []
+        if bidder:
+            contenders[bidder] = max(cur, caps.get(bidder, cur))
+
+        ranked = sorted(contenders, key=lambda c: (-contenders[c], c != bidder, self._pos.get(c, 0)))
+        leader = ranked[0]
+        if len(ranked) > 1:
+            price = min(contenders[leader], contenders[ranked[1]] + step)
+        else:
+            price = min_next
+        price = max(price, cur) if leader == bidder else max(price, min_next)
+        if leader == bidder and price == cur:
+            return []
+
+        st.current_bid, st.current_bidder = price, leader
+        self.passed.clear()
+        self._drop_unaffordable()
+        return [ProxyResolved(leader, price, len(ranked))]
+
+    def _settle(self):
+        st = self.state
+        st.clear_player_proxies(self.player.nickname)
+        if st.current_bidder:
+            apply_award(st, self.player, st.current_bidder, st.current_bid)
+            self.result = Awarded(self.player.nickname, st.current_bidder, st.current_bid)
+        else:
+            self.player.status = PlayerStatus.FAILED
+            self.result = Failed(self.player.nickname)
+        return self.result
+
+    def next_turn(self) -> list:
+        st = self.state
+        order = st.captain_order
+        effects: list = self._resolve_proxies() if order else []
+
+        while True:
+            if self._undecided() <= 0:
+                effects.append(self._settle())
+                return effects
+
+            c_nick = order[st.current_captain_idx]
+            if c_nick not in self.eligible or c_nick in self.passed or c_nick == st.current_bidder:
+                self._advance()
+                continue
+
+            # 대리 입찰을 건 팀장은 직접 묻지 않음 — 경합은 _resolve_proxies 에서 이미 끝남
+            if c_nick in self._caps:
+                self.passed.add(c_nick)
+                self._advance()
+                continue
+
+            effects.append(TurnPrompt(c_nick))
+            return effects
+
+    def handle(self, ev) -> list:
+        st = self.state
+        c_nick = ev.captain
+        effects: list = []
+        self.turns += 1
+
+        if isinstance(ev, Bid):
+            bid = int(ev.amount or 0)
+            if bid < self.rules.base_bid or bid % self.rules.bid_step != 0:
+                effects.append(BidRejected(c_nick, "rule", self.rules.base_bid))
+            elif bid <= st.current_bid:
+                effects.append(BidRejected(c_nick, "low", st.current_bid))
+            elif bid > self._ceiling(c_nick):
+                effects.append(BidRejected(c_nick, "over", self._ceiling(c_nick)))
+            else:
+                st.current_bid, st.current_bidder = bid, c_nick
+                self.passed.clear()
+                self._drop_unaffordable()
+                effects.append(BidAccepted(c_nick, bid))
+
+        elif isinstance(ev, Pass):
+            self.passed.add(c_nick)
+            effects.append(Passed(c_nick))
+
+        elif isinstance(ev, Timeout):
+            self.passed.add(c_nick)
+            effects.append(TimedOut(c_nick))
+
+        elif isinstance(ev, NoInterest):
+            self.no_interest.add(c_nick)
+            self._drop(c_nick)   # 이 매물에서는 다시 묻지 않음
+            effects.append(NoInterestMarked(c_nick))
+
+        # 다음 팀장 (정산 여부는 next_turn 에서 판단)
+        self._advance()
+        return effects + self.next_turn()
+
+
+# ───────────────────────── 밀봉 입찰 매물 1건 ─────────────────────────
+class SealedLotEngine:
+    """
+    자격 있는 팀장 전원이 한 마감 시간 안에 동시에 1회 제출
+    - eligible: 자리가 남고 최소 입찰가 이상을 가진 팀장 (captain_order 순)
+    - submit(): 제출 검증, close(): 마감 → 공개 + 낙찰/유찰
+    - 낙찰가: first(최고 입찰가) / second(2위 입찰가, 단독 입찰이면 최소 입찰가)
+    - 동점: order(순번 앞선 팀장) / remain(잔여 포인트가 많은 팀장) / random
+    """
+    def __init__(self, state: AuctionState, player: Player, rules: Rules, rng: random.Random | None = None):
+        self.state = state
+        self.player = player
+        self.rules = rules
+        self.rng = rng or random
+        self.bids: dict = {}        # 팀장 → 금액 (제출 순서 유지)
+        self.declined: Set[str] = set()
+        self.result = None
+        self.eligible = [
+            c for c in state.captain_order
+            if state.teams.get(c) is not None and state.teams[c].can_add()
+            and state.max_bid(c) >= rules.base_bid
+        ]
+
+    @property
+    def settled(self) -> bool:
+        return self.result is not None
+
+    def pending(self) -> List[str]:
+        return [c for c in self.eligible if c not in self.bids and c not in self.declined]
+
+    def submit(self, captain: str, amount: Optional[int], proxy: bool = False) -> list:
+        """amount 가 None 이면 불참(패스/시간 초과)"""
+        if captain not in self.eligible or captain in self.bids or captain in self.declined:
+            return []
+        if amount is None:
+            self.declined.add(captain)
+            return []
+        bid = int(amount)
+        ceiling = self.state.max_bid(captain)
+        if bid < self.rules.base_bid or bid % self.rules.bid_step != 0:
+            return [BidRejected(captain, "rule", self.rules.base_bid)]
+        if bid > ceiling:
+            return [BidRejected(captain, "over", ceiling)]
+        self.bids[captain] = bid
+        return [SealedBidReceived(captain, proxy)]
+
+    def submit_proxies(self) -> list:
+        """대리 입찰을 건 팀장은 상한을 그대로 밀봉 입찰로 제출 (상한이 최소 입찰가 미만이면 직접 제출하게 둠)"""
+        effects: list = []
+        for c_nick in self.pending():
+            limit = self.state.proxy_limit(c_nick, self.player)
+            if limit is None:
+                continue
+            cap = min(limit, self.state.max_bid(c_nick))
+            cap -= cap % self.rules.bid_step
+            if cap < self.rules.base_bid:
+                continue
+            effects.extend(self.submit(c_nick, cap, proxy=True))
+        return effects
+
+    def _tie_key(self, captain: str):
+        if self.rules.sealed_tie_break == "remain":
+            return -self.state.captains[captain].remain_pts
+        return self.eligible.index(captain)
+
+    def close(self) -> list:
+        st = self.state
+        st.clear_player_proxies(self.player.nickname)
+        if not self.bids:
+            self.player.status = PlayerStatus.FAILED
+            self.result = Failed(self.player.nickname)
+            return [self.result]
+
+        top = max(self.bids.values())
+        tied = [c for c, b in self.bids.items() if b == top]
+        if self.rules.sealed_tie_break == "random":
+            winner = self.rng.choice(tied)
+        else:
+            winner = min(tied, key=self._tie_key)
+
+        ranked = sorted(self.bids.items(), key=lambda kv: (-kv[1], kv[0] != winner))
+        if self.rules.sealed_price == "second":
+            price = ranked[1][1] if len(ranked) > 1 else self.rules.base_bid
+        else:
+            price = top
+
+        st.current_bid, st.current_bidder = price, winner
+        apply_award(st, self.player, winner, price)
+        self.result = Awarded(self.player.nickname, winner, price)
+        return [SealedRevealed(tuple(ranked), self.rules.sealed_price), self.result]
+
+
+# ───────────────────────── 드래프트 전체 ─────────────────────────
+class DraftEngine:
+    """
+    경매자 순서/라운드 진행
+    - next_lot(): 다음 경매자까지 진행 → 마지막 효과는 LotOpened 또는 DraftFinished
+    - open_lot(): 매물 시작 (LotEngine 반환)
+    - after_lot(): 매물 종료 후 처리 (전략 타임)
+    """
+    def __init__(self, state: AuctionState, rules: Rules | None = None, rng: random.Random | None = None):
+        self.state = state
+        self.rules = rules or Rules.from_config()
+        self.rng = rng or random
+        self.resume_captain_idx: Optional[int] = None
+        self.lot: Optional[LotEngine] = None
+
+    def start(
+        self, total_teams: int, initial_points: int,
+        strategy: OrderingStrategy | None = None, seed: int | None = None,
+    ):
+        st = self.state
+        st.total_teams = total_teams
+        st.started = True
+
+        # 개별 포인트가 지정되지 않은 팀장에게만 기본 초기 포인트 적용
+        for c in st.captains.values():
+            if not isinstance(c.total_pts, int) or c.total_pts <= 0:
+                c.total_pts = initial_points
+            c.used_pts = 0
+            c.pause_used = 0
+        st.set_reserve_unit(self.rules.base_bid)
+
+        # 팀장 순번 + 경매자 순서 + 재경매 순위를 시드 하나로 한 번에 결정
+        strategy = strategy or resolve_strategy(CFG.ORDER_STRATEGY)
+        if seed is None:
+            seed = CFG.ORDER_SEED if CFG.ORDER_SEED is not None else self.rng.randrange(2 ** 31)
+        waiting = [st.players[n] for n in st.nicks_with_status(PlayerStatus.WAITING)]
+        schedule = build_schedule(list(st.captains.keys()), waiting, strategy, seed)
+        st.captain_order = schedule.captain_order
+        st.player_order = schedule.player_order
+        st.reauction_rank = schedule.reauction_rank
+        st.order_strategy, st.order_seed = strategy.name, seed
+
+        st.current_player_idx = -1
+        st.current_captain_idx = 0
+        st.phase = "main"
+        st.reset_round()
+
+    def any_team_can_add(self) -> bool:
+        return self.state.any_team_can_add()
+
+    def next_lot(self) -> list:
+        st = self.state
+        effects: list = []
+        if st.current_player_idx is None:
+            st.current_player_idx = -1
+        if st.current_captain_idx is None:
+            st.current_captain_idx = 0
+
+        while True:
+            if st.phase == "done":
+                effects.append(DraftFinished())
+                return effects
+
+            if st.current_player_idx + 1 >= len(st.player_order):
+                # ── 유찰자 재경매(1회) ──
+                if st.phase == "main":
+                    failed = list(st.nicks_with_status(PlayerStatus.FAILED))
+                    if failed and self.any_team_can_add():
+                        for nick in failed:
+                            st.players[nick].status = PlayerStatus.WAITING
+                        last = len(st.reauction_rank)
+                        st.player_order = sorted(failed, key=lambda n: st.reauction_rank.get(n, last))
+                        st.current_player_idx = -1
+                        st.current_captain_idx = 0
+                        st.phase = "reauction"
+                        st.reset_round()
+                        effects.append(RoundStarted("reauction", tuple(st.player_order)))
+                        continue
+                st.phase = "done"
+                continue
+
+            st.current_player_idx += 1
+            p = st.players.get(st.player_order[st.current_player_idx])
+            if not p or p.status != PlayerStatus.WAITING:
+                continue
+
+            if not self.any_team_can_add():
+                p.status = PlayerStatus.FAILED
+                effects.append(AutoFailed(p.nickname))
+                continue
+
+            effects.append(LotOpened(p.nickname))
+            return effects
+
+    def _begin_lot(self, player_nick: str) -> Player:
+        st = self.state
+        p = st.players[player_nick]
+        st.reset_round()
+        p.status = PlayerStatus.ACTIVE
+        if self.resume_captain_idx is not None:
+            # 재개 직후 첫 매물은 저장된 팀장 차례부터
+            st.current_captain_idx = self.resume_captain_idx % max(1, len(st.captain_order))
+            self.resume_captain_idx = None
+        return p
+
+    def open_lot(self, player_nick: str) -> LotEngine:
+        self.lot = LotEngine(self.state, self._begin_lot(player_nick), self.rules)
+        return self.lot
+
+    def open_sealed_lot(self, player_nick: str) -> SealedLotEngine:
+        self.lot = SealedLotEngine(self.state, self._begin_lot(player_nick), self.rules, self.rng)
+        return self.lot
+
+    def after_lot(self) -> list:
+        st = self.state
+        self.lot = None
+        # 전략 타임 (모든 팀 최소 1명 영입 시 1회)
+        if not st.strategy_called and st.everyone_has_member():
+            st.strategy_called = True
+            return [StrategyTime()]
+        return []
+
+
+# ───────────────────────── 헤드리스 시뮬레이션 ─────────────────────────
+@dataclass
+class SimulationResult:
+    lots: int = 0
+    turns: int = 0
+    awarded: int = 0
+    failed: int = 0
+
+
+def simulate_draft(
+    state: AuctionState,
+    decide: Callable[[AuctionState, LotEngine, str], object],
+    rules: Rules | None = None,
+    rng: random.Random | None = None,
+) -> SimulationResult:
+    """
+    디스코드 없이 드래프트 전체를 실행 (state 는 start 까지 끝난 상태여야 함)
+    decide(state, lot, captain) → 입력 이벤트
+    """
+    draft = DraftEngine(state, rules, rng)
+    result = SimulationResult()
+    while True:
+        effects = draft.next_lot()
+        last = effects[-1]
+        if isinstance(last, DraftFinished):
+            break
+        lot = draft.open_lot(last.player)
+        result.lots += 1
+        effects = lot.next_turn()
+        while isinstance(effects[-1], TurnPrompt):
+            effects = lot.handle(decide(state, lot, effects[-1].captain))
+        result.turns += lot.turns
+        if isinstance(lot.result, Awarded):
+            result.awarded += 1
+        draft.after_lot()
+    result.failed = state.count_status(PlayerStatus.FAILED)
+    return result
@@ -0,0 +1,211 @@
+# services/importer.py
+"""
+경매자/팀장 CSV 일괄 등록
+- 첨부 파일을 청크 단위로 받아 줄 단위로 디코딩 → 파일 전체를 메모리에 올리지 않음
+- 행마다 한 번에 검증(항목 수, 필수값, 숫자, 파일 내 중복)하고 실패 사유를 모아 보고
+- dry_run 이면 검증만 하고 등록하지 않음
+- 실패 행은 CSV 보고서(행 번호, 사유, 원본)로 돌려줌
+"""
+import codecs
+import csv
+import io
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterable, List, Optional, Set
+
+import aiohttp
+
+from utils.format import norm_optional
+
+HEADER_MARKERS = {"닉네임", "닉", "nickname", "nick"}
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class RowError:
+    row_no: int
+    reason: str
+    raw: str
+
+
+@dataclass
+class ImportReport:
+    kind: str               # players / captains
+    dry_run: bool = False
+    total: int = 0
+    ok: int = 0
+    header_skipped: bool = False
+    errors: List[RowError] = field(default_factory=list)
+
+    def summary(self) -> str:
+        label = "경매자" if self.kind == "players" else "팀장"
+        verb = "검사" if self.dry_run else "등록"
+        text = f"CSV {label} {verb}: 전체 {self.total}행 → 성공 {self.ok}행 / 실패 {len(self.errors)}행"
+        if self.dry_run:
+            text += " (검사 모드 — 실제 등록은 하지 않았습니다)"
+        return text
+
+    def error_csv_bytes(self) -> bytes:
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(["행", "사유", "원본"])
+        for e in self.errors:
+            writer.writerow([e.row_no, e.reason, e.raw])
+        return out.getvalue().encode("utf-8-sig")
+
+
+# ───────────────────────── 스트리밍 읽기 ─────────────────────────
+async def iter_attachment_lines(att) -> AsyncIterator[str]:
+    """디스코드 첨부 파일을 청크 단위로 받아 한 줄씩 반환 (BOM 제거, 줄바꿈 정규화)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buf = ""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(att.url) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                buf += decoder.decode(chunk)
+                lines = buf.splitlines(keepends=True)
+                # 마지막 조각이 줄바꿈으로 끝나지 않았으면 다음 청크와 이어 붙임
+                buf = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+                for line in lines:
+                    yield line
+    buf += decoder.decode(b"", final=True)
+    if buf:
+        yield buf
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple]:
+    """
+    줄 → (시작 행 번호, 필드 목록, 원본)
+    따옴표 안에 줄바꿈이 있는 셀은 따옴표 짝이 맞을 때까지 이어 붙여 한 레코드로 처리
+    """
+    line_no = 0
+    pending, start_no = "", 0
+    async for line in lines:
+        line_no += 1
+        if not pending:
+            start_no = line_no
+        pending += line
+        if pending.count('"') % 2 == 1:
+            continue
+        raw = pending.rstrip("\r\n")
+        pending = ""
+        for row in csv.reader([raw]):
+            yield start_no, row, raw
+    if pending:
+        raw = pending.rstrip("\r\n")
+        for row in csv.reader([raw]):
+            yield start_no, row, raw
+
+
+# ───────────────────────── 행 검증/등록 ─────────────────────────
+def _is_header(row: List[str]) -> bool:
+    return any((c or "").strip().lower() in HEADER_MARKERS for c in row)
+
+
+def _parse_optional_int(value: str, label: str, minimum: int) -> Optional[int]:
+    v = norm_optional(value)
+    if v is None:
+        return None
+    try:
+        n = int(v)
+    except ValueError:
+        raise ValueError(f"{label}는 정수여야 합니다.")
+    if n < minimum:
+        raise ValueError(f"{label}는 {minimum} 이상이어야 합니다.")
+    return n
+
+
+class CsvImporter:
+    """
+    players: 이름, 닉네임, 티어, 주라인, 부라인, 모스트1[, 모스트2][, 모스트3]
+    captains: 팀명, 이름, 닉네임, 티어, 주라인, 부라인, 모스트1[, 모스트2][, 모스트3][, 초기포인트][, 팀인원]
+    """
+    def __init__(self, service, kind: str, dry_run: bool = False):
+        self.service = service
+        self.report = ImportReport(kind=kind, dry_run=dry_run)
+        self._seen_nicks: Set[str] = set()
+        self._seen_teams: Set[str] = set()
+        self._first = True
+
+    async def run(self, records: AsyncIterator[tuple]) -> ImportReport:
+        async for row_no, row, raw in records:
+            self.feed(row_no, row, raw)
+        return self.report
+
+    def run_sync(self, records: Iterable[tuple]) -> ImportReport:
+        for row_no, row, raw in records:
+            self.feed(row_no, row, raw)
+        return self.report
+
+    def feed(self, row_no: int, row: List[str], raw: str) -> None:
+        if not row or not any(c.strip() for c in row) or row[0].strip().startswith("#"):
+            return
+        if self._first:
+            self._first = False
+            if _is_header(row):
+                self.report.header_skipped = True
+                return
+
+        self.report.total += 1
+        cells = [c.strip() for c in row]
+        try:
+            if self.report.kind == "players":
+                self._player_row(cells)
+            else:
+                self._captain_row(cells)
+        except ValueError as e:
+            self.report.errors.append(RowError(row_no, str(e), raw))
+            return
+        self.report.ok += 1
+
+    def _check_nick(self, nick: str):
+        key = nick.lower()
+        if key in self._seen_nicks:
+            raise ValueError(f"파일 안에서 닉네임이 중복됩니다: {nick}")
+        self._seen_nicks.add(key)
+
+    def _player_row(self, cells: List[str]):
+        if len(cells) < 6:
+            raise ValueError(f"항목 수 부족 ({len(cells)}/6)")
+        name, nick, tier, main_p, sub_p, m1 = cells[:6]
+        m2 = cells[6] if len(cells) > 6 else None
+        m3 = cells[7] if len(cells) > 7 else None
+        missing = [label for label, v in (("이름", name), ("닉네임", nick), ("티어", tier),
+                                          ("주라인", main_p), ("부라인", sub_p), ("모스트1", norm_optional(m1))) if not v]
+        if missing:
+            raise ValueError("필수 항목 누락: " + ", ".join(missing))
+        self._check_nick(nick)
+        if not self.report.dry_run:
+            self.service.add_player(name, nick, tier, main_p, sub_p, m1, m2, m3)
+
+    def _captain_row(self, cells: List[str]):
+        if len(cells) < 7:
+            raise ValueError(f"항목 수 부족 ({len(cells)}/7)")
+        cells = cells + [""] * (11 - len(cells))
+        team_name, real_name, nick, tier, main_p, sub_p, m1, m2, m3 = cells[:9]
+        missing = [label for label, v in (("팀명", team_name), ("이름", real_name), ("닉네임", nick), ("티어", tier),
+                                          ("주라인", main_p), ("부라인", sub_p), ("모스트1", norm_optional(m1))) if not v]
+        if missing:
+            raise ValueError("필수 항목 누락: " + ", ".join(missing))
+        init_pts = _parse_optional_int(cells[9], "초기 포인트", 0)
+        team_limit = _parse_optional_int(cells[10], "팀 인원", 2)
+        if team_name.lower() in self._seen_teams:
+            raise ValueError(f"파일 안에서 팀명이 중복됩니다: {team_name}")
+        self._seen_teams.add(team_name.lower())
+        self._check_nick(nick)
+        if not self.report.dry_run:
+            self.service.add_captain(
+                team_name=team_name, real_name=real_name, nick=nick, tier=tier,
+                main_p=main_p, sub_p=sub_p, m1=m1, m2=m2, m3=m3,
+                init_pts=init_pts, team_limit=team_limit,
+            )
+
+
+async def import_attachment(service, att, kind: str, dry_run: bool = False) -> ImportReport:
+    importer = CsvImporter(service, kind, dry_run=dry_run)
+    records = iter_csv_records(iter_attachment_lines(att))
+    if dry_run or not service.running:
+        return await importer.run(records)
+    # 경매 진행 중에는 다 받은 뒤 경매 루프 차례에 한 번에 등록 (받는 도중 상태가 바뀌지 않도록)
+    rows = [rec async for rec in records]
+    return await service.execute(importer.run_sync, rows)
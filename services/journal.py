@@ -0,0 +1,330 @@
+# services/journal.py
+"""
+세션 상태 저널 (크래시 복구용)
+- 상태 변경은 append-only JSONL 저널(journal.jsonl)에 이벤트로 기록
+- 일정 개수마다 전체 상태를 snapshot.json 으로 압축하고 저널을 비움
+- 기록(record)은 메모리 버퍼에만 쌓고, 실제 파일 쓰기는 백그라운드 태스크가
+  모아서 스레드에서 처리 → 턴 사이 이벤트 루프를 막지 않음
+- 모든 이벤트에 seq 를 붙여, 스냅샷에 이미 반영된 이벤트는 재생 시 건너뜀
+"""
+import asyncio
+import datetime
+import json
+import os
+import shutil
+from typing import Any, Callable, Dict, List, Optional
+
+from models.entities import AuctionState, Captain, Player, PlayerStatus, Team
+from services.engine import apply_award
+import config as CFG
+
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_FILE = "journal.jsonl"
+
+
+# ───────────────────────── 상태 직렬화 ─────────────────────────
+def _dt_to_str(v: Optional[datetime.datetime]) -> Optional[str]:
+    return v.isoformat() if v else None
+
+
+def _str_to_dt(v: Optional[str]) -> Optional[datetime.datetime]:
+    return datetime.datetime.fromisoformat(v) if v else None
+
+
+def state_to_dict(state: AuctionState) -> Dict[str, Any]:
+    return {
+        "total_teams": state.total_teams,
+        "started": state.started,
+        "strategy_called": state.strategy_called,
+        "channel_id": state.channel_id,
+        "phase": state.phase,
+        "lot_mode": state.lot_mode,
+        "players": [
+            {
+                "name": p.name, "nickname": p.nickname, "tier": p.tier,
+                "main_pos": p.main_pos, "sub_pos": p.sub_pos,
+                "most1": p.most1, "most2": p.most2, "most3": p.most3,
+                "status": p.status, "won_team": p.won_team, "won_price": p.won_price,
+            }
+            for p in state.players.values()
+        ],
+        "captains": [
+            {
+                "team_name": c.team_name, "real_name": c.real_name, "nickname": c.nickname,
+                "tier": c.tier, "main_pos": c.main_pos, "sub_pos": c.sub_pos,
+                "most1": c.most1, "most2": c.most2, "most3": c.most3,
+                "total_pts": c.total_pts, "used_pts": c.used_pts, "pause_used": c.pause_used,
+            }
+            for c in state.captains.values()
+        ],
+        "teams": [
+            {"captain_nick": t.captain_nick, "members": list(t.members), "limit": t.limit}
+            for t in state.teams.values()
+        ],
+        "captain_user_map": [[uid, nick] for uid, nick in state.captain_user_map.items()],
+        "player_order": list(state.player_order),
+        "captain_order": list(state.captain_order),
+        "order_strategy": state.order_strategy,
+        "order_seed": state.order_seed,
+        "reauction_rank": dict(state.reauction_rank),
+        "current_player_idx": state.current_player_idx,
+        "current_captain_idx": state.current_captain_idx,
+        "paused_until": _dt_to_str(state.paused_until),
+        "pause_owner": state.pause_owner,
+        "proxy_by_player": {c: dict(v) for c, v in state.proxy_by_player.items()},
+        "proxy_by_tier": {c: dict(v) for c, v in state.proxy_by_tier.items()},
+    }
+
+
+def state_from_dict(data: Dict[str, Any]) -> AuctionState:
+    state = AuctionState(
+        total_teams=data.get("total_teams", 0),
+        started=data.get("started", False),
+        strategy_called=data.get("strategy_called", False),
+        channel_id=data.get("channel_id"),
+        phase=data.get("phase", "main"),
+        lot_mode=data.get("lot_mode"),
+    )
+    for row in data.get("players", []):
+        state.put_player(Player(**row))
+    for row in data.get("captains", []):
+        state.put_captain(Captain(**row))
+    for row in data.get("teams", []):
+        state.put_team(Team(**row))
+    for uid, nick in data.get("captain_user_map", []):
+        state.bind_captain_user(int(uid), nick)
+    state.player_order = list(data.get("player_order", []))
+    state.captain_order = list(data.get("captain_order", []))
+    state.order_strategy = data.get("order_strategy", "random")
+    state.order_seed = data.get("order_seed")
+    state.reauction_rank = dict(data.get("reauction_rank", {}))
+    state.current_player_idx = data.get("current_player_idx", -1)
+    state.current_captain_idx = data.get("current_captain_idx", 0)
+    state.paused_until = _str_to_dt(data.get("paused_until"))
+    state.pause_owner = data.get("pause_owner")
+    state.proxy_by_player = {c: dict(v) for c, v in data.get("proxy_by_player", {}).items()}
+    state.proxy_by_tier = {c: dict(v) for c, v in data.get("proxy_by_tier", {}).items()}
+    return state
+
+
+# ───────────────────────── 이벤트 재생 ─────────────────────────
+def apply_event(service, ev: Dict[str, Any]) -> None:
+    """
+    저널 이벤트 1건을 서비스 상태에 반영 (재생 전용 — 저널 기록은 하지 않음)
+    등록/바인딩은 서비스 메서드를, 진행 중 변경은 상태에 직접 반영
+    """
+    kind = ev["kind"]
+    st = service.state
+
+    if kind == "reset":
+        channel_id = st.channel_id
+        service.state = AuctionState(channel_id=channel_id)
+    elif kind == "captain":
+        service.add_captain(**ev["data"])
+    elif kind == "player":
+        service.add_player(**ev["data"])
+    elif kind == "bind":
+        st.bind_captain_user(ev["user_id"], ev["captain"])
+    elif kind == "start":
+        st.total_teams = ev["total_teams"]
+        st.started = True
+        st.phase = "main"
+        for nick, pts in ev["points"].items():
+            cap = st.captains[nick]
+            cap.total_pts, cap.used_pts, cap.pause_used = pts, 0, 0
+        st.captain_order = list(ev["captain_order"])
+        st.player_order = list(ev["player_order"])
+        st.order_strategy = ev.get("order_strategy", "random")
+        st.order_seed = ev.get("order_seed")
+        st.reauction_rank = {nick: i for i, nick in enumerate(ev.get("reauction_order", []))}
+        st.current_player_idx = -1
+        st.reset_round()
+    elif kind == "round":
+        st.phase = ev["phase"]
+        st.player_order = list(ev["player_order"])
+        for nick in st.player_order:
+            st.players[nick].status = PlayerStatus.WAITING
+        st.current_player_idx = -1
+        st.reset_round()
+    elif kind == "lot":
+        st.current_player_idx = ev["player_idx"]
+        st.reset_round()
+        st.players[ev["player"]].status = PlayerStatus.ACTIVE
+    elif kind == "turn":
+        st.current_captain_idx = ev["captain_idx"]
+    elif kind == "award":
+        apply_award(st, st.players[ev["player"]], ev["captain"], ev["price"])
+        st.clear_player_proxies(ev["player"])
+    elif kind == "fail":
+        st.players[ev["player"]].status = PlayerStatus.FAILED
+        st.clear_player_proxies(ev["player"])
+    elif kind == "mode":
+        st.lot_mode = ev["mode"]
+    elif kind == "proxy":
+        st.set_proxy(ev["captain"], ev["target_kind"], ev["target"], ev["limit"])
+    elif kind == "pause":
+        st.captains[ev["captain"]].pause_used += 1
+        st.pause_owner = ev["captain"]
+        st.paused_until = _str_to_dt(ev["until"])
+    elif kind == "unpause":
+        st.pause_owner = None
+        st.paused_until = None
+    elif kind == "strategy":
+        st.strategy_called = True
+    elif kind == "done":
+        st.phase = "done"
+
+
+# ───────────────────────── 저널 ─────────────────────────
+class SessionJournal:
+    """
+    세션 1개 전용 저널
+    - record(): 동기 호출, 버퍼에 적재 후 라이터 태스크를 깨움
+    - 라이터는 JOURNAL_FLUSH_INTERVAL_SEC 동안 모았다가 한 번에 기록
+    - JOURNAL_SNAPSHOT_EVERY 건마다 스냅샷으로 압축
+    """
+    def __init__(self, directory: str, snapshot_provider: Callable[[], Dict[str, Any]]):
+        self.directory = directory
+        self._snapshot_provider = snapshot_provider
+        self._pending: List[str] = []
+        self._seq = 0
+        self._since_snapshot = 0
+        self._wake: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # 라이터/flush/close 의 기록을 직렬화 (스냅샷의 저널 비우기가 뒤 배치의 추가 기록을 지우지 않도록)
+        self._write_lock = asyncio.Lock()
+        self.suspended = False   # 재생 중에는 기록하지 않음
+
+    @property
+    def snapshot_path(self) -> str:
+        return os.path.join(self.directory, SNAPSHOT_FILE)
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.directory, JOURNAL_FILE)
+
+    # ── 복구 ──
+    def load(self, service) -> bool:
+        """디스크의 스냅샷 + 저널을 서비스에 반영. 복구할 내용이 있었으면 True"""
+        found = False
+        base_seq = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snap = json.load(f)
+            base_seq = snap.get("seq", 0)
+            service.state = state_from_dict(snap["state"])
+            found = True
+
+        self._seq = base_seq
+        if os.path.exists(self.journal_path):
+            self.suspended = True
+            try:
+                with open(self.journal_path, encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            ev = json.loads(line)
+                        except json.JSONDecodeError:
+                            break   # 마지막 줄이 쓰다 만 상태 → 그 앞까지만 신뢰
+                        if ev.get("seq", 0) <= base_seq:
+                            continue
+                        apply_event(service, ev)
+                        self._seq = ev["seq"]
+                        self._since_snapshot += 1
+                        found = True
+            finally:
+                self.suspended = False
+        return found
+
+    # ── 기록 ──
+    def record(self, kind: str, **data) -> None:
+        if self.suspended:
+            return
+        self._seq += 1
+        self._since_snapshot += 1
+        ev = {"seq": self._seq, "kind": kind, **data}
+        self._pending.append(json.dumps(ev, ensure_ascii=False))
+        self._ensure_writer()
+        if self._wake is not None:
+            self._wake.set()
+        else:
+            # 이벤트 루프 밖(스크립트/시뮬레이션)에서는 즉시 동기 기록
+            self._flush_sync()
+
+    def _ensure_writer(self) -> None:
+        if self._writer_task is not None and not self._writer_task.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wake = asyncio.Event()
+        self._writer_task = asyncio.create_task(self._writer())
+
+    def _take_batch(self):
+        lines, self._pending = self._pending, []
+        snap = None
+        if self._since_snapshot >= CFG.JOURNAL_SNAPSHOT_EVERY:
+            snap = {"seq": self._seq, "state": self._snapshot_provider()}
+            self._since_snapshot = 0
+        return lines, snap
+
+    async def _writer(self) -> None:
+        while True:
+            await self._wake.wait()
+            await asyncio.sleep(CFG.JOURNAL_FLUSH_INTERVAL_SEC)
+            self._wake.clear()
+            await self._write_batch()
+
+    async def _write_batch(self) -> None:
+        # 배치 꺼내기 ~ 기록 완료까지 잠금 유지 → 기록 스레드가 한 번에 하나, 배치 순서대로
+        async with self._write_lock:
+            lines, snap = self._take_batch()   # 스냅샷은 루프 스레드에서 일관되게 떠 둠
+            if lines or snap:
+                await asyncio.to_thread(self._write, lines, snap)
+
+    def _flush_sync(self) -> None:
+        lines, snap = self._take_batch()
+        if lines or snap:
+            self._write(lines, snap)
+
+    async def flush(self) -> None:
+        await self._write_batch()
+
+    def _write(self, lines: List[str], snap: Optional[Dict[str, Any]]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        if snap is not None:
+            # 스냅샷이 버퍼의 이벤트까지 모두 포함하므로 저널은 비워도 됨
+            tmp = self.snapshot_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(snap, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+            open(self.journal_path, "w", encoding="utf-8").close()
+            return
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def close(self, discard: bool = False) -> None:
+        """라이터를 멈추고 남은 버퍼를 기록 (discard 면 버리고 디렉터리 삭제)"""
+        # 잠금을 잡으면 진행 중인 기록 스레드가 끝난 뒤 → 라이터는 대기 중일 때만 취소됨
+        async with self._write_lock:
+            task, self._writer_task = self._writer_task, None
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            if discard:
+                self._pending = []
+                await asyncio.to_thread(shutil.rmtree, self.directory, ignore_errors=True)
+                return
+            lines, snap = self._take_batch()
+            if lines or snap:
+                await asyncio.to_thread(self._write, lines, snap)
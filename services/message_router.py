@@ -0,0 +1,92 @@
+# services/message_router.py
+"""
+텍스트 차례 입력 라우터
+- 봇 전체에서 on_message 한 번만 받아, 입력을 기다리는 차례에 바로 넘김
+  (세션마다 bot.wait_for 술어를 걸면 메시지마다 모든 술어를 검사 → 메시지 수 × 대기 수)
+- 대기는 (채널 ID, 유저 ID) 로 색인, 유저 ID 를 모르는 팀장(바인딩 전)은 (채널 ID, 닉네임) 으로 색인
+- `!입찰` / `!패스` / `!관심없음` / `!퍼즈` 파싱은 여기서 한 번만
+- `!퍼즈 종료` 는 차례 입력이 아니므로 라우팅하지 않음 (`!퍼즈` 명령이 처리)
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+BID_WORDS = ("!입찰",)
+PASS_WORDS = ("!패스", "!pass")
+NO_INTEREST_WORDS = ("!관심없음", "!관심없어", "!nointerest")
+
+
+@dataclass(frozen=True)
+class TurnCommand:
+    """파싱된 차례 입력 — action: bid / pass / no_interest / pause, 금액이 잘못된 `!입찰` 은 bid + amount None"""
+    action: str
+    amount: Optional[int] = None
+
+
+def parse_turn_command(content: str) -> Optional[TurnCommand]:
+    """차례 입력이 아니면 None"""
+    content = (content or "").strip()
+    if not content.startswith("!"):
+        return None
+    if content.startswith(BID_WORDS):
+        parts = content.split()
+        if len(parts) >= 2 and parts[1].lstrip("-").isdigit():
+            return TurnCommand("bid", int(parts[1]))
+        return TurnCommand("bid")
+    if content in PASS_WORDS:
+        return TurnCommand("pass")
+    if content.replace(" ", "") in NO_INTEREST_WORDS:
+        return TurnCommand("no_interest")
+    if content.startswith("!퍼즈"):
+        return None if content.startswith("!퍼즈 종료") else TurnCommand("pause")
+    return None
+
+
+# handler(message, command) → 이 대기가 받아들였으면 True (아니면 다음 색인으로)
+Handler = Callable[[object, TurnCommand], bool]
+
+
+class MessageRouter:
+    def __init__(self):
+        self._by_user: Dict[Tuple[int, int], Handler] = {}
+        self._by_name: Dict[Tuple[int, str], Handler] = {}
+
+    def expect(self, channel_id: int, handler: Handler, user_id: Optional[int] = None,
+               names: Iterable[str] = ()) -> Callable[[], None]:
+        """대기 등록 — 해제 함수를 돌려줌 (같은 키의 이전 대기는 덮어씀)"""
+        keys = []
+        if user_id is not None:
+            keys.append((self._by_user, (channel_id, user_id)))
+        for name in names:
+            keys.append((self._by_name, (channel_id, name)))
+        for index, key in keys:
+            index[key] = handler
+
+        def cancel():
+            for index, key in keys:
+                if index.get(key) is handler:
+                    del index[key]
+        return cancel
+
+    def dispatch(self, message) -> bool:
+        """메시지 1개 라우팅 — 어떤 대기가 받아들였으면 True"""
+        cmd = parse_turn_command(message.content)
+        if cmd is None:
+            return False
+        channel_id = message.channel.id
+        handler = self._by_user.get((channel_id, message.author.id))
+        if handler is not None and handler(message, cmd):
+            return True
+        if not self._by_name:
+            return False
+        for name in {(message.author.display_name or "").strip(), (message.author.name or "").strip()}:
+            handler = self._by_name.get((channel_id, name))
+            if handler is not None and handler(message, cmd):
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self._by_user) + len(self._by_name)
+
+
+# 봇 전체에서 하나 (AuctionCog 의 on_message 리스너가 dispatch)
+turn_router = MessageRouter()
@@ -0,0 +1,127 @@
+# services/ordering.py
+"""
+경매자 순서 전략
+- random: 무작위 (기존 방식)
+- tier: 티어 높은 순, 같은 티어 안에서는 무작위
+- position: 같은 주 라인이 연달아 나오지 않도록 라인별로 번갈아 배치
+- snake: 티어 순으로 팀 수만큼 끊어 한 줄씩 방향을 바꿈 (높→낮, 낮→높 …)
+- build_schedule(): 시작 시 한 번만 계산 — 본 경매 순서 + 재경매 우선순위(유찰자에게 같은 전략을 적용한 순위)
+  재경매 때는 유찰자를 이 순위로 정렬만 하므로 난수/전략을 다시 돌리지 않음
+- 같은 시드면 같은 순서 (팀장 순번 포함)
+"""
+import heapq
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from models.entities import Player
+from models.tiers import tier_score
+from models.view_format import norm
+
+
+class OrderingStrategy:
+    name = ""
+    label = ""
+
+    def order(self, players: Sequence[Player], rng: random.Random, teams: int) -> List[str]:
+        raise NotImplementedError
+
+
+def _by_tier(players: Sequence[Player], rng: random.Random) -> List[Player]:
+    """티어 높은 순 (같은 티어/모르는 티어는 무작위, 모르는 티어는 맨 뒤)"""
+    keyed = [(-(tier_score(p.tier) or 0.0), rng.random(), p) for p in players]
+    keyed.sort(key=lambda x: (x[0], x[1]))
+    return [p for _, _, p in keyed]
+
+
+class RandomOrder(OrderingStrategy):
+    name, label = "random", "무작위"
+
+    def order(self, players, rng, teams):
+        nicks = [p.nickname for p in players]
+        rng.shuffle(nicks)
+        return nicks
+
+
+class TierSeededOrder(OrderingStrategy):
+    name, label = "tier", "티어순"
+
+    def order(self, players, rng, teams):
+        return [p.nickname for p in _by_tier(players, rng)]
+
+
+class PositionBalancedOrder(OrderingStrategy):
+    name, label = "position", "라인 균형"
+
+    def order(self, players, rng, teams):
+        buckets: Dict[str, List[str]] = {}
+        for p in players:
+            buckets.setdefault(norm(p.main_pos), []).append(p.nickname)
+        heap = []
+        for pos, nicks in buckets.items():
+            rng.shuffle(nicks)
+            heapq.heappush(heap, (-len(nicks), rng.random(), pos))
+        out: List[str] = []
+        held = None   # 방금 뽑은 라인은 한 번 쉬게 함
+        while heap:
+            neg, tie, pos = heapq.heappop(heap)
+            out.append(buckets[pos].pop())
+            if held is not None:
+                heapq.heappush(heap, held)
+            held = (neg + 1, tie, pos) if neg + 1 < 0 else None
+        if held is not None:
+            # 한 라인만 남은 경우 — 어쩔 수 없이 연달아 배치
+            out.extend(reversed(buckets[held[2]]))
+        return out
+
+
+class SnakeOrder(OrderingStrategy):
+    name, label = "snake", "스네이크"
+
+    def order(self, players, rng, teams):
+        ranked = [p.nickname for p in _by_tier(players, rng)]
+        width = max(1, teams)
+        out: List[str] = []
+        for i in range(0, len(ranked), width):
+            row = ranked[i:i + width]
+            out.extend(row if (i // width) % 2 == 0 else reversed(row))
+        return out
+
+
+STRATEGIES: Dict[str, OrderingStrategy] = {
+    s.name: s for s in (RandomOrder(), TierSeededOrder(), PositionBalancedOrder(), SnakeOrder())
+}
+STRATEGY_ALIASES = {
+    "무작위": "random", "랜덤": "random",
+    "티어": "tier", "티어순": "tier",
+    "라인": "position", "포지션": "position", "라인균형": "position",
+    "스네이크": "snake", "뱀": "snake",
+}
+
+
+def resolve_strategy(name: Optional[str]) -> OrderingStrategy:
+    key = norm(name)
+    key = STRATEGY_ALIASES.get(key, key)
+    if key not in STRATEGIES:
+        raise ValueError(f"알 수 없는 순서 방식: {name} (가능: {', '.join(STRATEGIES)})")
+    return STRATEGIES[key]
+
+
+@dataclass
+class Schedule:
+    captain_order: List[str]
+    player_order: List[str]
+    reauction_rank: Dict[str, int]   # 재경매 때 유찰자 정렬용 순위
+
+
+def build_schedule(
+    captains: Sequence[str], players: Sequence[Player], strategy: OrderingStrategy, seed: int,
+) -> Schedule:
+    rng = random.Random(seed)
+    captain_order = list(captains)
+    rng.shuffle(captain_order)
+    teams = len(captain_order)
+    player_order = strategy.order(players, rng, teams)
+    # 재경매 순위: 같은 전략을 한 번 더 돌린 순서 (유찰자 부분집합에서도 전략의 성격이 대체로 유지됨)
+    rerun = strategy.order(players, rng, teams)
+    return Schedule(captain_order, player_order, {nick: i for i, nick in enumerate(rerun)})
@@ -0,0 +1,176 @@
+# services/outbox.py
+"""
+채널별 발신 큐
+- post(): 짧은 안내(입찰/패스/자동 패스/인원 제한 등)를 큐에 넣기만 하고 즉시 반환
+- 워커가 큐에 쌓인 연속 안내를 한 메시지로 합쳐 전송 (또는 직전 안내 메시지에 이어 붙여 수정)
+- 채널 전송 버킷(기본 5회/5초)을 미리 지켜 429 백오프로 경매가 멈추지 않게 함
+- send(): 뷰/파일이 붙는 메시지처럼 Message 객체가 필요한 경우 — 큐를 먼저 비운 뒤 전송 (순서 보장)
+- edit(): 차례 메시지처럼 제자리에서 바꾸는 메시지 — 버킷만 같이 씀
+"""
+import asyncio
+import time
+import traceback
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Tuple
+
+import config as CFG
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+
+class RateBucket:
+    """단순 토큰 버킷: per 초마다 capacity 회"""
+    def __init__(self, capacity: int, per: float):
+        self.capacity = capacity
+        self.per = per
+        self._stamps: Deque[float] = deque()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            while self._stamps and now - self._stamps[0] >= self.per:
+                self._stamps.popleft()
+            if len(self._stamps) < self.capacity:
+                self._stamps.append(now)
+                return
+            await asyncio.sleep(self.per - (now - self._stamps[0]))
+
+
+class OutboxStats:
+    def __init__(self):
+        self.posted = 0          # post()로 들어온 안내 수
+        self.api_calls = 0       # 실제 전송/수정 호출 수
+        self.merged = 0          # 합쳐지거나 이어 붙여져 절약된 호출 수
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    @property
+    def latency_avg(self) -> float:
+        return self.latency_total / self.api_calls if self.api_calls else 0.0
+
+
+class ChannelOutbox:
+    def __init__(self, send: Callable[..., Awaitable], *, max_len: int | None = None):
+        self._send = send
+        self.max_len = max_len or CFG.OUTBOX_MAX_MESSAGE_LEN
+        self.bucket = RateBucket(CFG.OUTBOX_RATE_CAPACITY, CFG.OUTBOX_RATE_PER_SEC)
+        self.stats = OutboxStats()
+        self._queue: Deque[Tuple[str, float]] = deque()
+        self._wake = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._worker: Optional[asyncio.Task] = None
+        # 직전 안내 메시지 (이어 붙이기용) — (Message, content, 전송 시각)
+        self._last: Optional[Tuple[object, str, float]] = None
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    # ───────────────────────── 공개 API ─────────────────────────
+    def post(self, text: str) -> None:
+        """짧은 안내를 큐에 넣음 (전송은 워커가 묶어서 처리)"""
+        self._queue.append((text, time.monotonic()))
+        self.stats.posted += 1
+        self._idle.clear()
+        self._wake.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def send(self, content: str | None = None, **kwargs):
+        """Message 객체가 필요한 전송 — 큐에 남은 안내를 먼저 내보낸 뒤 직접 전송"""
+        await self.flush()
+        await self.bucket.acquire()
+        started = time.monotonic()
+        msg = await self._send(content, **kwargs)
+        self._record(started)
+        self._last = None   # 다른 메시지가 끼었으므로 이어 붙이기 중단
+        return msg
+
+    async def edit(self, msg, **kwargs):
+        """이미 보낸 메시지 수정 (같은 전송 버킷 사용) — 실패하면 예외를 그대로 전달"""
+        await self.bucket.acquire()
+        started = time.monotonic()
+        await msg.edit(**kwargs)
+        self._record(started)
+
+    async def flush(self) -> None:
+        """큐가 비고 전송 중인 안내까지 끝날 때까지 대기 (워커는 배치를 꺼낸 뒤 전송하므로 큐만 보면 안 됨)"""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._queue.clear()
+        self._idle.set()
+
+    def report(self) -> str:
+        s = self.stats
+        return (
+            f"발신 큐 대기 {self.depth}건 / 안내 {s.posted}건 → API 호출 {s.api_calls}회 "
+            f"(병합 {s.merged}회) / 평균 지연 {s.latency_avg * 1000:.0f}ms, 최대 {s.latency_max * 1000:.0f}ms"
+        )
+
+    # ───────────────────────── 내부 ─────────────────────────
+    def _record(self, enqueued_at: float) -> None:
+        lat = time.monotonic() - enqueued_at
+        self.stats.api_calls += 1
+        self.stats.latency_total += lat
+        self.stats.latency_max = max(self.stats.latency_max, lat)
+
+    def _take_batch(self, room: int) -> Tuple[str, float, int]:
+        """큐 앞에서부터 room 글자 안에 들어가는 만큼 꺼내 한 덩어리로"""
+        parts, first_at, used = [], self._queue[0][1], 0
+        while self._queue:
+            text = self._queue[0][0][: self.max_len]
+            add = len(text) + (1 if parts else 0)
+            if parts and used + add > room:
+                break
+            parts.append(text)
+            used += add
+            self._queue.popleft()
+        return "\n".join(parts), first_at, len(parts)
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._idle.set()
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            await self.bucket.acquire()   # 버킷을 기다리는 동안 안내가 더 쌓이면 함께 합쳐짐
+            try:
+                await self._deliver()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                traceback.print_exc()
+
+    async def _deliver(self) -> None:
+        # 1) 직전 안내 메시지에 이어 붙일 수 있으면 수정으로 처리
+        if CFG.OUTBOX_APPEND_BY_EDIT and self._last is not None:
+            msg, content, sent_at = self._last
+            room = self.max_len - len(content) - 1
+            fresh = time.monotonic() - sent_at <= CFG.OUTBOX_APPEND_WINDOW_SEC
+            if fresh and room > 0 and len(self._queue[0][0]) <= room:
+                text, first_at, n = self._take_batch(room)
+                new_content = content + "\n" + text
+                try:
+                    await msg.edit(content=new_content)
+                    self._record(first_at)
+                    self.stats.merged += n
+                    self._last = (msg, new_content, sent_at)
+                    return
+                except Exception:
+                    # 수정 실패 시 같은 내용을 새 메시지로
+                    self._queue.appendleft((text, first_at))
+                    self._last = None
+
+        # 2) 새 메시지로 전송
+        text, first_at, n = self._take_batch(self.max_len)
+        msg = await self._send(text)
+        self._record(first_at)
+        self.stats.merged += n - 1
+        self._last = (msg, text, time.monotonic())
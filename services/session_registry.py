@@ -0,0 +1,105 @@
+# services/session_registry.py
+import asyncio
+import os
+import traceback
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from services.auction_service import AuctionService
+from services.journal import SessionJournal, state_to_dict
+import config as CFG
+
+SessionKey = Tuple[int, int]  # (guild_id, channel_id)
+
+
+class SessionLimitError(RuntimeError):
+    """동시 진행 가능한 세션 수를 초과했을 때"""
+
+
+class SessionRegistry:
+    """
+    채널 단위 경매 세션 레지스트리
+    - (길드 ID, 채널 ID) → AuctionService 1:1 매핑
+    - 세션마다 독립적인 AuctionState 를 가지므로 여러 채널에서 동시에 경매 가능
+    - 상한에 도달하면 아무 것도 등록되지 않은 빈 세션부터 정리
+    - 세션 생성 시 디스크 저널이 있으면 그 상태로 복구 (봇 재시작 대비)
+    """
+    def __init__(self, max_sessions: int | None = None):
+        self._sessions: Dict[SessionKey, AuctionService] = {}
+        self.max_sessions = max_sessions or CFG.MAX_CONCURRENT_SESSIONS
+        self._closing: Set[asyncio.Task] = set()   # 정리 중인 저널 (끝날 때까지 참조 유지)
+
+    @staticmethod
+    def key_for(ctx) -> SessionKey:
+        guild_id = ctx.guild.id if getattr(ctx, "guild", None) else 0
+        return (guild_id, ctx.channel.id)
+
+    def get(self, key: SessionKey) -> Optional[AuctionService]:
+        return self._sessions.get(key)
+
+    def get_or_create(self, key: SessionKey) -> AuctionService:
+        service = self._sessions.get(key)
+        if service is not None:
+            return service
+
+        if len(self._sessions) >= self.max_sessions:
+            self._evict_idle()
+        if len(self._sessions) >= self.max_sessions:
+            raise SessionLimitError(
+                f"동시에 진행 가능한 경매 수({self.max_sessions})를 초과했습니다. 다른 경매가 끝난 뒤 다시 시도해 주세요."
+            )
+
+        service = AuctionService()
+        service.state.channel_id = key[1]
+        if CFG.JOURNAL_ENABLED:
+            journal = SessionJournal(self._journal_dir(key), lambda: state_to_dict(service.state))
+            service.attach_journal(journal)
+        self._sessions[key] = service
+        return service
+
+    @staticmethod
+    def _journal_dir(key: SessionKey) -> str:
+        return os.path.join(CFG.JOURNAL_DIR, f"{key[0]}_{key[1]}")
+
+    async def drop(self, key: SessionKey) -> None:
+        """세션 종료: 진행 중인 경매 루프를 멈추고 상태를 비운 뒤 레지스트리에서 제거"""
+        service = self._sessions.pop(key, None)
+        if service is not None:
+            await service.stop()
+            service.reset_all()
+            if service.journal is not None:
+                await service.journal.close(discard=True)
+
+    def _evict_idle(self) -> None:
+        # 시작 전이고 등록 정보도 없는 세션은 버려도 잃을 것이 없음
+        for key, service in list(self._sessions.items()):
+            st = service.state
+            if not st.started and not st.captains and not st.players:
+                del self._sessions[key]
+                if service.journal is not None:
+                    self._close_journal(service.journal)
+
+    def _close_journal(self, journal: SessionJournal) -> None:
+        # 동기 경로(get_or_create)에서 호출 → 루프가 돌고 있으면 태스크로 넘기고 끝날 때까지 참조 유지
+        try:
+            task = asyncio.get_running_loop().create_task(journal.close(discard=True))
+        except RuntimeError:
+            asyncio.run(journal.close(discard=True))   # 루프 밖(스크립트/시뮬레이션)
+            return
+        self._closing.add(task)
+        task.add_done_callback(self._closed)
+
+    def _closed(self, task: asyncio.Task) -> None:
+        self._closing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            traceback.print_exception(task.exception())
+
+    async def wait_closed(self) -> None:
+        """정리 중인 저널이 모두 끝날 때까지 대기 (봇 종료/테스트)"""
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def items(self) -> Iterator[Tuple[SessionKey, AuctionService]]:
+        return iter(list(self._sessions.items()))
@@ -0,0 +1,57 @@
+# tests/test_allocator.py
+import os
+import sys
+import unittest
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.entities import PlayerStatus  # noqa: E402
+from services.auction_service import AuctionService  # noqa: E402
+
+
+def _failed_draft(captains, players):
+    """captains: (닉, 주 라인), players: (닉, 주 라인, 부 라인) — 모두 같은 티어, 팀당 2자리"""
+    s = AuctionService()
+    for i, (nick, main_p) in enumerate(captains):
+        s.add_captain(f"{i}팀", f"r{i}", nick, "Gold", main_p, "SUP", "A", team_limit=3)
+    for nick, main_p, sub_p in players:
+        s.add_player("n", nick, "Gold", main_p, sub_p, "A")
+    s.start_auction(1, len(captains), 1000)
+    for p in s.state.players.values():
+        p.status = PlayerStatus.FAILED
+    s.state.phase = "done"
+    return s
+
+
+class PlanLeftoversTest(unittest.TestCase):
+    def test_same_position_leftovers_spread_across_teams(self):
+        # 0팀은 MID 가 비어 있지만 하나만 필요 — 두 MID 가 한 팀에 몰리면 안 됨
+        s = _failed_draft(
+            [("c0", "TOP"), ("c1", "MID")],
+            [("m1", "MID", "ADC"), ("m2", "MID", "ADC"), ("j1", "JG", "ADC"), ("j2", "JG", "ADC")],
+        )
+        plan = s.plan_allocation()
+        self.assertEqual(len(plan.assignments), 4)
+        self.assertFalse(plan.unassigned)
+        per_team = Counter((a.captain, s.state.players[a.player].main_pos) for a in plan.assignments)
+        self.assertEqual(max(per_team.values()), 1, per_team)
+        self.assertEqual(plan.cost, 1.0)   # 1팀이 MID 하나를 받는 비용만
+
+    def test_fewer_leftovers_than_slots(self):
+        s = _failed_draft([("c0", "TOP"), ("c1", "MID")], [("m1", "MID", "ADC")])
+        plan = s.plan_allocation()
+        self.assertEqual([(a.player, a.captain) for a in plan.assignments], [("m1", "c0")])
+
+    def test_more_leftovers_than_slots(self):
+        s = _failed_draft(
+            [("c0", "TOP")],
+            [("m1", "MID", "ADC"), ("j1", "JG", "ADC"), ("a1", "ADC", "SUP")],
+        )
+        plan = s.plan_allocation()
+        self.assertEqual(len(plan.assignments), 2)
+        self.assertEqual(len(plan.unassigned), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
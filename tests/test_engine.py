@@ -0,0 +1,228 @@
+# tests/test_engine.py
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.entities import AuctionState, Captain, Player, Team  # noqa: E402
+from services.engine import (  # noqa: E402
+    Awarded, Bid, BidRejected, DraftEngine, Failed, Pass, ProxyResolved, Rules, SealedRevealed, TurnPrompt,
+)
+
+
+def _draft(teams=2, points=None, rules=None):
+    """팀당 5자리, 경매자 3명 — 첫 매물을 열기 직전까지 진행 (points: 팀장별 초기 포인트)"""
+    st = AuctionState()
+    for i in range(teams):
+        cap = Captain(f"T{i}", "r", f"c{i}", "G", "top", "mid", "a")
+        if points is not None:
+            cap.total_pts = points[i]
+        st.put_captain(cap)
+        st.put_team(Team(f"c{i}", limit=5))
+    for i in range(3):
+        st.put_player(Player("n", f"p{i}", "G", "top", "mid", "a"))
+    d = DraftEngine(st, rules or Rules(100, 10, 2, 5), random.Random(1))
+    d.start(teams, 1000)
+    d.next_lot()
+    return st, d
+
+
+def _fill(st, c_nick):
+    for i in range(st.teams[c_nick].open_slots()):
+        st.add_member(c_nick, f"{c_nick}-m{i}")
+
+
+def _play(lot, decide):
+    """차례마다 decide(팀장) 이벤트를 넣어 정산까지 — (물어본 팀장 순서, 전체 효과)"""
+    prompted, log = [], []
+    effects = lot.next_turn()
+    while True:
+        log.extend(effects)
+        if not isinstance(effects[-1], TurnPrompt):
+            return prompted, log
+        c_nick = effects[-1].captain
+        prompted.append(c_nick)
+        effects = lot.handle(decide(c_nick))
+
+
+class EligibilityTest(unittest.TestCase):
+    def test_full_team_is_never_prompted(self):
+        st, d = _draft(3)
+        full = st.captain_order[0]
+        _fill(st, full)
+        lot = d.open_lot(st.player_order[0])
+        self.assertNotIn(full, lot.eligible)
+        prompted, log = _play(lot, Pass)
+        self.assertNotIn(full, prompted)
+        self.assertEqual(sorted(prompted), sorted(st.captain_order[1:]))
+        self.assertIsInstance(log[-1], Failed)
+
+    def test_unaffordable_captain_dropped_when_bid_rises(self):
+        # 1000P 에 4자리 → 한도 700P, 500P → 한도 200P
+        st, d = _draft(3, points=[1000, 1000, 500])
+        lot = d.open_lot(st.player_order[0])
+        self.assertIn("c2", lot.eligible)
+        prompted, log = _play(lot, lambda c: Bid(c, 300) if c != "c2" and st.current_bid < 300 else Pass(c))
+        self.assertNotIn("c2", lot.eligible)
+        self.assertIsInstance(log[-1], Awarded)
+        self.assertEqual(log[-1].price, 300)
+        bid_at = prompted.index(log[-1].captain)
+        self.assertNotIn("c2", prompted[bid_at + 1:])   # 입찰가가 한도를 넘은 뒤로는 묻지 않음
+
+    def test_settles_as_soon_as_everyone_else_passes(self):
+        st, d = _draft(2)
+        first, second = st.captain_order
+        lot = d.open_lot(st.player_order[0])
+        prompted, log = _play(lot, lambda c: Bid(c, 100) if c == first else Pass(c))
+        self.assertEqual(prompted, [first, second])   # 최고 입찰자에게 다시 돌아가지 않음
+        self.assertEqual(log[-1], Awarded(st.player_order[0], first, 100))
+
+    def test_single_eligible_captain_settles_after_its_bid(self):
+        st, d = _draft(3)
+        for c_nick in st.captain_order[1:]:
+            _fill(st, c_nick)
+        only = st.captain_order[0]
+        lot = d.open_lot(st.player_order[0])
+        prompted, log = _play(lot, lambda c: Bid(c, 100))
+        self.assertEqual(prompted, [only])
+        self.assertEqual(lot.turns, 1)
+        self.assertIsInstance(log[-1], Awarded)
+
+
+class ProxyCapTest(unittest.TestCase):
+    def test_proxy_below_base_bid_still_prompts(self):
+        # 최소 입찰가 미만 상한(복구된 저널 등) → 대리 입찰 없음으로 보고 직접 물어야 함
+        st, d = _draft()
+        first = st.captain_order[0]
+        st.set_proxy(first, "player", st.player_order[0], 50)
+        lot = d.open_lot(st.player_order[0])
+        effects = lot.next_turn()
+        self.assertEqual(effects[-1], TurnPrompt(first))
+
+    def test_proxy_skips_prompt(self):
+        st, d = _draft()
+        first = st.captain_order[0]
+        st.set_proxy(first, "player", st.player_order[0], 300)
+        lot = d.open_lot(st.player_order[0])
+        effects = lot.next_turn()
+        self.assertIsInstance(effects[-1], TurnPrompt)
+        self.assertNotEqual(effects[-1].captain, first)
+
+    def test_proxy_registered_mid_lot_applies_after_refresh(self):
+        # 상한은 매물 시작 때 한 번 계산 → 매물 중 등록은 refresh_proxies() 로 반영
+        st, d = _draft()
+        first, second = st.captain_order[0], st.captain_order[1]
+        lot = d.open_lot(st.player_order[0])
+        self.assertEqual(lot.next_turn()[-1], TurnPrompt(first))
+        st.set_proxy(second, "player", st.player_order[0], 300)
+        lot.refresh_proxies()
+        effects = lot.next_turn()
+        self.assertIn(ProxyResolved(second, 100, 1), effects)
+
+
+class ProxyResolveTest(unittest.TestCase):
+    def test_proxies_compete_in_steps_and_announce_only_outcome(self):
+        st, d = _draft(3)
+        player = st.player_order[0]
+        low, high, human = st.captain_order
+        st.set_proxy(low, "player", player, 300)
+        st.set_proxy(high, "tier", "G", 500)
+        lot = d.open_lot(player)
+        prompted, log = _play(lot, Pass)
+        # 2위 상한 + 1단계, 경합 결과 1건만 — 대리 입찰 팀장은 묻지 않음
+        self.assertEqual([e for e in log if isinstance(e, ProxyResolved)], [ProxyResolved(high, 310, 2)])
+        self.assertEqual(prompted, [human])
+        self.assertEqual(log[-1], Awarded(player, high, 310))
+
+    def test_proxy_answers_human_bid(self):
+        st, d = _draft(2)
+        player = st.player_order[0]
+        human, proxy = st.captain_order
+        st.set_proxy(proxy, "player", player, 500)
+        lot = d.open_lot(player)
+        prompted, log = _play(lot, lambda c: Bid(c, 200) if st.current_bid < 200 else Pass(c))
+        self.assertIn(ProxyResolved(proxy, 210, 2), log)
+        self.assertEqual(log[-1], Awarded(player, proxy, 210))
+
+    def test_human_outbids_proxy_cap(self):
+        st, d = _draft(2)
+        player = st.player_order[0]
+        proxy, human = st.captain_order
+        st.set_proxy(proxy, "player", player, 300)
+        lot = d.open_lot(player)
+        prompted, log = _play(lot, lambda c: Bid(c, 350))
+        self.assertEqual(prompted, [human])
+        self.assertEqual(log[-1], Awarded(player, human, 350))
+
+    def test_player_proxies_are_spent_after_the_lot(self):
+        st, d = _draft(2)
+        player = st.player_order[0]
+        st.set_proxy(st.captain_order[0], "player", player, 300)
+        st.set_proxy(st.captain_order[1], "tier", "G", 200)
+        _play(d.open_lot(player), Pass)
+        self.assertEqual(st.proxy_by_player, {})
+        self.assertEqual(st.proxy_limit(st.captain_order[1], st.players[st.player_order[1]]), 200)
+
+
+class SealedLotTest(unittest.TestCase):
+    def _lot(self, price="first", tie="order", teams=3):
+        st, d = _draft(teams, rules=Rules(100, 10, 2, 5, price, tie))
+        return st, d.open_sealed_lot(st.player_order[0])
+
+    def test_first_price(self):
+        st, lot = self._lot()
+        a, b, c = lot.eligible
+        lot.submit(a, 300)
+        lot.submit(b, 500)
+        lot.submit(c, None)
+        effects = lot.close()
+        self.assertEqual(effects[0], SealedRevealed(((b, 500), (a, 300)), "first"))
+        self.assertEqual(effects[-1], Awarded(lot.player.nickname, b, 500))
+        self.assertEqual(st.captains[b].remain_pts, 500)
+
+    def test_second_price(self):
+        st, lot = self._lot("second")
+        a, b, _ = lot.eligible
+        lot.submit(a, 300)
+        lot.submit(b, 500)
+        self.assertEqual(lot.close()[-1], Awarded(lot.player.nickname, b, 300))
+
+    def test_second_price_single_bid_pays_base(self):
+        st, lot = self._lot("second")
+        lot.submit(lot.eligible[1], 400)
+        self.assertEqual(lot.close()[-1].price, 100)
+
+    def test_tie_break_order(self):
+        st, lot = self._lot()
+        a, b, _ = lot.eligible
+        lot.submit(b, 400)
+        lot.submit(a, 400)
+        self.assertEqual(lot.close()[-1].captain, a)   # 제출 순서가 아니라 팀장 순번
+
+    def test_tie_break_remain(self):
+        st, lot = self._lot(tie="remain")
+        a, b, _ = lot.eligible
+        st.captains[a].used_pts = 100
+        lot.submit(a, 400)
+        lot.submit(b, 400)
+        self.assertEqual(lot.close()[-1].captain, b)   # 잔여 포인트가 많은 팀장
+
+    def test_invalid_bids_rejected_and_no_bids_fail(self):
+        st, lot = self._lot()
+        a, b, _ = lot.eligible
+        self.assertEqual(lot.submit(a, 105), [BidRejected(a, "rule", 100)])
+        self.assertEqual(lot.submit(b, 800), [BidRejected(b, "over", 700)])
+        self.assertIsInstance(lot.close()[-1], Failed)
+
+    def test_one_submission_per_captain(self):
+        st, lot = self._lot()
+        a = lot.eligible[0]
+        lot.submit(a, 200)
+        self.assertEqual(lot.submit(a, 600), [])
+        self.assertEqual(lot.bids, {a: 200})
+
+
+if __name__ == "__main__":
+    unittest.main()
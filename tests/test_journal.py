@@ -0,0 +1,173 @@
+# tests/test_journal.py
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config as CFG  # noqa: E402
+from services.auction_service import AuctionService  # noqa: E402
+from services.journal import SessionJournal, state_to_dict  # noqa: E402
+
+SLOW_SEC = 0.1   # 스냅샷 기록이 느린 경우
+
+
+class SlowSnapshotJournal(SessionJournal):
+    def _write(self, lines, snap):
+        if snap is not None:
+            time.sleep(SLOW_SEC)
+        super()._write(lines, snap)
+
+
+def _seqs(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["seq"] for line in f if line.strip()]
+
+
+class JournalWriteOrderTest(unittest.TestCase):
+    def setUp(self):
+        self._saved = (CFG.JOURNAL_SNAPSHOT_EVERY, CFG.JOURNAL_FLUSH_INTERVAL_SEC)
+        CFG.JOURNAL_SNAPSHOT_EVERY = 3
+        CFG.JOURNAL_FLUSH_INTERVAL_SEC = 60   # 라이터 태스크는 끼어들지 않게
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self._tmp.name, "session")
+
+    def tearDown(self):
+        CFG.JOURNAL_SNAPSHOT_EVERY, CFG.JOURNAL_FLUSH_INTERVAL_SEC = self._saved
+        self._tmp.cleanup()
+
+    def test_snapshot_does_not_truncate_later_batch(self):
+        journal = SlowSnapshotJournal(self.directory, lambda: {})
+
+        async def main():
+            for _ in range(3):
+                journal.record("turn", captain_idx=0)
+            first = asyncio.create_task(journal.flush())    # 스냅샷 배치 — 기록 중
+            await asyncio.sleep(SLOW_SEC / 4)
+            journal.record("turn", captain_idx=1)
+            await asyncio.gather(first, journal.flush())
+            await journal.close()
+
+        asyncio.run(main())
+        self.assertEqual(_seqs(journal.journal_path), [4])
+
+    def test_close_flushes_pending_then_discard_removes(self):
+        journal = SessionJournal(self.directory, lambda: {})
+
+        async def main():
+            journal.record("turn", captain_idx=0)
+            await journal.close()
+            self.assertEqual(_seqs(journal.journal_path), [1])
+            journal.record("turn", captain_idx=1)
+            await journal.close(discard=True)
+
+        asyncio.run(main())
+        self.assertFalse(os.path.exists(self.directory))
+
+
+class FakeMessage:
+    def __init__(self, service):
+        self.service = service
+
+    async def edit(self, **kwargs):
+        _answer_soon(self.service)
+
+
+class FakeCtx:
+    """차례가 열리면 최소 인상가로 200P 까지 입찰, 그 뒤로는 패스"""
+    def __init__(self, service):
+        self.service = service
+        self.guild = None
+        self.channel = type("Channel", (), {"id": 1})()
+        self.author = type("Author", (), {"id": 1, "name": "host", "display_name": "host"})()
+
+    async def send(self, content=None, **kwargs):
+        _answer_soon(self.service)
+        return FakeMessage(self.service)
+
+
+def _answer_soon(service):
+    def answer():
+        turn = service.turn
+        if turn is None or turn.captain is None or turn.future.done():
+            return
+        if service.state.current_bid < 200:
+            turn.future.set_result(("bid", service.lot.engine.min_next_bid()))
+        else:
+            turn.future.set_result(("pass", None))
+    asyncio.get_running_loop().call_soon(answer)
+
+
+class JournalReplayTest(unittest.TestCase):
+    maxDiff = None
+    PATCH = {
+        "PREVIEW_DELAY_SEC": 0, "STRATEGY_TIME_MINUTES": 0, "POST_PLAYER_GAP_SEC": 0,
+        "TURN_BID_TIMEOUT_SEC": 1, "OUTBOX_RATE_CAPACITY": 10 ** 6, "LEFTOVER_AUTO_PREVIEW": False,
+        "JOURNAL_FLUSH_INTERVAL_SEC": 0.01,
+    }
+
+    def setUp(self):
+        self._saved = {k: getattr(CFG, k, None) for k in (*self.PATCH, "JOURNAL_SNAPSHOT_EVERY")}
+        for k, v in self.PATCH.items():
+            setattr(CFG, k, v)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self._tmp.name, "session")
+
+    def tearDown(self):
+        for k, v in self._saved.items():
+            setattr(CFG, k, v)
+        self._tmp.cleanup()
+
+    def _service(self):
+        service = AuctionService()
+        service.state.channel_id = 1   # 레지스트리가 세션 키로 채워 주는 값
+        restored = service.attach_journal(SessionJournal(self.directory, lambda: state_to_dict(service.state)))
+        return service, restored
+
+    def _run_draft(self):
+        service, restored = self._service()
+        self.assertFalse(restored)
+        for i in range(3):
+            service.add_captain(f"T{i}", f"r{i}", f"c{i}", "Gold", "TOP", "MID", "A", team_limit=3)
+        for i in range(6):
+            service.add_player(f"n{i}", f"p{i}", "Gold", "MID", "TOP", "A")
+        service.bind_captain_user(100, "c0")
+        service.set_proxy("c1", "tier", "Gold", 150)
+        service.start_auction(1, 3, 1000, seed=7)
+        asyncio.run(service.run_loop(FakeCtx(service)))   # 종료 시 저널 flush
+        return service
+
+    def _assert_replays(self, service):
+        replayed, restored = self._service()
+        self.assertTrue(restored)
+        self.assertEqual(state_to_dict(replayed.state), state_to_dict(service.state))
+
+    def test_replay_journal_only(self):
+        CFG.JOURNAL_SNAPSHOT_EVERY = 10 ** 6
+        service = self._run_draft()
+        self.assertEqual(service.state.phase, "done")
+        self.assertFalse(os.path.exists(service.journal.snapshot_path))
+        self._assert_replays(service)
+
+    def test_replay_snapshot_plus_tail(self):
+        CFG.JOURNAL_SNAPSHOT_EVERY = 7
+        service = self._run_draft()
+        self.assertTrue(os.path.exists(service.journal.snapshot_path))
+        self._assert_replays(service)
+
+    def test_torn_last_line_is_ignored(self):
+        CFG.JOURNAL_SNAPSHOT_EVERY = 10 ** 6
+        service = self._run_draft()
+        with open(service.journal.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"seq": 99999, "kind": "aw')   # 기록 중 크래시
+        self._assert_replays(service)
+
+
+if __name__ == "__main__":
+    unittest.main()
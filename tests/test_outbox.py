@@ -0,0 +1,149 @@
+# tests/test_outbox.py
+import asyncio
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config as CFG  # noqa: E402
+from services.outbox import ChannelOutbox, RateBucket  # noqa: E402
+
+SLOW_SEC = 0.1   # 안내 전송/수정이 느린 경우 (요청이 끝난 순서 = 채널에 보이는 순서)
+
+
+class FakeMessage:
+    def __init__(self, log, content):
+        self.log = log
+        self.content = content
+
+    async def edit(self, content=None, **kwargs):
+        await asyncio.sleep(SLOW_SEC)
+        self.log.append(("edit", content))
+        self.content = content
+
+
+class OutboxOrderTest(unittest.TestCase):
+    def setUp(self):
+        self._saved = (CFG.OUTBOX_RATE_CAPACITY, CFG.OUTBOX_APPEND_BY_EDIT)
+        CFG.OUTBOX_RATE_CAPACITY = 10 ** 6
+
+    def tearDown(self):
+        CFG.OUTBOX_RATE_CAPACITY, CFG.OUTBOX_APPEND_BY_EDIT = self._saved
+
+    def _run_order(self, append_by_edit: bool):
+        CFG.OUTBOX_APPEND_BY_EDIT = append_by_edit
+        log = []
+
+        async def send(content=None, view=None, **kwargs):
+            # 안내는 느리고, 뷰가 붙은 차례 메시지는 바로 끝남
+            await asyncio.sleep(0 if view is not None else SLOW_SEC)
+            log.append(("send", content))
+            return FakeMessage(log, content)
+
+        async def main():
+            outbox = ChannelOutbox(send)
+            outbox.post("1번 매물 입찰")
+            await asyncio.sleep(SLOW_SEC / 2)
+            outbox.post("낙찰!")
+            await asyncio.sleep(SLOW_SEC * 0.7)   # 워커가 '낙찰!' 을 큐에서 꺼내 전송(수정) 중 — 큐는 비어 있음
+            await outbox.send("다음 차례", view=object())
+            outbox.close()
+
+        asyncio.run(main())
+        return log
+
+    def test_send_waits_for_in_flight_announcement(self):
+        log = self._run_order(append_by_edit=False)
+        self.assertEqual([c for _, c in log], ["1번 매물 입찰", "낙찰!", "다음 차례"])
+
+    def test_send_waits_for_in_flight_edit(self):
+        log = self._run_order(append_by_edit=True)
+        self.assertEqual(log, [("send", "1번 매물 입찰"), ("edit", "1번 매물 입찰\n낙찰!"), ("send", "다음 차례")])
+
+
+class OutboxCoalesceTest(unittest.TestCase):
+    def setUp(self):
+        self._saved = (CFG.OUTBOX_RATE_CAPACITY, CFG.OUTBOX_APPEND_BY_EDIT, CFG.OUTBOX_APPEND_WINDOW_SEC)
+        CFG.OUTBOX_RATE_CAPACITY = 10 ** 6
+
+    def tearDown(self):
+        CFG.OUTBOX_RATE_CAPACITY, CFG.OUTBOX_APPEND_BY_EDIT, CFG.OUTBOX_APPEND_WINDOW_SEC = self._saved
+
+    def _run(self, scenario, **outbox_kwargs):
+        log = []
+
+        async def send(content=None, **kwargs):
+            log.append(("send", content))
+            return FakeMessage(log, content)
+
+        async def main():
+            outbox = ChannelOutbox(send, **outbox_kwargs)
+            await scenario(outbox)
+            await outbox.flush()
+            outbox.close()
+            return outbox
+
+        outbox = asyncio.run(main())
+        return log, outbox
+
+    def test_burst_is_merged_into_one_message(self):
+        CFG.OUTBOX_APPEND_BY_EDIT = False
+
+        async def scenario(outbox):
+            for i in range(5):
+                outbox.post(f"자동 패스 {i}")
+
+        log, outbox = self._run(scenario)
+        self.assertEqual(log, [("send", "\n".join(f"자동 패스 {i}" for i in range(5)))])
+        self.assertEqual((outbox.stats.posted, outbox.stats.api_calls, outbox.stats.merged), (5, 1, 4))
+
+    def test_merged_message_respects_max_len(self):
+        CFG.OUTBOX_APPEND_BY_EDIT = False
+
+        async def scenario(outbox):
+            for i in range(6):
+                outbox.post(f"안내-{i:02d}")   # 5자
+
+        log, _ = self._run(scenario, max_len=12)
+        self.assertEqual([c for _, c in log], ["안내-00\n안내-01", "안내-02\n안내-03", "안내-04\n안내-05"])
+
+    def test_later_announcement_is_appended_by_edit(self):
+        CFG.OUTBOX_APPEND_BY_EDIT = True
+        CFG.OUTBOX_APPEND_WINDOW_SEC = 60
+
+        async def scenario(outbox):
+            outbox.post("입찰!")
+            await outbox.flush()
+            outbox.post("낙찰!")
+
+        log, outbox = self._run(scenario)
+        self.assertEqual(log, [("send", "입찰!"), ("edit", "입찰!\n낙찰!")])
+        self.assertEqual(outbox.stats.merged, 1)
+
+    def test_no_append_after_direct_send(self):
+        CFG.OUTBOX_APPEND_BY_EDIT = True
+        CFG.OUTBOX_APPEND_WINDOW_SEC = 60
+
+        async def scenario(outbox):
+            outbox.post("입찰!")
+            await outbox.send("차례 안내", view=object())   # 다른 메시지가 끼면 이어 붙이지 않음
+            outbox.post("패스.")
+
+        log, _ = self._run(scenario)
+        self.assertEqual(log, [("send", "입찰!"), ("send", "차례 안내"), ("send", "패스.")])
+
+    def test_rate_bucket_waits_when_full(self):
+        async def main():
+            bucket = RateBucket(2, 0.1)
+            started = time.monotonic()
+            for _ in range(3):
+                await bucket.acquire()
+            return time.monotonic() - started
+
+        self.assertGreaterEqual(asyncio.run(main()), 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+# tests/test_session_registry.py
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config as CFG  # noqa: E402
+from services.session_registry import SessionRegistry  # noqa: E402
+
+
+class EvictIdleTest(unittest.TestCase):
+    def setUp(self):
+        self._saved = (CFG.JOURNAL_DIR, CFG.JOURNAL_ENABLED)
+        self._tmp = tempfile.TemporaryDirectory()
+        CFG.JOURNAL_DIR, CFG.JOURNAL_ENABLED = self._tmp.name, True
+
+    def tearDown(self):
+        CFG.JOURNAL_DIR, CFG.JOURNAL_ENABLED = self._saved
+        self._tmp.cleanup()
+
+    def test_evicted_session_journal_is_closed_and_removed(self):
+        registry = SessionRegistry(max_sessions=1)
+
+        async def main():
+            idle = registry.get_or_create((1, 10))
+            idle.journal.record("mode", mode="sealed")   # 라이터 태스크가 도는 빈 세션
+            await idle.journal.flush()
+            self.assertTrue(os.path.isdir(idle.journal.directory))
+            registry.get_or_create((1, 20))              # 상한 → 빈 세션 정리
+            self.assertEqual(len(registry._closing), 1)
+            await registry.wait_closed()
+            self.assertFalse(registry._closing)
+            return idle
+
+        idle = asyncio.run(main())
+        self.assertIsNone(registry.get((1, 10)))
+        self.assertFalse(os.path.exists(idle.journal.directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
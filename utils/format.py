@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Callable, Hashable, Optional, List
 
 def norm_optional(s: Optional[str]) -> Optional[str]:
     if s is None:
@@ -16,7 +16,31 @@ def split_semicolon(payload: str, expected_min: int, expected_max: int) -> List[
         parts += [""] * (expected_max - len(parts))
     return parts[:expected_max]
 
+_NO_CACHE = object()
+
+def render_cached(entity, key: Hashable, build: Callable[..., str], *args) -> str:
+    """
+    엔티티별 표시 문자열 캐시: (키 → (버전, 문자열))
+    표시 필드가 바뀌면 엔티티의 _version 이 올라가므로 다음 호출 때 다시 만듦
+    캐시를 지원하지 않는 객체는 매번 생성
+    """
+    cache = getattr(entity, "_render_cache", _NO_CACHE)
+    if cache is _NO_CACHE:
+        return build(*args)
+    if cache is None:
+        cache = entity._render_cache = {}   # 처음 표시될 때 만듦 (표시되지 않는 엔티티는 비용 없음)
+    version = entity._version
+    hit = cache.get(key)
+    if hit is not None and hit[0] == version:
+        return hit[1]
+    text = build(*args)
+    cache[key] = (version, text)
+    return text
+
 def fmt_player_line(p) -> str:
+    return render_cached(p, "line", _build_player_line, p)
+
+def _build_player_line(p) -> str:
     mosts = [p.most1, p.most2, p.most3]
     mosts = [m for m in mosts if m]
     most_str = ", ".join(mosts) if mosts else "-"